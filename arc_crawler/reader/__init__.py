@@ -1,2 +1,4 @@
 from .index import IndexReader, IndexSetterFunc, IndexLoaderFunc
+from .sharded import ShardedIndexReader
+from .done import DoneSet
 from .types import FilterFunc, IndexSetterFunc, IndexLoaderFunc, JsonSerializable, MkdirMode
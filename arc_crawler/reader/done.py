@@ -0,0 +1,117 @@
+from array import array
+from bisect import bisect_left
+from heapq import merge
+from typing import Iterable, Set, Tuple
+import hashlib as hl
+
+from pathlib import Path
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+from arc_crawler.utils import canonicalize_url, convert_size
+
+
+class DoneSet:
+    """A compact persistent set of fetched URLs, stored next to the dataset as a `.done` file.
+
+    Each written record adds a fixed-size entry of two 64-bit hashes: one of the requested URL and one of the
+    final URL after redirects, both canonicalized, so different spellings of a URL are recognized as done.
+    On load, hashes are kept in a sorted array taking 16 bytes per record, instead of a set of URL strings.
+
+    Examples:
+            >>> from arc_crawler.reader import DoneSet
+            >>> done = DoneSet("./output/job.done")
+            >>> done.add("https://example.com/a%7e", "https://example.com/a~/")
+            >>> "HTTPS://example.com/a~" in done
+            True
+    """
+
+    entry_size = 16
+    # Keys sorted at once by `sort_keys()`, bounding the temporary list of Python ints
+    sort_chunk_size = 1 << 16
+    # Keys added during a run are merged into the sorted array once they exceed this share of it
+    merge_ratio = 1 / 16
+
+    @staticmethod
+    def get_key(url: str) -> int:
+        digest = hl.blake2b(canonicalize_url(url).encode("utf-8"), digest_size=8).digest()
+        return int.from_bytes(digest, "little")
+
+    @classmethod
+    def sort_keys(cls, keys: array) -> array:
+        """Returns sorted unique keys of an `array("Q")`, without building a list or a set of all of them.
+
+        Chunks are sorted one by one and then merged, so the temporary memory is about the size of the array.
+        """
+        runs = [
+            array("Q", sorted(keys[start : start + cls.sort_chunk_size]))
+            for start in range(0, len(keys), cls.sort_chunk_size)
+        ]
+        return cls._merge_unique(*runs)
+
+    @staticmethod
+    def _merge_unique(*runs: Iterable[int]) -> array:
+        merged = array("Q")
+        previous = None
+        for key in merge(*runs):
+            if key != previous:
+                merged.append(key)
+                previous = key
+        return merged
+
+    def __init__(self, file_path: str | Path):
+        """Loads the set from `file_path`, if the file exists.
+
+        Args:
+                file_path (str | Path): Path to the `.done` file.
+        """
+        self.path = Path(file_path)
+
+        keys = array("Q")
+        if self.path.exists():
+            # A trailing entry cut by an interrupted run is ignored
+            entries_count = self.path.stat().st_size // self.entry_size
+            with open(self.path, "rb") as file:
+                keys.fromfile(file, entries_count * 2)
+        self._count = len(keys) // 2
+        self._keys = self.sort_keys(keys)
+        # Keys added during this run, until they are merged into `_keys`
+        self._added: Set[int] = set()
+
+    @classmethod
+    def rebuild(cls, file_path: str | Path, urls: Iterable[Tuple[str, str]]) -> "DoneSet":
+        """Overwrites the `.done` file with entries of (requested URL, final URL) pairs. Used for older datasets."""
+        keys = array("Q")
+        for request_url, url in urls:
+            keys.extend((cls.get_key(request_url), cls.get_key(url)))
+        Path(file_path).write_bytes(keys.tobytes())
+
+        done = cls(file_path)
+        logger.debug(f"Rebuilt {done.path.name} with {len(done)} entries ({convert_size(done.path.stat().st_size)})")
+        return done
+
+    def add(self, request_url: str, url: str | None = None):
+        keys = array("Q", (self.get_key(request_url), self.get_key(url or request_url)))
+        with open(self.path, "ab") as file:
+            file.write(keys.tobytes())
+        self._added.update(keys)
+        self._count += 1
+        # Merging costs a pass over the array, so it's done once the added keys grow proportionally to it
+        if len(self._added) >= max(self.sort_chunk_size, len(self._keys) * self.merge_ratio):
+            self._keys = self._merge_unique(self._keys, sorted(self._added))
+            self._added.clear()
+
+    def has_key(self, key: int) -> bool:
+        if key in self._added:
+            return True
+        position = bisect_left(self._keys, key)
+        return position < len(self._keys) and self._keys[position] == key
+
+    def __contains__(self, url: str) -> bool:
+        return self.has_key(self.get_key(url))
+
+    def __len__(self):
+        """The number of entries, i.e., records written."""
+        return self._count
@@ -1,14 +1,12 @@
-from os import linesep
 from typing import Any, Dict, List
 
-import json
 from pathlib import Path
 
 import logging
 
 logger = logging.getLogger(__name__)
 
-from arc_crawler.utils import write_line, open_lines, input_prompt, convert_size
+from arc_crawler.utils import write_line, open_lines, input_prompt, convert_size, json_loads
 
 from .types import FilterFunc, IndexSetterFunc, IndexLoaderFunc, JsonSerializable, MkdirMode
 
@@ -74,7 +72,7 @@ class IndexReader:
         self,
         file_path: str | Path,
         index_record_setter: IndexSetterFunc = lambda record: {},
-        source_record_loader: IndexLoaderFunc = lambda line: json.loads(line.strip()),
+        source_record_loader: IndexLoaderFunc | None = None,
         mkdir_mode: MkdirMode | None = "interactive",
     ):
         """Initializes an `IndexReader` instance.
@@ -88,7 +86,8 @@ class IndexReader:
                         `start_byte` is stored.
 
                 source_record_loader (IndexLoaderFunc, optional): A function that loads
-                        strings from the main data file. Defaults to `json.loads`.
+                        strings from the main data file. Defaults to the configured JSON codec
+                        (see `utils.set_codec`), which reads raw bytes without decoding them first.
 
                 mkdir_mode ("interactive" | "forced" | "disabled", optional): The strategy
                         to apply if `file_path` points to a non-existent directory or file.
@@ -176,13 +175,14 @@ class IndexReader:
                 logger.debug(f"Found lines that are yet to be indexed. Appending .index file...")
 
             while line:
-                self.__append_index(json.loads(line.decode(encoding="utf-8")))
+                # Offsets are based on raw line sizes, so records written by any codec are indexed correctly
+                self.__append_index(json_loads(line), len(line))
                 line = source_file.readline()
             else:
                 logger.debug(".index file is already up-to-date with source file")
             logger.debug("Integrity check completed successfully!")
 
-    def __append_index(self, obj: Dict[str, Any]):
+    def __append_index(self, obj: Dict[str, Any], line_size: int):
         new_index_record = self._index_record_setter(obj) or {}
         if not isinstance(new_index_record, dict):
             logger.error(f"Incorrect index_record_setter provided.")
@@ -193,8 +193,7 @@ class IndexReader:
         self._index_data.append(new_index_record)
         write_line(self._index_file_path, new_index_record)
 
-        payload_str = json.dumps(obj, ensure_ascii=False) + linesep
-        self._next_start_byte += len(payload_str.encode("utf-8"))
+        self._next_start_byte += line_size
 
     def __read_from_byte(self, byte_index):
         logger.debug(f"Reading binary:")
@@ -202,6 +201,8 @@ class IndexReader:
             temp_binary.seek(byte_index)
             t_line = temp_binary.readline()
             logger.debug(f"{t_line}")
+            if self._source_record_getter is None:
+                return json_loads(t_line)
             return self._source_record_getter(t_line.decode())
 
     def get(self, filtering: int | FilterFunc) -> Dict[str, Any] | List[Dict[str, Any]]:
@@ -299,8 +300,8 @@ class IndexReader:
                 >>> reader = IndexReader("./output/filename", mkdir_mode="forced")
                 >>> reader.write({"foo": "bar", "bar": "baz"})
         """
-        write_line(self._file_path, obj)
-        self.__append_index(obj)
+        line_size = write_line(self._file_path, obj)
+        self.__append_index(obj, line_size)
 
     @property
     def path(self) -> Path:
@@ -0,0 +1,149 @@
+from typing import Any, Dict, List, Sequence, Tuple
+from pathlib import Path
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+from arc_crawler.utils import convert_size
+
+from .index import IndexReader
+from .types import FilterFunc, IndexSetterFunc, IndexLoaderFunc
+
+
+class ShardedIndexReader:
+    """Provides read access to a dataset split into several JSONL shards as if it was a single file.
+
+    Shards are regular `IndexReader`-compatible files (e.g., written by `Crawler(workers=N)`), so each of them
+    can also be opened on its own. Records are ordered shard by shard. Read-only: data is written to shards directly.
+
+    Examples:
+            >>> from arc_crawler.reader import ShardedIndexReader
+            >>> reader = ShardedIndexReader(["./output/job_shard_0_of_2", "./output/job_shard_1_of_2"])
+            >>> len(reader)
+            1000
+            >>> reader.get(lambda rec: rec.get("url") == "https://example.com")
+            {'url': 'https://example.com', 'status': 200, ...}
+    """
+
+    def __init__(
+        self,
+        file_paths: Sequence[str | Path] | None = None,
+        index_record_setter: IndexSetterFunc = lambda record: {},
+        source_record_loader: IndexLoaderFunc | None = None,
+        readers: Sequence[IndexReader] | None = None,
+    ):
+        """Initializes a `ShardedIndexReader` instance.
+
+        Args:
+                file_paths (Sequence[str | Path], optional): Paths to existing shard files. The file extension
+                        can be omitted for `.jsonl` files.
+
+                index_record_setter (IndexSetterFunc, optional): A function to populate `.index` files of shards
+                        that are not fully indexed yet. See `IndexReader` for details.
+
+                source_record_loader (IndexLoaderFunc, optional): A function that loads strings from shard files.
+
+                readers (Sequence[IndexReader], optional): Already opened shard readers. Used instead of `file_paths`.
+
+        Raises:
+                FileNotFoundError: If any of the shard files doesn't exist.
+        """
+        if readers is None:
+            readers = [
+                IndexReader(
+                    path,
+                    index_record_setter=index_record_setter,
+                    source_record_loader=source_record_loader,
+                    mkdir_mode="disabled",
+                )
+                for path in file_paths or []
+            ]
+        self._readers: List[IndexReader] = list(readers)
+
+    @property
+    def shards(self) -> List[IndexReader]:
+        """Readers of individual shards."""
+        return self._readers
+
+    @property
+    def paths(self) -> List[Path]:
+        """Paths to the main data files (.jsonl) of all the shards."""
+        return [reader.path for reader in self._readers]
+
+    @property
+    def index_data(self) -> List[Dict[str, Any]]:
+        """Metadata entries of all the shards, in the same order as records."""
+        return [record for reader in self._readers for record in reader.index_data]
+
+    def _locate(self, index: int) -> Tuple[IndexReader, int]:
+        if index < 0:
+            index += len(self)
+        for reader in self._readers:
+            if 0 <= index < len(reader):
+                return reader, index
+            index -= len(reader)
+
+        logger.error(f"Index '{index}' is out of range")
+        raise IndexError(f"Provide index in range [0, {len(self) - 1}]")
+
+    def get(self, filtering: int | FilterFunc) -> Dict[str, Any] | List[Dict[str, Any]]:
+        """Acquires original record(s) based on criteria matching the metadata.
+
+        Behaves the same way as `IndexReader.get()`, looking through all the shards.
+
+        Raises:
+                IndexError: If an integer index is provided and is out of range.
+                ValueError: If no records match the provided filtering criteria.
+                TypeError: If the 'filtering' argument type is not supported.
+        """
+        if isinstance(filtering, int):
+            reader, index = self._locate(filtering)
+            return reader.get(index)
+        elif callable(filtering):
+            results = []
+            for reader in self._readers:
+                for index, record in enumerate(reader.index_data):
+                    if filtering(record):
+                        results.append(reader.get(index))
+
+            if len(results) == 1:
+                return results[0]
+            elif len(results) > 1:
+                return results
+            else:
+                logger.error("No records matching filtering function provided")
+                raise ValueError(
+                    "When using filtering function make sure to specify condition matching at least one record"
+                )
+        else:
+            logger.error("Argument type is not supported")
+            raise TypeError(
+                "Either provide int to get record by index or filtering function to get all matching records"
+            )
+
+    def __len__(self):
+        return sum(len(reader) for reader in self._readers)
+
+    def __iter__(self):
+        for reader in self._readers:
+            yield from reader
+
+    def __getitem__(self, item: int | slice):
+        if isinstance(item, int):
+            return self.get(item)
+        elif isinstance(item, slice):
+            return [self.get(i) for i in range(*item.indices(len(self)))]
+        else:
+            logger.error("Incorrect item type provided")
+            raise TypeError(
+                "ShardedIndexReader items can only be accessed with integers or slices. "
+                'Use "get()" method if you need to provide a more complex search condition'
+            )
+
+    def __str__(self):
+        source_size = sum(reader.path.stat().st_size for reader in self._readers)
+        return (
+            f"Source files consist of {len(self)} records occupying around {convert_size(source_size)}\n"
+            f"Shards: {len(self._readers)}, location: {self._readers[0].path.parent if self._readers else '-'}"
+        )
@@ -1,5 +1,5 @@
-from .fetcher import Fetcher, ParallelFetcher, SequentialFetcher
-from .crawler import Crawler, html_body_processor
+from .fetcher import Fetcher, ParallelFetcher, SequentialFetcher, OrderedFetcher
+from .crawler import Crawler, html_body_processor, html_link_extractor
 from .types import (
     TerminationFuncKwargs,
     ResponseHandlerKwargs,
@@ -7,5 +7,30 @@ from .types import (
     ResponseProcessor,
     BasicResponse,
     OnRequestCallback,
+    HostLimits,
+    ResponseFilter,
+    ResponseFilterKwargs,
+    FetcherOptions,
+    PoolStats,
+    RequestOptions,
+    CachedResponse,
+    CacheStats,
+    UrlSource,
+    LinkExtractor,
+    CrawlScope,
+    HedgingStats,
+    ProxyStats,
+    TransportResponse,
+    FollowUpStats,
 )
 from .decorators import session_decorator
+from .limiter import RateLimiter, AdaptiveRateLimiter
+from .retry import RetryPolicy
+from .pool import ConnectionPool
+from .cache import ResponseCache
+from .frontier import Frontier
+from .breaker import CircuitBreaker
+from .hedging import HedgingPolicy
+from .proxy import ProxyPool
+from .transport import Transport, AiohttpTransport, HttpxTransport
+from .follow_up import FollowUpCache, FollowUpSession, FollowUpResponse
@@ -0,0 +1,203 @@
+import asyncio
+from collections import deque
+from time import monotonic
+from typing import Deque, Dict, Iterable, Literal, Tuple
+
+import aiohttp
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+from .limiter import RateLimiter
+
+CircuitState = Literal["closed", "open", "half_open", "given_up"]
+
+
+class _HostCircuit:
+    def __init__(self, window_size: int, cooldown: float):
+        self.state: CircuitState = "closed"
+        self.consecutive_failures = 0
+        # Outcomes of the latest requests: `True` for failures
+        self.outcomes: Deque[bool] = deque(maxlen=window_size)
+        self.cooldown = cooldown
+        self.opened_at = 0.0
+        # When the circuit first opened since the host last worked, checked against `max_open_time`
+        self.first_opened_at: float | None = None
+        self.probes = 0
+        self.deferred = 0
+
+
+class CircuitBreaker:
+    """Parks hosts that keep failing, so their requests don't hold concurrency slots needed by healthy hosts.
+
+    Each host has its own circuit. It opens after `failure_threshold` consecutive failures, or once the share
+    of failures among the latest `window_size` requests reaches `error_rate_threshold`. While it's open,
+    requests to the host are not sent: fetchers defer the URLs and send them later, after the `cooldown`.
+    Then the circuit becomes half-open and lets `half_open_probes` requests through. A successful probe closes
+    the circuit, while a failed one opens it again for twice as long (up to `max_cooldown`).
+
+    Deferred URLs keep their attempt number, so they are not counted against `RetryPolicy.max_attempts`.
+    A failed probe is handled as usual (retried according to the retry policy or checked against
+    termination criteria).
+
+    A host that hasn't recovered `max_open_time` seconds after its circuit first opened is given up on:
+    its requests are sent without deferring, so their failures go through the retry policy and termination
+    criteria like they would without a breaker, instead of draining one URL per cooldown.
+
+    Example:
+            >>> from arc_crawler import Crawler, CircuitBreaker
+            >>> crawler = Crawler(circuit_breaker=CircuitBreaker(failure_threshold=5, cooldown=30))
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        error_rate_threshold: float | None = None,
+        window_size: int = 20,
+        cooldown: float = 30,
+        max_cooldown: float = 300,
+        max_open_time: float | None = 600,
+        half_open_probes: int = 1,
+        failure_statuses: Iterable[int | range] = (429, range(500, 600)),
+        failure_exceptions: Tuple[type[BaseException], ...] = (aiohttp.ClientError, asyncio.TimeoutError),
+    ):
+        """Initializes a `CircuitBreaker` instance.
+
+        Args:
+            failure_threshold (int, optional): The number of consecutive failures opening the circuit. Defaults to 5.
+
+            error_rate_threshold (float, optional): The share of failures (0 to 1) among the latest `window_size`
+                requests opening the circuit. Only checked once the window is full. Defaults to `None` (disabled).
+
+            window_size (int, optional): The number of the latest requests considered by `error_rate_threshold`.
+
+            cooldown (float, optional): Seconds the circuit stays open before probing the host. Defaults to 30.
+
+            max_cooldown (float, optional): The upper bound of the cooldown doubled by failed probes.
+
+            max_open_time (float, optional): Seconds after which a host that keeps failing probes is given up on,
+                and its requests are no longer deferred. Defaults to 600. `None` defers them until it recovers.
+
+            half_open_probes (int, optional): The number of requests let through at a time while probing.
+
+            failure_statuses (Iterable[int | range], optional): Response status codes counted as failures.
+
+            failure_exceptions (tuple[type[BaseException]], optional): Exception types counted as failures
+                (connection errors and timeouts by default).
+        """
+        self.failure_threshold = failure_threshold
+        self.error_rate_threshold = error_rate_threshold
+        self.window_size = window_size
+        self.cooldown = cooldown
+        self.max_cooldown = max_cooldown
+        self.max_open_time = max_open_time
+        self.half_open_probes = half_open_probes
+        self.failure_statuses = list(failure_statuses)
+        self.failure_exceptions = failure_exceptions
+
+        self._circuits: Dict[str, _HostCircuit] = {}
+
+    def _get_circuit(self, host: str) -> _HostCircuit:
+        circuit = self._circuits.get(host)
+        if circuit is None:
+            circuit = self._circuits[host] = _HostCircuit(self.window_size, self.cooldown)
+        return circuit
+
+    def get_state(self, url: str) -> CircuitState:
+        """Returns the circuit state of the URL's host."""
+        circuit = self._circuits.get(RateLimiter.get_host(url))
+        return circuit.state if circuit is not None else "closed"
+
+    def before_request(self, url: str) -> float | None:
+        """Checks whether a request to the URL can be sent now.
+
+        Returns:
+            float | None: `None` if the request can be sent, otherwise seconds to wait before trying again.
+        """
+        host = RateLimiter.get_host(url)
+        circuit = self._circuits.get(host)
+        if circuit is None or circuit.state in ("closed", "given_up"):
+            return None
+
+        if self.max_open_time is not None and monotonic() - circuit.first_opened_at >= self.max_open_time:
+            logger.error(
+                f'"{host}" has not recovered for {self.max_open_time:.0f}s. Sending its requests without deferring...'
+            )
+            circuit.state = "given_up"
+            return None
+
+        if circuit.state == "open":
+            remaining = circuit.opened_at + circuit.cooldown - monotonic()
+            if remaining > 0:
+                circuit.deferred += 1
+                return remaining
+            logger.info(f'Probing "{host}" after {circuit.cooldown:.0f}s cooldown...')
+            circuit.state = "half_open"
+            circuit.probes = 0
+
+        if circuit.probes < self.half_open_probes:
+            circuit.probes += 1
+            return None
+        # Other requests wait for probes to finish
+        circuit.deferred += 1
+        return min(circuit.cooldown, 1.0)
+
+    def record(self, url: str, status: int | None = None, exception: BaseException | None = None):
+        """Registers the outcome of a request sent after `before_request()` allowed it."""
+        host = RateLimiter.get_host(url)
+        if exception is not None:
+            if not isinstance(exception, self.failure_exceptions):
+                # Neither success nor failure (e.g., cancelled), but the probe slot is released
+                self._release_probe(host)
+                return
+            is_failure = True
+        else:
+            is_failure = any(
+                status in code if isinstance(code, range) else status == code for code in self.failure_statuses
+            )
+
+        circuit = self._get_circuit(host)
+        if circuit.state == "open":
+            # Requests sent before the circuit opened
+            return
+        if circuit.state == "given_up":
+            # Failures are handled by fetchers as usual, until the host works again
+            if not is_failure:
+                logger.info(f'"{host}" has recovered after being given up on')
+                self._circuits[host] = _HostCircuit(self.window_size, self.cooldown)
+            return
+        if circuit.state == "half_open":
+            if is_failure:
+                self._open(host, circuit, cooldown=min(circuit.cooldown * 2, self.max_cooldown))
+            else:
+                logger.info(f'"{host}" has recovered after {circuit.deferred} requests were deferred')
+                self._circuits[host] = _HostCircuit(self.window_size, self.cooldown)
+            return
+
+        circuit.outcomes.append(is_failure)
+        circuit.consecutive_failures = circuit.consecutive_failures + 1 if is_failure else 0
+        if circuit.consecutive_failures >= self.failure_threshold:
+            self._open(host, circuit, cooldown=self.cooldown)
+        elif (
+            self.error_rate_threshold is not None
+            and len(circuit.outcomes) == self.window_size
+            and sum(circuit.outcomes) / self.window_size >= self.error_rate_threshold
+        ):
+            self._open(host, circuit, cooldown=self.cooldown)
+
+    def _release_probe(self, host: str):
+        circuit = self._circuits.get(host)
+        if circuit is not None and circuit.state == "half_open":
+            circuit.probes = max(0, circuit.probes - 1)
+
+    @staticmethod
+    def _open(host: str, circuit: _HostCircuit, cooldown: float):
+        logger.warning(f'Too many failed requests to "{host}". Deferring its requests for {cooldown:.0f}s')
+        circuit.state = "open"
+        circuit.opened_at = monotonic()
+        if circuit.first_opened_at is None:
+            circuit.first_opened_at = circuit.opened_at
+        circuit.cooldown = cooldown
+        circuit.consecutive_failures = 0
+        circuit.outcomes.clear()
@@ -0,0 +1,208 @@
+import asyncio
+import hashlib as hl
+import os
+import tempfile
+import threading
+import zlib
+from pathlib import Path
+from time import time
+from typing import Iterable, Mapping
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+from arc_crawler.utils import convert_size, json_dumps, json_loads
+
+from .types import CachedResponse, CacheStats
+
+CACHE_FILE_SUFFIX = ".blob"
+
+
+class ResponseCache:
+    """On-disk HTTP response cache used by fetchers to replay responses instead of requesting them again.
+
+    Entries are keyed by request method, URL and values of `vary_headers`, and stored as zlib-compressed
+    blobs named after the key hash. Total size is bounded by `max_size`: least recently used entries are
+    evicted first. The cache is transparent to fetchers: cached responses are passed to `on_response`
+    without waiting for rate limits.
+
+    Mostly useful while developing `response_processor` logic, when the same pages are requested on every
+    iteration.
+
+    Example:
+            >>> from arc_crawler import Crawler, ResponseCache
+            >>> cache = ResponseCache("./cache", ttl=24 * 60 * 60)
+            >>> Crawler(response_cache=cache).get(["https://example.com"])
+            >>> cache.stats
+            {'hits': 0, 'misses': 1, 'stores': 1, 'evictions': 0}
+    """
+
+    def __init__(
+        self,
+        path: str | Path = Path("./.cache"),
+        ttl: int | float | None = None,
+        max_size: int | None = 1024**3,
+        vary_headers: Iterable[str] = ("Accept", "Accept-Language", "Accept-Encoding"),
+        cacheable_statuses: Iterable[int | range] = (range(200, 300), 301, 308, 404, 410),
+        compression_level: int = 6,
+    ):
+        """Initializes a `ResponseCache` instance.
+
+        Args:
+            path (str | Path, optional): The directory to store cached responses in. Created if missing.
+
+            ttl (int | float, optional): Seconds after which an entry is considered stale and requested again.
+                Defaults to `None` (entries never expire).
+
+            max_size (int, optional): The maximum total size of cached blobs in bytes. Defaults to 1 GiB.
+                `None` disables eviction.
+
+            vary_headers (Iterable[str], optional): Request headers whose values are part of the cache key,
+                so requests that differ only by them are cached separately.
+
+            cacheable_statuses (Iterable[int | range], optional): Status codes of responses worth caching.
+                Transient failures (e.g., 429 or 5XX) are not cached by default.
+
+            compression_level (int, optional): zlib compression level from 0 to 9.
+        """
+        self.path = Path(path)
+        self.ttl = ttl
+        self.max_size = max_size
+        self.vary_headers = [header.lower() for header in vary_headers]
+        self.cacheable_statuses = list(cacheable_statuses)
+        self.compression_level = compression_level
+
+        self.path.mkdir(parents=True, exist_ok=True)
+        self._stats: CacheStats = {"hits": 0, "misses": 0, "stores": 0, "evictions": 0}
+        self._total_size = sum(entry.stat().st_size for entry in self._iter_blobs())
+        # Entries are read and written in worker threads, so size bookkeeping and eviction are serialized
+        self._lock = threading.RLock()
+
+    def __getstate__(self):
+        # Locks can't be pickled, so a new one is created when the cache is sent to worker processes
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.RLock()
+
+    @property
+    def stats(self) -> CacheStats:
+        """Counters of cache `hits`, `misses`, `stores` and `evictions` collected since the instance was created."""
+        return CacheStats(**self._stats)
+
+    @property
+    def size(self) -> int:
+        """Total size of cached blobs in bytes."""
+        return self._total_size
+
+    def get_key(self, method: str, url: str, headers: Mapping[str, str] | None = None) -> str:
+        headers = {key.lower(): value for key, value in (headers or {}).items()}
+        vary = [f"{header}={headers.get(header, '')}" for header in self.vary_headers]
+        return hl.sha256("\n".join([method.upper(), str(url), *vary]).encode("utf-8")).hexdigest()
+
+    def is_cacheable(self, status: int) -> bool:
+        return any(status in code if isinstance(code, range) else status == code for code in self.cacheable_statuses)
+
+    def _get_blob_path(self, key: str) -> Path:
+        # Two-level layout keeps directories small for millions of entries
+        return self.path / key[:2] / f"{key}{CACHE_FILE_SUFFIX}"
+
+    def _iter_blobs(self):
+        for directory in os.scandir(self.path):
+            if directory.is_dir():
+                for entry in os.scandir(directory.path):
+                    if entry.name.endswith(CACHE_FILE_SUFFIX):
+                        yield entry
+
+    def _load(self, key: str) -> CachedResponse | None:
+        blob_path = self._get_blob_path(key)
+        try:
+            blob = zlib.decompress(blob_path.read_bytes())
+        except FileNotFoundError:
+            return None
+        except zlib.error:
+            logger.warning(f'Cache entry "{blob_path}" is corrupted. Removing...')
+            self._remove(blob_path)
+            return None
+
+        meta, _, body = blob.partition(b"\n")
+        entry: CachedResponse = {**json_loads(meta), "body": body}
+
+        if self.ttl is not None and time() - entry["stored_at"] > self.ttl:
+            self._remove(blob_path)
+            return None
+
+        # Modification time marks recent use, so eviction drops least recently used entries first
+        try:
+            os.utime(blob_path)
+        except FileNotFoundError:
+            # Evicted after being read
+            pass
+        return entry
+
+    def _store(self, key: str, entry: CachedResponse):
+        meta = {key: value for key, value in entry.items() if key != "body"}
+        blob = zlib.compress(json_dumps(meta) + b"\n" + entry["body"], self.compression_level)
+
+        blob_path = self._get_blob_path(key)
+        blob_path.parent.mkdir(exist_ok=True)
+
+        # Writing to a temporary file first keeps entries intact if the process is interrupted.
+        # Its name is unique, since the same URL may be stored by concurrent requests
+        with tempfile.NamedTemporaryFile(dir=blob_path.parent, prefix=key, suffix=".tmp", delete=False) as file:
+            file.write(blob)
+        with self._lock:
+            previous_size = blob_path.stat().st_size if blob_path.exists() else 0
+            os.replace(file.name, blob_path)
+            self._total_size += len(blob) - previous_size
+            self._evict()
+
+    def _remove(self, blob_path: Path):
+        with self._lock:
+            try:
+                size = blob_path.stat().st_size
+                blob_path.unlink()
+                self._total_size -= size
+            except FileNotFoundError:
+                pass
+
+    def _evict(self):
+        with self._lock:
+            if self.max_size is None or self._total_size <= self.max_size:
+                return
+
+            # Evicting down to 90% of the limit avoids rescanning the directory on every following store
+            target_size = self.max_size * 0.9
+            for entry in sorted(self._iter_blobs(), key=lambda blob: blob.stat().st_mtime):
+                if self._total_size <= target_size:
+                    break
+                self._remove(Path(entry.path))
+                self._stats["evictions"] += 1
+            logger.debug(f"Evicted cached responses. Cache size is {convert_size(self._total_size)} now")
+
+    async def load(self, key: str) -> CachedResponse | None:
+        """Reads an entry from disk. Returns `None` if it's missing or stale."""
+        entry = await asyncio.to_thread(self._load, key)
+        self._stats["hits" if entry is not None else "misses"] += 1
+        return entry
+
+    async def store(self, key: str, entry: CachedResponse):
+        """Writes an entry to disk, evicting least recently used entries if `max_size` is exceeded."""
+        await asyncio.to_thread(self._store, key, entry)
+        self._stats["stores"] += 1
+
+    def clear(self):
+        """Removes all the cached entries."""
+        for entry in list(self._iter_blobs()):
+            self._remove(Path(entry.path))
+
+    def log_stats(self):
+        stats = self._stats
+        logger.info(
+            f"Response cache: {stats['hits']} hits, {stats['misses']} misses, {stats['evictions']} evictions. "
+            f"Size: {convert_size(self._total_size)}"
+        )
@@ -2,24 +2,69 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+import os
 import sys
 
-from typing import List, Dict, Optional, Literal, Any, Unpack
+from typing import (
+    List,
+    Dict,
+    Optional,
+    Literal,
+    Any,
+    Unpack,
+    AsyncIterator,
+    Iterable,
+    AsyncIterable,
+    Coroutine,
+    Callable,
+    Tuple,
+)
 import inspect
 
 from bs4 import BeautifulSoup
+from aiohttp import ClientTimeout
 import asyncio
-from urllib.parse import unquote
+from urllib.parse import unquote, urljoin, urlsplit
 import hashlib as hl
 import pickle
+import multiprocessing
+from concurrent.futures import Executor, ProcessPoolExecutor, wait
+from functools import partial
+from array import array
+from bisect import bisect_left
+from contextlib import nullcontext
+from queue import Queue
 
 from pathlib import Path
 
-from arc_crawler.reader import IndexReader, IndexSetterFunc, JsonSerializable, MkdirMode
-from arc_crawler.utils import FormatedLogger, Timer
-
-from .fetcher import SequentialFetcher, ParallelFetcher, Fetcher
-from .types import BasicResponse, ResponseProcessor, RequestProcessor, ResponseHandlerKwargs, TerminationCriteria
+from arc_crawler.reader import IndexReader, ShardedIndexReader, DoneSet, IndexSetterFunc, JsonSerializable, MkdirMode
+from arc_crawler.utils import FormatedLogger, Timer, BloomFilter, canonicalize_url, json_dumps, json_loads
+
+from .fetcher import SequentialFetcher, ParallelFetcher, OrderedFetcher, Fetcher
+from .limiter import RateLimiter
+from .retry import RetryPolicy
+from .pool import ConnectionPool
+from .cache import ResponseCache
+from .frontier import Frontier
+from .breaker import CircuitBreaker
+from .hedging import HedgingPolicy
+from .proxy import ProxyPool
+from .transport import Transport
+from .follow_up import FollowUpCache
+from .sharding import get_shard_name, split_urls, feed_shards, iterate_queue
+from .runner import LoopFactory, get_loop_factory, run
+from .types import (
+    BasicResponse,
+    ResponseProcessor,
+    RequestProcessor,
+    ResponseHandlerKwargs,
+    TerminationCriteria,
+    ResponseFilter,
+    RequestOptions,
+    UrlSource,
+    LinkExtractor,
+    CrawlScope,
+)
 
 
 def fallthrough_processor(**kwargs: Unpack[ResponseHandlerKwargs]) -> JsonSerializable:
@@ -40,13 +85,87 @@ def html_body_processor(**kwargs: Unpack[ResponseHandlerKwargs]) -> JsonSerializ
     return res
 
 
+def html_link_extractor(response: BasicResponse) -> List[str]:
+    """Extracts absolute URLs of `<a href="...">` links from an HTML response. Used by `Crawler.crawl()`."""
+    if not response.get("text"):
+        return []
+
+    html_soup = BeautifulSoup(response["text"], "html.parser")
+    base_url = str(response["url"])
+    base_tag = html_soup.find("base", href=True)
+    if base_tag:
+        base_url = urljoin(base_url, base_tag["href"])
+
+    links = []
+    for anchor in html_soup.find_all("a", href=True):
+        try:
+            links.append(urljoin(base_url, anchor["href"]))
+        except ValueError:
+            # E.g., an unclosed IPv6 host ("http://[bad/")
+            logger.debug(f"Skipping malformed link {anchor['href']!r} found on {response['url']}")
+    return links
+
+
+def get_scope_filter(scope: CrawlScope, seeds: Iterable[str]) -> Callable[[str], bool]:
+    if scope is None:
+        return lambda url: True
+    if callable(scope):
+        return scope
+
+    hosts = {urlsplit(seed).hostname for seed in seeds}
+    if scope == "host":
+        return lambda url: urlsplit(url).hostname in hosts
+    if scope == "domain":
+        domains = {host.removeprefix("www.") for host in hosts if host}
+
+        def is_in_domains(url: str) -> bool:
+            host = urlsplit(url).hostname or ""
+            return any(host == domain or host.endswith(f".{domain}") for domain in domains)
+
+        return is_in_domains
+
+    logger.error(f'Unknown crawl scope "{scope}"')
+    raise ValueError('Acceptable values are: "host", "domain", None or a function accepting a URL')
+
+
 def index_url_setter(res: BasicResponse):
-    return {"url": res.get("url")}
+    request_url = unquote(res.get("request_url") or "")
+    redirect = {"request_url": request_url} if request_url and request_url != res.get("url") else {}
+    return {"url": res.get("url"), **redirect, **get_validators(res)}
+
+
+def get_validators(res: BasicResponse | Dict[str, Any]) -> Dict[str, str]:
+    """Picks cache validators (`etag`, `last_modified`) used to issue conditional requests on refresh."""
+    return {key: res[key] for key in ("etag", "last_modified") if res.get(key)}
 
 
+def empty_request_processor(url: str):
+    return {}
+
+
+def empty_index_record_setter(record: Dict[str, Any]) -> Dict[str, Any]:
+    return {}
+
+
+def get_urls_hash(urls: List[str]) -> str:
+    return hl.sha256(pickle.dumps(tuple(urls))).hexdigest()
+
+
+def validate_urls(urls: UrlSource):
+    is_url_list = isinstance(urls, list) and all(isinstance(x, str) for x in urls)
+    is_lazy_source = isinstance(urls, (Iterable, AsyncIterable)) and not isinstance(urls, (str, bytes, list))
+    if not is_url_list and not is_lazy_source:
+        logger.error("Urls argument is of unsupported type")
+        raise TypeError("URL entries must be a list, an iterable or an async iterable of strings")
+
+
+# Lazily consumed URLs waiting to be sent to each worker
+SHARD_QUEUE_SIZE = 1000
+
 fetchers = {
     "async": ParallelFetcher,
     "sync": SequentialFetcher,
+    "ordered": OrderedFetcher,
 }
 
 
@@ -104,23 +223,42 @@ class Crawler:
 
     def __init__(
         self,
-        mode: Literal["async", "sync"] | str = "async",
+        mode: Literal["async", "sync", "ordered"] | str = "async",
         out_file_path: str | Path = Path("./out"),
         log_level: Literal["debug", "info", "warn", "error"] = "info",
         fetcher_config: Dict[str, type[Fetcher]] = None,
         mkdir_mode: MkdirMode = "interactive",
         termination_criteria: TerminationCriteria | None = None,
+        max_concurrent_requests: int | None = None,
+        retry_policy: RetryPolicy | None = None,
+        max_body_size: int | None = None,
+        response_filter: ResponseFilter | None = None,
+        connection_pool: ConnectionPool | None = None,
+        response_cache: ResponseCache | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        request_timeout: float | ClientTimeout | None = None,
+        hedging_policy: HedgingPolicy | None = None,
+        proxy_pool: ProxyPool | None = None,
+        transport: Transport | None = None,
+        follow_up_cache: FollowUpCache | None = None,
+        max_bytes_in_flight: int | None = None,
+        workers: int = 1,
+        event_loop: Literal["asyncio", "uvloop"] | LoopFactory = "asyncio",
+        default_executor_workers: int | None = None,
     ):
         """Initializes a `Crawler` instance.
 
         Args:
-            mode ("async" | "sync", optional): Determines the fetching behavior.
+            mode ("async" | "sync" | "ordered", optional): Determines the fetching behavior.
 
                 * **"async"**: (Default) The crawler sends multiple requests concurrently,
                   optimizing for speed and throughput. This is suitable for most
                   high-volume scraping tasks.
                 * **"sync"**: The crawler sends requests one at a time, in sequence.
                   Use this when strict ordering is required or for debugging.
+                * **"ordered"**: The crawler sends up to `max_concurrent_requests` (10 by default) requests
+                  concurrently, but processes and writes responses in the order of input URLs,
+                  producing deterministic output at a speed close to "async" mode.
 
             out_file_path (str | Path, optional): The directory where fetched data and metadata
                 will be stored. Defaults to the local `/out` folder relative to the
@@ -159,6 +297,80 @@ class Crawler:
                   which will be raised to terminate the process.
                   Use this to explicitly handle irregular cases.
 
+            max_concurrent_requests (int, optional): The maximum number of requests in flight at a time
+                when using "async" or "ordered" mode. URLs are consumed lazily, so memory usage stays flat regardless
+                of the URL list size. Defaults to `None` (no limit in "async" mode, 10 in "ordered" mode).
+
+            retry_policy (scraping.RetryPolicy, optional): Defines which failed requests (connection errors,
+                timeouts, transient status codes) are sent again, with exponential backoff and jitter.
+                Defaults to `None` (no retries).
+
+            max_body_size (int, optional): The maximum response body size in bytes. Bodies are streamed
+                in chunks and downloads exceeding the limit are aborted and skipped. Defaults to `None` (no limit).
+
+            response_filter (scraping.ResponseFilter, optional): A function that accepts keyword arguments
+                `url`, `status` and `headers`, and returns `False` to skip the response before its body is
+                downloaded. Skipped URLs are not written, so they are checked again on the next run.
+
+            connection_pool (scraping.ConnectionPool, optional): Connection pool settings (total and per-host
+                limits, keep-alive timeout, DNS cache TTL, happy eyeballs). Its `stats` property reports
+                connections opened vs reused. Defaults to `None` (aiohttp defaults).
+
+            response_cache (scraping.ResponseCache, optional): On-disk cache of responses keyed by URL.
+                Cached responses are replayed without network requests and rate limits, which speeds up
+                repeated runs while developing `response_processor`. Defaults to `None` (no caching).
+
+            circuit_breaker (scraping.CircuitBreaker, optional): Per-host circuit breaker. Hosts that keep failing
+                (timeouts, connection errors, 5XX) are parked for a cooldown, and their URLs are deferred instead
+                of holding concurrency slots, so a degraded host doesn't slow down the rest of the job.
+                Defaults to `None` (disabled).
+
+            request_timeout (float | aiohttp.ClientTimeout, optional): Timeout of each request in seconds, or
+                separate connect/read timeouts as `aiohttp.ClientTimeout`. Keeps a single stalled request from
+                holding the run (especially in "sync" mode). Combine with `retry_policy` to retry timed out
+                requests. Defaults to `None` (the session timeout, 5 minutes by default).
+
+            hedging_policy (scraping.HedgingPolicy, optional): Hedges requests slower than the observed p95
+                latency of their host with a duplicate request, using whichever response arrives first.
+                Defaults to `None` (disabled).
+
+            proxy_pool (scraping.ProxyPool, optional): Spreads requests across several proxies instead of
+                a single `proxy` session argument, with a concurrency cap per proxy and eviction of slow or
+                failing ones. Raise `max_concurrent_requests` to the pool's total capacity to benefit from it.
+                Defaults to `None` (no proxies).
+
+            transport (scraping.Transport, optional): The HTTP client sending requests. Use `HttpxTransport`
+                to multiplex many requests to the same host over a single HTTP/2 connection
+                (`pip install arc-crawler[http2]`). Defaults to `None` (`AiohttpTransport`, HTTP/1.1).
+
+            follow_up_cache (scraping.FollowUpCache, optional): Makes the `session` passed to response processors
+                send identical concurrent GET requests only once, and reuse recent responses for a while.
+                Processors then receive `FollowUpResponse` objects from `session.get()`. Defaults to `None`.
+
+            max_bytes_in_flight (int, optional): The memory budget in bytes for responses received but not yet
+                written, when using "async" mode. New requests wait while it's exceeded, so high
+                `max_concurrent_requests` can be used on sites with large pages. Defaults to `None` (no budget).
+
+            workers (int, optional): The number of worker processes used by `get()`. When greater than 1,
+                URLs are sharded by host across processes, each running its own event loop, session and
+                rate limits (so `request_delay` applies per worker). Shards are written to separate files
+                (`{out_file_name}_shard_{i}_of_{workers}.jsonl`) and returned as one `ShardedIndexReader`.
+                Crawler options and `get()` arguments (including processors) are sent to workers, so they must
+                be picklable (e.g., module-level functions rather than lambdas). Defaults to 1 (no workers).
+
+            event_loop ("asyncio" | "uvloop" | Callable[[], asyncio.AbstractEventLoop], optional): The event loop
+                `get()` runs on. "uvloop" requires `uvloop` to be installed (`pip install arc-crawler[uvloop]`)
+                and noticeably reduces per-request overhead for high-concurrency jobs. A function creating
+                a loop can be provided as well. Defaults to "asyncio".
+
+            default_executor_workers (int, optional): The number of threads of the event loop's default
+                executor, used for blocking work such as `ResponseCache` disk access.
+                Defaults to `None` (asyncio default).
+
+        Raises:
+            ValueError: If `mode` is unknown, or an option is not supported by the fetcher of the selected mode
+                (e.g., `max_concurrent_requests` in "sync" mode).
+
         Examples:
 
             1. To initialize a crawler with minimal arguments:
@@ -171,19 +383,72 @@ class Crawler:
             >>> from arc_crawler import Crawler
             >>> crawler = Crawler(mode="sync", out_file_path="./datasets", log_level="error")
         """
+        # Kept to create identical crawlers in worker processes
+        self._options = {
+            "mode": mode,
+            "out_file_path": out_file_path,
+            "log_level": log_level,
+            "fetcher_config": fetcher_config,
+            "termination_criteria": termination_criteria,
+            "max_concurrent_requests": max_concurrent_requests,
+            "retry_policy": retry_policy,
+            "max_body_size": max_body_size,
+            "response_filter": response_filter,
+            "connection_pool": connection_pool,
+            "response_cache": response_cache,
+            "circuit_breaker": circuit_breaker,
+            "request_timeout": request_timeout,
+            "hedging_policy": hedging_policy,
+            "proxy_pool": proxy_pool,
+            "transport": transport,
+            "follow_up_cache": follow_up_cache,
+            "max_bytes_in_flight": max_bytes_in_flight,
+            "event_loop": event_loop,
+            "default_executor_workers": default_executor_workers,
+        }
+        self.workers = workers
+        # Resolved right away, so a missing uvloop is reported before anything is fetched
+        self._loop_factory = get_loop_factory(event_loop)
+        self.default_executor_workers = default_executor_workers
+
         if fetcher_config is None:
             fetcher_config = fetchers
         fetcher = fetcher_config.get(mode, None)
         if not fetcher:
             logger.error(f"Incorrect mode provided for HtmlFetcher")
             raise ValueError(f"Acceptable values are: f{', '.join([f'"{x}"' for x in fetcher_config.keys()])}")
-        self._fetcher = fetcher(termination_criteria=termination_criteria)
+        # Only explicitly set options are forwarded, so custom fetchers are not required to support all of them
+        fetcher_options = {
+            "max_concurrent_requests": max_concurrent_requests,
+            "retry_policy": retry_policy,
+            "max_body_size": max_body_size,
+            "response_filter": response_filter,
+            "connection_pool": connection_pool,
+            "response_cache": response_cache,
+            "circuit_breaker": circuit_breaker,
+            "request_timeout": request_timeout,
+            "hedging_policy": hedging_policy,
+            "proxy_pool": proxy_pool,
+            "transport": transport,
+            "follow_up_cache": follow_up_cache,
+            "max_bytes_in_flight": max_bytes_in_flight,
+        }
+        # Options that are not part of the base `Fetcher` are only accepted by some fetchers
+        fetcher_parameters = inspect.signature(fetcher).parameters
+        for option in ("max_concurrent_requests", "max_bytes_in_flight"):
+            if fetcher_options[option] is not None and option not in fetcher_parameters:
+                raise ValueError(f'"{option}" is not supported in "{mode}" mode ({fetcher.__name__})')
+        self._fetcher = fetcher(
+            termination_criteria=termination_criteria,
+            **{key: value for key, value in fetcher_options.items() if value is not None},
+        )
 
         self.out_file_path = out_file_path
 
         self.out_source = ""
         self.out_index = ""
         self.reader: IndexReader | None = None
+        self.done: DoneSet | None = None
         self.index_record_setter = index_url_setter
         self.mkdir_mode = mkdir_mode
 
@@ -197,15 +462,27 @@ class Crawler:
         root_logger = logging.getLogger()
         root_logger.setLevel(level)
 
-        console_logger = logging.StreamHandler(sys.stdout)
+        # Handler is reused when several crawlers are created (e.g., by workers forked from the main process)
+        console_logger = next(
+            (handler for handler in root_logger.handlers if isinstance(handler.formatter, FormatedLogger)), None
+        )
+        if console_logger is None:
+            console_logger = logging.StreamHandler(sys.stdout)
+            console_logger.setFormatter(FormatedLogger())
+            root_logger.addHandler(console_logger)
         console_logger.setLevel(level)
-        console_logger.setFormatter(FormatedLogger())
-        root_logger.addHandler(console_logger)
 
-    def _init_output(self, urls: List[str], out_file_name: Optional[str] = None) -> List[str]:
+    def _init_output(
+        self, urls: UrlSource, out_file_name: Optional[str] = None, revalidate: bool = False
+    ) -> Tuple[UrlSource, int | None]:
+        """Opens the output and filters out URLs fetched by previous runs.
+
+        Returns:
+            Tuple[UrlSource, int | None]: URLs to fetch, consumed lazily, and their number if `urls` is a list.
+        """
+
         def generate_from_hash():
-            file_bytes = pickle.dumps(tuple(urls))
-            file_hash = hl.sha256(file_bytes).hexdigest()
+            file_hash = get_urls_hash(urls)
             return {
                 "source": str(Path(self.out_file_path) / f"{file_hash}.jsonl"),
                 "index": str(Path(self.out_file_path) / f"{file_hash}.index"),
@@ -222,18 +499,71 @@ class Crawler:
         self.reader = IndexReader(
             self.out_source, index_record_setter=self.index_record_setter, mkdir_mode=self.mkdir_mode
         )
-        finished_urls = [index_rec["url"] for index_rec in self.reader.index_data]
-
-        return list(set(urls) - set(finished_urls))
+        self.done = self._open_done_set()
+        is_materialized = isinstance(urls, list)
+        if revalidate:
+            return (list(urls), len(urls)) if is_materialized else (urls, None)
+
+        done = self.done
+        if isinstance(urls, Frontier):
+            # Passed to fetchers as is, since they report processed URLs back to it
+            urls.skip_if(done.__contains__)
+            return urls, None
+
+        if is_materialized:
+            # URLs are hashed once (8 bytes each) to count and deduplicate them without copying the list
+            keys = array("Q", map(DoneSet.get_key, urls))
+            pending = array("Q", (key for key in DoneSet.sort_keys(keys) if not done.has_key(key)))
+            # A byte per pending URL marks it as dispatched, so later duplicates are skipped
+            dispatched = bytearray(len(pending))
+
+            def skip_finished():
+                # Input order is kept, so "sync" and "ordered" modes write records in the same order as URLs
+                for url, key in zip(urls, keys):
+                    position = bisect_left(pending, key)
+                    if position < len(pending) and pending[position] == key and not dispatched[position]:
+                        dispatched[position] = 1
+                        yield url
+
+            return skip_finished(), len(pending)
+
+        # Lazy inputs are filtered on the fly. Unlike lists, they aren't deduplicated, which would require
+        # keeping every URL seen in memory
+        if isinstance(urls, AsyncIterable):
+
+            async def skip_finished_async():
+                async for url in urls:
+                    if url not in done:
+                        yield url
+
+            return skip_finished_async(), None
+
+        return (url for url in urls if url not in done), None
+
+    def _open_done_set(self) -> DoneSet:
+        done_path = Path(self.out_source).with_suffix(".done")
+        done = DoneSet(done_path)
+        if len(done) != len(self.reader):
+            # Datasets written by older versions or interrupted between writing a record and its entry
+            logger.info(f"Rebuilding {done_path.name} from {len(self.reader)} index records...")
+            done = DoneSet.rebuild(
+                done_path,
+                ((record.get("request_url") or record["url"], record["url"]) for record in self.reader.index_data),
+            )
+        return done
 
     def get(
         self,
-        urls: List[str],
+        urls: UrlSource,
         out_file_name: str | None = None,
-        request_processor: RequestProcessor = lambda x: {},
+        request_processor: RequestProcessor = empty_request_processor,
         response_processor: ResponseProcessor = fallthrough_processor,
-        index_record_setter: IndexSetterFunc = lambda x: {},
+        index_record_setter: IndexSetterFunc = empty_index_record_setter,
         request_delay: int | float = 0.4,
+        rate_limiter: RateLimiter | None = None,
+        revalidate: bool = False,
+        processor_executor: Executor | None = None,
+        max_pending_processing: int | None = None,
         **kwargs: Dict[str, Any] | None,
     ) -> IndexReader:
         """Starts fetching the provided URLs.
@@ -244,12 +574,17 @@ class Crawler:
         resumption and incremental data collection.
 
         Args:
-            urls (list[str]): A list of URLs to fetch. Already processed URLs from
-                previous runs will be automatically skipped.
+            urls (UrlSource): A list of URLs to fetch. Already processed URLs from
+                previous runs will be automatically skipped. Generators and async iterables
+                (e.g., over a database cursor) are accepted as well: they are consumed lazily,
+                so memory usage doesn't depend on the number of URLs. Unlike lists, they are
+                not deduplicated. Pass a `scraping.Frontier` to fetch URLs by priority and push
+                newly discovered ones from `response_processor`.
 
             out_file_name (str, optional): The base name for the output file(s) created
                 at `out_file_path` (configured during `Crawler` initialization).
                 If not provided, a hash based on the URL list will be automatically assigned.
+                Required as a job id when `urls` is not a list.
 
             request_processor (scraping.RequestProcessor, optional): A callback function
                 that fires just before each HTTP request is sent. It receives the
@@ -286,6 +621,31 @@ class Crawler:
                 have passed since the latest request, which is vital for respecting
                 service rate limits.
 
+            rate_limiter (scraping.RateLimiter, optional): Per-host token-bucket limits (rate, burst and
+                maximum concurrency). When provided, it replaces the global `request_delay`, so requests to
+                unrelated hosts proceed in parallel while each host still gets its own politeness budget.
+                Use `scraping.AdaptiveRateLimiter` to have limits tuned automatically based on 429/503 responses,
+                `Retry-After` headers and latency, instead of terminating the run.
+
+            revalidate (bool, optional): Refreshes already fetched URLs instead of skipping them.
+                `ETag` and `Last-Modified` response headers are always stored in the output (and its `.index`),
+                so on refresh requests are sent with `If-None-Match` / `If-Modified-Since` headers.
+                `304 Not Modified` responses are treated as unchanged and are not written again, while changed
+                pages are appended as new records (the latest record for a URL is the most recent one).
+                Defaults to `False`.
+
+            processor_executor (concurrent.futures.Executor, optional): Runs a synchronous `response_processor`
+                in the provided `ThreadPoolExecutor` or `ProcessPoolExecutor` instead of the event loop, so slow
+                parsing (e.g., with BeautifulSoup) doesn't stall requests in flight. The processor receives
+                `session=None`, since the session can't be used outside the event loop. With a process pool,
+                the processor and responses must be picklable. Asynchronous processors always run on the loop.
+                Not supported together with `workers`. Defaults to `None` (processors run on the event loop).
+
+            max_pending_processing (int, optional): The maximum number of responses submitted to
+                `processor_executor` at a time. Responses beyond it wait within their requests, so with
+                `max_concurrent_requests` set, fetching pauses until the executor catches up.
+                Defaults to twice the number of CPUs.
+
             **kwargs: A dictionary of parameters that will be passed directly to the
                 underlying `aiohttp.ClientSession` instance. Use this to specify various
                 session-level settings like `cookies`, `headers`, `proxy`, `timeout`, etc.
@@ -293,6 +653,7 @@ class Crawler:
         Returns:
             IndexReader: A reader instance that's set up to efficiently read the
             saved data. This object is returned once all specified URLs have been fetched.
+            When the crawler has several `workers`, a `ShardedIndexReader` over all the shards is returned.
 
         Examples:
 
@@ -322,48 +683,356 @@ class Crawler:
             ...     urls=["https://example.com"], response_processor=extend_response, index_record_setter=extend_index
             ... )
         """
-        is_url_list = isinstance(urls, list) and all(isinstance(x, str) for x in urls)
-        if not is_url_list:
-            logger.error("Urls argument is of unsupported type")
-            raise TypeError("URL entries must be a list")
+        validate_urls(urls)
+        is_materialized = isinstance(urls, list)
+        if not is_materialized and out_file_name is None:
+            logger.error("Output name can't be derived from lazily consumed URLs")
+            raise ValueError("out_file_name must be provided as a job id when urls is not a list")
+
+        if self.workers > 1:
+            if processor_executor is not None:
+                logger.error("processor_executor can't be sent to worker processes")
+                raise ValueError("processor_executor is not supported together with workers")
+            if isinstance(urls, Frontier):
+                logger.error("Processors in worker processes can't push URLs to the frontier")
+                raise ValueError("Frontier is not supported together with workers")
+
+            return self._get_sharded(
+                urls,
+                out_file_name or get_urls_hash(urls),
+                request_processor=request_processor,
+                response_processor=response_processor,
+                index_record_setter=index_record_setter,
+                request_delay=request_delay,
+                revalidate=revalidate,
+                **({"rate_limiter": rate_limiter} if rate_limiter is not None else {}),
+                **kwargs,
+            )
 
         self.index_record_setter = lambda record: {**index_record_setter(record), **index_url_setter(record)}
-        urls_to_fetch = self._init_output(urls, out_file_name)
+        urls_to_fetch, remaining_count = self._init_output(urls, out_file_name, revalidate)
 
-        timer = Timer(total_measures=len(urls), measures_completed=len(urls) - len(urls_to_fetch))
+        timer = (
+            Timer(total_measures=len(urls), measures_completed=len(urls) - remaining_count)
+            if is_materialized
+            else Timer(total_measures=None)
+        )
 
-        def handle_request_sent(url: str) -> None:
+        # Keyed by the requested URL, as redirected pages are requested again by it. Later records of the same URL
+        # override earlier ones, so the most recent validators are used
+        stored_validators = (
+            {
+                index_rec.get("request_url") or index_rec["url"]: get_validators(index_rec)
+                for index_rec in self.reader.index_data
+            }
+            if revalidate
+            else {}
+        )
+        unchanged_count = 0
+        # Bounds the queue between the network stage and the processing stage
+        processing_slots = asyncio.Semaphore(max_pending_processing or 2 * (os.cpu_count() or 1))
+
+        def handle_request_sent(url: str) -> RequestOptions | None:
             logger.info(f'Processing "{url}" now...')
             print("\n")
             timer.measure(url)
             request_processor(url)
 
+            validators = stored_validators.get(unquote(url))
+            if validators:
+                headers = {
+                    "If-None-Match": validators.get("etag"),
+                    "If-Modified-Since": validators.get("last_modified"),
+                }
+                return {"headers": {key: value for key, value in headers.items() if value}}
+
         async def handle_response_received(**kw: Unpack[ResponseHandlerKwargs]):
+            nonlocal unchanged_count
             response, session = kw["response"], kw["session"]
             response_url = unquote(str(response["url"]))
 
-            if inspect.iscoroutinefunction(response_processor):
+            if revalidate and response["status"] == 304:
+                logger.info(f'"{response_url}" is not modified since the last run. Skipping...')
+                unchanged_count += 1
+                response_obj = None
+            elif inspect.iscoroutinefunction(response_processor):
                 response_obj = await response_processor(response=response, session=session)
+            elif processor_executor is not None:
+                async with processing_slots:
+                    response_obj = await asyncio.get_running_loop().run_in_executor(
+                        processor_executor, partial(response_processor, response=response, session=None)
+                    )
             else:
                 response_obj = response_processor(response=response, session=session)
 
             if response_obj is not None:
-                self.reader.write({**response_obj, "url": response_url})
+                record = {**response_obj, "url": response_url, **get_validators(response)}
+                request_url = unquote(response["request_url"])
+                if request_url != response_url:
+                    # Redirected: kept, so the requested URL is known to be fetched when rebuilding `.done`
+                    record["request_url"] = request_url
+                self.reader.write(record)
+                self.done.add(response["request_url"], response_url)
 
             timer.measure(response_url)
             timer.print_status(with_progressbar=True, with_time_remaining=True)
 
-        asyncio.run(
+        self._run(
             self._fetcher.get(
                 urls=urls_to_fetch,
                 on_response=handle_response_received,
                 on_request=handle_request_sent,
                 min_request_delay=request_delay,
+                **({"rate_limiter": rate_limiter} if rate_limiter is not None else {}),
                 **kwargs,
             )
         )
 
+        if revalidate:
+            logger.info(
+                f"Revalidation completed. {unchanged_count} out of {timer.measured_count} URLs were not modified."
+            )
+
         reader = self.reader
         self.reader = None
+        self.done = None
 
         return reader
+
+    def crawl(
+        self,
+        seeds: Iterable[str],
+        out_file_name: str,
+        extract_links: LinkExtractor = html_link_extractor,
+        max_depth: int | None = None,
+        scope: CrawlScope = "host",
+        response_processor: ResponseProcessor = fallthrough_processor,
+        expected_urls: int = 10_000_000,
+        false_positive_rate: float = 1e-4,
+        max_frontier_items: int | None = 1_000_000,
+        **kwargs,
+    ) -> IndexReader:
+        """Fetches the seed URLs and pages discovered by following their links.
+
+        Pages are fetched breadth-first: a `Frontier` gives priority to pages closer to the seeds. Links are
+        canonicalized (`utils.canonicalize_url`) and checked against a seen-set, which is a `utils.BloomFilter`,
+        so it takes a few bytes per URL and scales to tens of millions of pages. A small share of never seen
+        URLs (around `false_positive_rate`) may be skipped as already seen.
+
+        Discovered URLs are appended to `<out_file_name>.frontier` next to the output. On restart, they
+        are loaded back, and the ones already written to the output are skipped, so an interrupted crawl
+        continues where it stopped. Pending URLs beyond `max_frontier_items` are spilled to disk.
+
+        Args:
+            seeds (Iterable[str]): URLs to start from (depth 0).
+
+            out_file_name (str): The base name for the output files, used as a job id to resume the crawl.
+
+            extract_links (scraping.LinkExtractor, optional): Returns URLs of links found in a response.
+                Receives the response before `response_processor`. Defaults to `html_link_extractor`.
+
+            max_depth (int, optional): The maximum number of links between a seed and a crawled page.
+                Defaults to `None` (no limit).
+
+            scope (scraping.CrawlScope, optional): Which links are followed: "host" (the hosts of seeds),
+                "domain" (the hosts of seeds and their subdomains), `None` (any) or a function receiving
+                a canonical URL. Defaults to "host".
+
+            response_processor (scraping.ResponseProcessor, optional): Formats responses written to the output.
+                See `get()` for details.
+
+            expected_urls (int, optional): The expected number of distinct URLs, used to size the seen-set.
+                Defaults to 10 000 000 (about 23 MiB).
+
+            false_positive_rate (float, optional): The share of new URLs that may be mistaken as seen once
+                `expected_urls` is reached. Defaults to 0.0001.
+
+            max_frontier_items (int, optional): The maximum number of pending URLs kept in memory.
+                Defaults to 1 000 000. `None` keeps all of them in memory.
+
+            **kwargs: Other `get()` parameters (e.g., `request_delay`, `rate_limiter`, `index_record_setter`)
+                and `aiohttp.ClientSession` settings.
+
+        Returns:
+            IndexReader: A reader of the crawled pages.
+
+        Examples:
+            >>> from arc_crawler import Crawler
+            >>> crawler = Crawler(out_file_path="./output")
+            >>> reader = crawler.crawl(["https://example.com"], out_file_name="example", max_depth=2)
+        """
+        seeds = [canonicalize_url(seed) for seed in seeds]
+        is_in_scope = get_scope_filter(scope, seeds)
+        seen = BloomFilter(capacity=expected_urls, error_rate=false_positive_rate)
+        # Depth of a URL is its negated priority, so shallow pages go first
+        frontier = Frontier(max_memory_items=max_frontier_items, spill_dir=self.out_file_path)
+
+        def discover(url: str, depth: int) -> bool:
+            if not seen.add(url):
+                return False
+            frontier.push(url, priority=-depth)
+            return True
+
+        frontier_path = Path(self.out_file_path) / f"{out_file_name}.frontier"
+        if frontier_path.exists():
+            # Crawled URLs are only marked as seen, so the frontier holds just the ones left to fetch
+            done = DoneSet(Path(self.out_file_path) / f"{out_file_name}.done")
+            complete_size = 0
+            with open(frontier_path, "rb") as file:
+                for line in file:
+                    # A line cut by an interrupted run has no line break
+                    if line.endswith(b"\n"):
+                        complete_size += len(line)
+                        url, depth = json_loads(line)
+                        if url in done:
+                            seen.add(url)
+                        else:
+                            discover(url, depth)
+            os.truncate(frontier_path, complete_size)
+            logger.info(f"Loaded {len(seen)} URLs discovered by the previous run, {len(frontier)} of them pending")
+            del done
+
+        with open(frontier_path, "ab") as frontier_file:
+
+            def record(url: str, depth: int):
+                frontier_file.write(json_dumps([url, depth]) + b"\n")
+
+            for seed in seeds:
+                if discover(seed, 0):
+                    record(seed, 0)
+            frontier_file.flush()
+
+            async def follow_links(**kw: Unpack[ResponseHandlerKwargs]):
+                response = kw["response"]
+                priority = frontier.get_priority(response["request_url"])
+                depth = -int(priority) if priority is not None else 0
+                seen.add(canonicalize_url(str(response["url"])))
+
+                # Links are extracted before processing, since processors may modify the response
+                links = extract_links(response) if response["ok"] and (max_depth is None or depth < max_depth) else []
+
+                if inspect.iscoroutinefunction(response_processor):
+                    response_obj = await response_processor(**kw)
+                else:
+                    response_obj = response_processor(**kw)
+
+                for link in links:
+                    try:
+                        url = canonicalize_url(link)
+                    except ValueError:
+                        # E.g., a non-numeric or out of range port
+                        logger.debug(f"Skipping malformed link {link!r} found on {response['url']}")
+                        continue
+                    if url.startswith(("http://", "https://")) and is_in_scope(url) and discover(url, depth + 1):
+                        record(url, depth + 1)
+                # Discovered links are persisted before the page is written as done
+                frontier_file.flush()
+
+                return response_obj
+
+            try:
+                return self.get(frontier, out_file_name, response_processor=follow_links, **kwargs)
+            finally:
+                frontier.close()
+
+    def _run(self, coroutine: Coroutine):
+        return run(coroutine, loop_factory=self._loop_factory, default_executor_workers=self.default_executor_workers)
+
+    def _get_sharded(self, urls: UrlSource, out_file_name: str, **kwargs) -> ShardedIndexReader:
+        shard_names = [get_shard_name(out_file_name, shard, self.workers) for shard in range(self.workers)]
+        shard_paths = [Path(self.out_file_path) / f"{shard_name}.jsonl" for shard_name in shard_names]
+        index_record_setter = kwargs["index_record_setter"]
+
+        # Same index records as written by workers, so an index built here isn't missing their fields
+        def shard_index_setter(record: BasicResponse):
+            return {**index_record_setter(record), **index_url_setter(record)}
+
+        # Workers can't prompt for input, so output is confirmed once in the main process
+        IndexReader(shard_paths[0], index_record_setter=shard_index_setter, mkdir_mode=self.mkdir_mode)
+        for path in shard_paths[1:]:
+            if not path.exists():
+                IndexReader.touch(path)
+
+        logger.info(f"Starting {self.workers} worker processes...")
+        is_materialized = isinstance(urls, list)
+        context = multiprocessing.get_context()
+        with (
+            context.Manager() if not is_materialized else nullcontext() as manager,
+            ProcessPoolExecutor(max_workers=self.workers, mp_context=context) as executor,
+        ):
+            shard_inputs = (
+                split_urls(urls, self.workers)
+                if is_materialized
+                else [manager.Queue(maxsize=SHARD_QUEUE_SIZE) for _ in range(self.workers)]
+            )
+            futures = [
+                executor.submit(crawl_shard, self._options, shard_input, shard_name, kwargs)
+                for shard_input, shard_name in zip(shard_inputs, shard_names)
+            ]
+            if not is_materialized:
+                self._run(feed_shards(urls, shard_inputs, is_alive=lambda shard: not futures[shard].done()))
+            wait(futures)
+
+        # Re-raises the first exception encountered by workers
+        for future in futures:
+            future.result()
+
+        return ShardedIndexReader(shard_paths, index_record_setter=shard_index_setter)
+
+    async def astream(
+        self,
+        urls: UrlSource,
+        request_delay: int | float = 0.4,
+        rate_limiter: RateLimiter | None = None,
+        buffer_size: int = 16,
+        **kwargs: Dict[str, Any] | None,
+    ) -> AsyncIterator[BasicResponse]:
+        """Fetches the provided URLs, yielding responses as they are received.
+
+        Unlike `get()`, nothing is written to `out_file_path` and previous runs are not taken into account:
+        responses are handed over to the caller right away, so they can be piped into further processing
+        stages without buffering the whole job. Fetching pauses while `buffer_size` responses are waiting
+        to be consumed.
+
+        Args:
+            urls (UrlSource): A list, iterable or async iterable of URLs to fetch.
+
+            request_delay (int | float, optional): The minimum time in seconds to wait between consecutive requests.
+
+            rate_limiter (scraping.RateLimiter, optional): Per-host limits. Replaces `request_delay` when provided.
+
+            buffer_size (int, optional): The maximum number of received responses waiting to be consumed.
+
+            **kwargs: Parameters passed directly to the underlying `aiohttp.ClientSession` instance.
+
+        Yields:
+            BasicResponse: Responses in the order they are received.
+
+        Examples:
+            >>> import asyncio
+            >>> from arc_crawler import Crawler
+            >>> async def main():
+            ...     async for response in Crawler().astream(["https://example.com"]):
+            ...         print(response["status"], len(response["text"]))
+            >>> asyncio.run(main())
+        """
+        validate_urls(urls)
+
+        def handle_request_sent(url: str):
+            logger.debug(f'Processing "{url}" now...')
+
+        async for response in self._fetcher.stream(
+            urls=urls,
+            on_request=handle_request_sent,
+            min_request_delay=request_delay,
+            buffer_size=buffer_size,
+            **({"rate_limiter": rate_limiter} if rate_limiter is not None else {}),
+            **kwargs,
+        ):
+            yield response
+
+
+def crawl_shard(options: Dict[str, Any], urls: List[str] | Queue, out_file_name: str, get_options: Dict[str, Any]):
+    """Entry point of worker processes started by `Crawler(workers=N)`. Crawls a single shard of URLs."""
+    crawler = Crawler(**options, mkdir_mode="forced")
+    crawler.get(urls if isinstance(urls, list) else iterate_queue(urls), out_file_name=out_file_name, **get_options)
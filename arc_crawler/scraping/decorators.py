@@ -1,35 +1,69 @@
 from functools import wraps
-from typing import List
 from aiohttp import ClientSession
 
-from .types import OnRequestCallback, OnResponseCallback
+from .types import OnRequestCallback, OnResponseCallback, UrlSource
+from .limiter import RateLimiter
+from .pool import ConnectionPool
+from .cache import ResponseCache
+from .hedging import HedgingPolicy
+from .proxy import ProxyPool
+from .transport import Transport, AiohttpTransport
+from .follow_up import FollowUpCache
 
 
 def session_decorator(func):
     @wraps(func)
     async def wrapper(
         self,
-        urls: List[str],
+        urls: UrlSource,
         on_response: OnResponseCallback,
         on_request: OnRequestCallback | None = None,
         min_request_delay: int | float = 0,
         session: ClientSession | None = None,
+        rate_limiter: RateLimiter | None = None,
         **kwargs,
     ):
         is_new_session = session is None
+        connection_pool: ConnectionPool | None = getattr(self, "connection_pool", None)
+        if is_new_session and connection_pool is not None:
+            # Explicitly passed session arguments (e.g. custom `connector`) take precedence over the pool
+            kwargs = {**connection_pool.session_kwargs(), **kwargs}
         local_session: ClientSession = ClientSession(**kwargs) if is_new_session else session
+        transport: Transport | None = getattr(self, "transport", None)
 
-        res = await func(
-            self,
-            urls=urls,
-            on_response=on_response,
-            on_request=on_request,
-            min_request_delay=min_request_delay,
-            session=local_session,
-        )
-        if is_new_session:
-            await local_session.close()
+        try:
+            # Other transports don't use connections of the session
+            if is_new_session and connection_pool is not None and isinstance(transport, (AiohttpTransport, type(None))):
+                urls = await connection_pool.warm_up(local_session, urls)
 
-        return res
+            return await func(
+                self,
+                urls=urls,
+                on_response=on_response,
+                on_request=on_request,
+                min_request_delay=min_request_delay,
+                session=local_session,
+                # Not forwarded unless set, so custom fetchers are not required to support rate limiting
+                **({"rate_limiter": rate_limiter} if rate_limiter is not None else {}),
+            )
+        finally:
+            if transport is not None:
+                await transport.aclose()
+            if is_new_session:
+                await local_session.close()
+                if connection_pool is not None:
+                    connection_pool.log_stats()
+            response_cache: ResponseCache | None = getattr(self, "response_cache", None)
+            if response_cache is not None:
+                response_cache.log_stats()
+            hedging_policy: HedgingPolicy | None = getattr(self, "hedging_policy", None)
+            if hedging_policy is not None:
+                hedging_policy.log_stats()
+            proxy_pool: ProxyPool | None = getattr(self, "proxy_pool", None)
+            if proxy_pool is not None:
+                proxy_pool.log_stats()
+            follow_up_cache: FollowUpCache | None = getattr(self, "follow_up_cache", None)
+            if follow_up_cache is not None:
+                follow_up_cache.log_stats()
 
     return wrapper
@@ -1,20 +1,77 @@
-import json
 from abc import ABC, abstractmethod
-from asyncio import Semaphore
-from typing import List, Unpack, Dict, Any
+from typing import Unpack, Dict, Any, Mapping, AsyncIterator, AsyncIterable, Tuple
 import inspect
+import contextvars
+import heapq
+import itertools
+from collections import deque
 
 import aiohttp
 from aiohttp import ClientSession
+from yarl import URL
 import asyncio
-from contextlib import asynccontextmanager
+from time import time
+from contextlib import asynccontextmanager, nullcontext
 
 import logging
 
 logger = logging.getLogger(__name__)
 
-from .types import TerminationFunc, TerminationCriteria, OnResponseCallback, OnRequestCallback, TerminationFuncKwargs
+from .types import (
+    TerminationFunc,
+    TerminationCriteria,
+    OnResponseCallback,
+    OnRequestCallback,
+    TerminationFuncKwargs,
+    BasicResponse,
+    ResponseFilter,
+    FetcherOptions,
+    RequestOptions,
+    CachedResponse,
+    UrlSource,
+    TransportResponse,
+)
+from arc_crawler.utils import convert_size, json_loads
 from .decorators import session_decorator
+from .limiter import RateLimiter, AdaptiveRateLimiter, parse_retry_after
+from .retry import RetryPolicy, RetryRequested
+from .pool import ConnectionPool
+from .cache import ResponseCache
+from .breaker import CircuitBreaker
+from .hedging import HedgingPolicy
+from .proxy import ProxyPool
+from .transport import Transport, AiohttpTransport
+from .follow_up import FollowUpCache
+
+CACHED_HEADERS = ("Content-Type", "ETag", "Last-Modified")
+
+
+async def iterate_urls(urls: UrlSource) -> AsyncIterator[str]:
+    """Iterates over URLs lazily, regardless of whether they are provided as sync or async iterable."""
+    if isinstance(urls, AsyncIterable):
+        async for url in urls:
+            yield url
+    else:
+        for url in urls:
+            yield url
+
+
+async def get_next_url(url_iterator: AsyncIterator[str]) -> str | None:
+    """Returns the next URL, or `None` once the iterator is exhausted (`anext()` with a default needs Python 3.10)."""
+    try:
+        return await url_iterator.__anext__()
+    except StopAsyncIteration:
+        return None
+
+
+def mark_url_done(urls: UrlSource, url: str):
+    """Reports a URL taken from `urls` as processed to sources tracking it (e.g., `Frontier`)."""
+    task_done = getattr(urls, "task_done", None)
+    if task_done is not None:
+        task_done(url)
+
+
+_stream_slots: contextvars.ContextVar[asyncio.Semaphore | None] = contextvars.ContextVar("stream_slots", default=None)
 
 
 class Fetcher(ABC):
@@ -33,7 +90,22 @@ class Fetcher(ABC):
             >>> 		pass
     """
 
-    def __init__(self, termination_criteria: TerminationCriteria | None = None):
+    def __init__(
+        self,
+        termination_criteria: TerminationCriteria | None = None,
+        retry_policy: RetryPolicy | None = None,
+        max_body_size: int | None = None,
+        response_filter: ResponseFilter | None = None,
+        chunk_size: int = 64 * 1024,
+        connection_pool: ConnectionPool | None = None,
+        response_cache: ResponseCache | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        request_timeout: float | aiohttp.ClientTimeout | None = None,
+        hedging_policy: HedgingPolicy | None = None,
+        proxy_pool: ProxyPool | None = None,
+        transport: Transport | None = None,
+        follow_up_cache: FollowUpCache | None = None,
+    ):
         """Initializes an abstract `Fetcher` instance.
 
         Args:
@@ -50,7 +122,75 @@ class Fetcher(ABC):
                   This function should return an `Exception` instance,
                   which will be raised to terminate the process.
                   Use this to explicitly handle irregular cases.
+
+            retry_policy (scraping.RetryPolicy, optional): Defines which failed requests (connection errors,
+                timeouts, transient status codes) are sent again and how long to wait in between.
+                Statuses are checked against termination criteria only after retries are exhausted.
+                Defaults to `None` (no retries).
+
+            max_body_size (int, optional): The maximum response body size in bytes. Bodies are read in chunks
+                of `chunk_size` bytes and the download is aborted as soon as the limit is exceeded (or right away,
+                if `Content-Length` header exceeds it). Aborted responses are skipped and never reach `on_response`.
+                Defaults to `None` (no limit, the whole body is read at once).
+
+            response_filter (scraping.ResponseFilter, optional): A function that accepts keyword arguments
+                matching `ResponseFilterKwargs` (`url: str`, `status: int`, `headers`) and returns `False` to
+                skip the response before its body is downloaded (e.g., based on `Content-Type`).
+
+            chunk_size (int, optional): The size of chunks in bytes used to read bodies when `max_body_size` is set.
+
+            connection_pool (scraping.ConnectionPool, optional): Connection pool settings (total and per-host limits,
+                keep-alive, DNS cache) applied to sessions created by `session_decorator`. Also collects statistics
+                of connections opened vs reused. Ignored when a `session` is passed to `get()`.
+
+            response_cache (scraping.ResponseCache, optional): On-disk cache of responses. Cached responses are
+                passed to `on_response` right away, without sending a request or waiting for rate limits.
+                Responses received from the network are stored if their status is cacheable.
+
+            circuit_breaker (scraping.CircuitBreaker, optional): Parks hosts that keep failing. Requests to
+                a parked host are deferred (raising `RetryRequested`) before they take a rate limiting slot.
+
+            request_timeout (float | aiohttp.ClientTimeout, optional): Timeout applied to each request, overriding
+                the session-wide one. A number limits the total time of a request in seconds, while
+                `aiohttp.ClientTimeout` sets connect and read timeouts separately. Timeouts raise
+                `asyncio.TimeoutError`, which is retried by the default `RetryPolicy`. `on_request` callbacks
+                may return a `timeout` for individual URLs.
+
+            hedging_policy (scraping.HedgingPolicy, optional): Sends a duplicate request when a response
+                takes longer than the observed latency percentile of its host, using the first one received.
+
+            proxy_pool (scraping.ProxyPool, optional): Distributes requests across several proxies, capping
+                concurrency per proxy and evicting slow or failing ones. A `proxy` returned by `on_request`
+                takes precedence over the pool.
+
+            transport (scraping.Transport, optional): Sends the requests. Defaults to `AiohttpTransport`, which uses
+                the aiohttp session of the run. `HttpxTransport` multiplexes requests over HTTP/2 connections.
+
+            follow_up_cache (scraping.FollowUpCache, optional): Deduplicates GET requests that `on_response`
+                callbacks send through the provided `session` (which is wrapped into a `FollowUpSession`).
         """
+        self.retry_policy = retry_policy
+        self.max_body_size = max_body_size
+        self.response_filter = response_filter
+        self.chunk_size = chunk_size
+        self.connection_pool = connection_pool
+        self.response_cache = response_cache
+        self.circuit_breaker = circuit_breaker
+        self.request_timeout = (
+            aiohttp.ClientTimeout(total=request_timeout)
+            if isinstance(request_timeout, (int, float))
+            else request_timeout
+        )
+        self.hedging_policy = hedging_policy
+        self.proxy_pool = proxy_pool
+        self.transport = transport if transport is not None else AiohttpTransport()
+        self.follow_up_cache = follow_up_cache
+        # Size and number of bodies read but not yet processed by `on_response` (e.g., written to the output file)
+        self._bytes_in_flight = 0
+        self._responses_in_flight = 0
+        # Moving average, used to estimate the size of responses that haven't been received yet
+        self._average_body_size = 0.0
+        self._request_options: Dict[str, RequestOptions] = {}
 
         def handle_response_status(**kwargs: Unpack[TerminationFuncKwargs]) -> Exception | None:
             status_details = {
@@ -76,11 +216,12 @@ class Fetcher(ABC):
     @abstractmethod
     async def get(
         self,
-        urls: List[str],
+        urls: UrlSource,
         on_response: OnResponseCallback,
         on_request: OnRequestCallback | None,
         min_request_delay: int | float | None,
         session: ClientSession | None,
+        rate_limiter: RateLimiter | None = None,
         **kwargs: Dict[str, Any] | None,
     ) -> None:
         """Asynchronously fetches content from a list of URLs.
@@ -90,7 +231,7 @@ class Fetcher(ABC):
         non-abstract implementation for this method.
 
         Args:
-            urls (List[str]): A list of URLs to fetch.
+            urls (UrlSource): A list, iterable or async iterable of URLs to fetch. Consumed lazily.
             on_response (scraping.OnResponseCallback): A synchronous or asynchronous callback
                 function executed for each URL successfully fetched. It receives keyword
                 arguments as defined in `ResponseHandlerKwargs`: `response: scraping.BasicResponse`
@@ -101,7 +242,8 @@ class Fetcher(ABC):
 
             on_request (scraping.OnRequestCallback, optional): A synchronous or asynchronous
                 callback function executed just before each HTTP request is made. It receives
-                the URL being requested. Implementations must ensure this callback is passed
+                the URL being requested and may return `RequestOptions` (e.g., extra `headers`)
+                to be applied to the request. Implementations must ensure this callback is passed
                 to `self._do_request`.
 
             min_request_delay (int | float, optional): The minimum delay in seconds to wait
@@ -111,6 +253,10 @@ class Fetcher(ABC):
             session (aiohttp.ClientSession, optional): The HTTP client session to use for requests.
                 To automate session management apply scrapping.session_decorator to `get()` implementation.
 
+            rate_limiter (scraping.RateLimiter, optional): Per-host rate and concurrency limits.
+                Takes precedence over `min_request_delay` when provided. Implementations must ensure
+                it is passed to `self._do_request`.
+
         Returns:
             None: This method does not return any value directly. For flexibility, fetching
             results and status are handled on a per-response basis via the `on_request` and
@@ -121,51 +267,412 @@ class Fetcher(ABC):
         """
         pass
 
+    async def stream(
+        self,
+        urls: UrlSource,
+        on_request: OnRequestCallback | None = None,
+        min_request_delay: int | float = 0,
+        session: ClientSession | None = None,
+        rate_limiter: RateLimiter | None = None,
+        buffer_size: int = 16,
+        **kwargs: Dict[str, Any] | None,
+    ) -> AsyncIterator[BasicResponse]:
+        """Fetches content from a list of URLs, yielding responses as they are received.
+
+        Built on top of `get()`, so it works with any `Fetcher` implementation. Applies backpressure:
+        at most `buffer_size` requests are in flight and at most `buffer_size` responses are waiting to be
+        consumed, so a slow consumer pauses fetching instead of accumulating responses in memory.
+        Exceptions raised by the fetcher (e.g., termination criteria) are re-raised once buffered responses
+        are consumed. Breaking out of the loop cancels requests that are still in flight.
+
+        Args:
+            urls (UrlSource): A list, iterable or async iterable of URLs to fetch. Consumed lazily.
+
+            on_request (scraping.OnRequestCallback, optional): A callback executed just before each HTTP request.
+
+            min_request_delay (int | float, optional): The minimum delay in seconds between consecutive requests.
+
+            session (aiohttp.ClientSession, optional): The HTTP client session to use for requests.
+
+            rate_limiter (scraping.RateLimiter, optional): Per-host rate and concurrency limits.
+
+            buffer_size (int, optional): The maximum number of received responses waiting to be consumed.
+                Also limits the number of requests in flight.
+
+            **kwargs: Parameters passed to `aiohttp.ClientSession` when a new session is created.
+
+        Yields:
+            BasicResponse: Responses in the order they are received.
+
+        Examples:
+            >>> from arc_crawler import ParallelFetcher
+            >>> async def main():
+            ...     async for response in ParallelFetcher(max_concurrent_requests=8).stream(urls):
+            ...         print(response["url"], response["status"])
+        """
+        responses: asyncio.Queue[BasicResponse] = asyncio.Queue(maxsize=buffer_size)
+
+        async def enqueue_response(**kw):
+            await responses.put(kw["response"])
+
+        # Requests of this stream only (tasks inherit the context) wait for a slot before being sent
+        context = contextvars.copy_context()
+        context.run(_stream_slots.set, asyncio.Semaphore(buffer_size))
+        producer = asyncio.create_task(
+            self.get(
+                urls=urls,
+                on_response=enqueue_response,
+                on_request=on_request,
+                min_request_delay=min_request_delay,
+                session=session,
+                **({"rate_limiter": rate_limiter} if rate_limiter is not None else {}),
+                **kwargs,
+            ),
+            context=context,
+        )
+
+        try:
+            while not (producer.done() and responses.empty()):
+                next_response = asyncio.ensure_future(responses.get())
+                await asyncio.wait({next_response, producer}, return_when=asyncio.FIRST_COMPLETED)
+                if not next_response.done():
+                    # Fetching is over: buffered responses are drained before the loop ends
+                    next_response.cancel()
+                    continue
+
+                yield next_response.result()
+
+            producer.result()
+        finally:
+            if not producer.done():
+                producer.cancel()
+                await asyncio.gather(producer, return_exceptions=True)
+
     async def _do_request(
         self,
         session: ClientSession,
         url: str,
-        on_response: OnResponseCallback,
+        on_response: OnResponseCallback | None,
         on_request: OnRequestCallback | None = None,
+        rate_limiter: RateLimiter | None = None,
+        attempt: int = 1,
     ):
-        if on_request is not None and callable(on_request):
-            before_request = on_request(url=url)
-            if inspect.isawaitable(before_request):
-                await before_request
+        """Sends a request and passes its response to `on_response`.
 
-        response = await session.get(url)
+        If `on_response` is `None`, the response and its body size are returned instead. The body stays counted
+        in `bytes_in_flight` until the response is passed to `_notify_response`.
 
-        exception = self._validate_status(status_code=response.status, url=url)
-        if exception:
-            raise exception
+        Raises:
+            RetryRequested: If the request failed and should be sent again as `attempt + 1`
+                after `delay` seconds. Calling fetcher is responsible for scheduling the retry.
+        """
+        # Set by `stream()`: a slot is held until the response is buffered, so slow consumers pause fetching
+        stream_slots = _stream_slots.get()
+        async with stream_slots if stream_slots is not None else nullcontext():
+            return await self._handle_request(session, url, on_response, on_request, rate_limiter, attempt)
 
-        content_type = response.headers.get("Content-Type", "").lower()
+    async def _handle_request(
+        self,
+        session: ClientSession,
+        url: str,
+        on_response: OnResponseCallback | None,
+        on_request: OnRequestCallback | None,
+        rate_limiter: RateLimiter | None,
+        attempt: int,
+    ):
+        cached = None
+        if attempt == 1 and self.response_cache is not None:
+            cached = await self.response_cache.load(self._get_cache_key(session, url))
+
+        if cached is not None:
+            # Cache hits don't reach the network, so they aren't subject to rate limits
+            await self._notify_request(url, on_request)
+            self._request_options.pop(url, None)
+            body_size = len(cached["body"])
+            self._charge_body(body_size)
+            try:
+                payload_obj = self._build_payload(
+                    url, cached["status"], URL(cached["url"]), cached["headers"], cached["body"], cached["encoding"]
+                )
+            except BaseException:
+                self._release_body(body_size)
+                raise
+            return await self._deliver(payload_obj, body_size, session, on_response)
+
+        if self.circuit_breaker is not None:
+            delay = self.circuit_breaker.before_request(url)
+            if delay is not None:
+                # Deferred URLs keep their attempt number, since they haven't been requested
+                raise RetryRequested(url, attempt - 1, delay, reason="Circuit of the host is open")
+
+        received = None
+        try:
+            # Rate limiting slot is only held while the request is in flight, not while `on_response` is running
+            async with rate_limiter.acquire(url) if rate_limiter is not None else nullcontext():
+                if attempt == 1:
+                    await self._notify_request(url, on_request)
+                request_options = self._request_options.get(url)
+
+                retry_exceptions = self.retry_policy.retry_exceptions if self.retry_policy is not None else ()
+                is_retry_requested = False
+                try:
+                    # Proxy slot is held until the body is read, since the whole transfer goes through the proxy.
+                    # Proxies returned by `on_request` take precedence, so no slot is taken for them
+                    uses_pool = self.proxy_pool is not None and "proxy" not in (request_options or {})
+                    async with self.proxy_pool.acquire() if uses_pool else nullcontext() as proxy:
+                        received = await self._request(
+                            session=session,
+                            url=url,
+                            rate_limiter=rate_limiter,
+                            attempt=attempt,
+                            request_options={"proxy": proxy, **(request_options or {})} if proxy else request_options,
+                        )
+                except RetryRequested:
+                    is_retry_requested = True
+                    raise
+                except retry_exceptions as e:
+                    if not self.retry_policy.should_retry(RateLimiter.get_host(url), attempt, exception=e):
+                        raise
+                    is_retry_requested = True
+                    raise RetryRequested(url, attempt, self.retry_policy.get_delay(attempt), reason=repr(e)) from e
+                finally:
+                    if not is_retry_requested:
+                        self._request_options.pop(url, None)
+        except BaseException:
+            # Body was read, but releasing the proxy or rate limiting slot was interrupted (e.g., by cancellation)
+            if received is not None:
+                self._release_body(received[1])
+            raise
+
+        # Response was rejected by `response_filter` or exceeded `max_body_size`
+        if received is None:
+            return None
+
+        payload_obj, body_size = received
+        return await self._deliver(payload_obj, body_size, session, on_response)
+
+    async def _deliver(
+        self, payload_obj: BasicResponse, body_size: int, session: ClientSession, on_response: OnResponseCallback | None
+    ):
+        if on_response is None:
+            return payload_obj, body_size
+        return await self._notify_response(payload_obj, session, on_response, body_size=body_size)
+
+    async def _notify_request(self, url: str, on_request: OnRequestCallback | None):
+        if on_request is None or not callable(on_request):
+            return
+
+        before_request = on_request(url=url)
+        if inspect.isawaitable(before_request):
+            before_request = await before_request
+        if isinstance(before_request, dict) and before_request:
+            # Options are kept for retries, which don't trigger `on_request` again
+            self._request_options[url] = before_request
+
+    @property
+    def bytes_in_flight(self) -> int:
+        """The total size of response bodies read, but not yet processed by `on_response` callbacks."""
+        return self._bytes_in_flight
+
+    def _charge_body(self, body_size: int):
+        self._bytes_in_flight += body_size
+        self._responses_in_flight += 1
+        self._average_body_size += 0.1 * (body_size - self._average_body_size)
+
+    def _release_body(self, body_size: int):
+        self._bytes_in_flight -= body_size
+        self._responses_in_flight -= 1
+
+    async def _notify_response(
+        self, payload_obj: BasicResponse, session: ClientSession, on_response: OnResponseCallback, body_size: int
+    ):
+        """Passes the response to `on_response` and releases its body, charged by `_charge_body` once it was read."""
+        if self.follow_up_cache is not None:
+            session = self.follow_up_cache.wrap(session)
+        kwargs = {"response": payload_obj, "session": session}
+
+        try:
+            if inspect.iscoroutinefunction(on_response):
+                return await on_response(**kwargs)
+            else:
+                return on_response(**kwargs)
+        finally:
+            self._release_body(body_size)
+
+    def _record_outcome(
+        self,
+        url: str,
+        proxy: str | None,
+        latency: float | None = None,
+        status: int | None = None,
+        exception: BaseException | None = None,
+    ):
+        if self.circuit_breaker is not None:
+            self.circuit_breaker.record(url, status=status, exception=exception)
+        if self.proxy_pool is not None and proxy is not None:
+            self.proxy_pool.record(proxy, latency=latency, status=status, exception=exception)
+
+    def _get_cache_key(self, session: ClientSession, url: str) -> str:
+        # Keyed by session headers only: per-request options (e.g., conditional headers) don't change the content
+        return self.response_cache.get_key("GET", url, session.headers)
+
+    async def _request(
+        self,
+        session: ClientSession,
+        url: str,
+        rate_limiter: RateLimiter | None = None,
+        attempt: int = 1,
+        request_options: RequestOptions | None = None,
+    ) -> Tuple[BasicResponse, int] | None:
+        """Sends the request and reads the response.
+
+        Returns:
+            tuple[BasicResponse, int] | None: The response and its body size in bytes, or `None` if it was skipped.
+        """
+        loop = asyncio.get_running_loop()
+        request_start = loop.time()
+        proxy = request_options.get("proxy") if request_options else None
+        try:
+            response = await self._send(session, url, request_options)
+        except BaseException as e:
+            self._record_outcome(url, proxy, exception=e)
+            raise
+        latency = loop.time() - request_start
+        # Outcome is recorded once the body is read (or the response is dropped), so failed transfers count as failures
+        read_exception = None
+        try:
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+
+            if rate_limiter is not None:
+                is_throttled = rate_limiter.feedback(
+                    url, status=response.status, latency=latency, retry_after=retry_after
+                )
+                # Throttled requests are re-queued right away: limiter itself holds them back until the host is ready
+                if (
+                    is_throttled
+                    and isinstance(rate_limiter, AdaptiveRateLimiter)
+                    and attempt <= rate_limiter.max_retries
+                ):
+                    await response.release()
+                    raise RetryRequested(url, attempt, 0, reason=f"[{response.status}] Throttled by the server")
+
+            if self.retry_policy is not None and self.retry_policy.should_retry(
+                RateLimiter.get_host(url), attempt, status=response.status
+            ):
+                await response.release()
+                raise RetryRequested(
+                    url, attempt, self.retry_policy.get_delay(attempt, retry_after), reason=f"[{response.status}]"
+                )
+
+            exception = self._validate_status(status_code=response.status, url=url)
+            if exception:
+                await response.release()
+                raise exception
+
+            if self.response_filter is not None and not self.response_filter(
+                url=url, status=response.status, headers=response.headers
+            ):
+                logger.warning(f'[{response.status}] "{url}" was rejected by response_filter. Skipping download...')
+                # Closing instead of releasing drops the connection, so the body is never transferred
+                await response.close()
+                return None
+
+            try:
+                body = await self._read_body(response, url)
+            except BaseException as e:
+                read_exception = e
+                raise
+        finally:
+            self._record_outcome(url, proxy, latency=latency, status=response.status, exception=read_exception)
+        if body is None:
+            return None
+
+        # Body is counted against `max_bytes_in_flight` from now on, until `on_response` is done with it
+        self._charge_body(len(body))
+        try:
+            encoding = response.get_encoding()
+            if self.response_cache is not None and self.response_cache.is_cacheable(response.status):
+                entry: CachedResponse = {
+                    "status": response.status,
+                    "url": str(response.url),
+                    "headers": {key: response.headers[key] for key in CACHED_HEADERS if key in response.headers},
+                    "encoding": encoding,
+                    "stored_at": time(),
+                    "body": body,
+                }
+                await self.response_cache.store(self._get_cache_key(session, url), entry)
+
+            payload_obj = self._build_payload(url, response.status, response.url, response.headers, body, encoding)
+        except BaseException:
+            self._release_body(len(body))
+            raise
+        return payload_obj, len(body)
+
+    async def _send(
+        self, session: ClientSession, url: str, request_options: RequestOptions | None
+    ) -> TransportResponse:
+        options: RequestOptions = dict(request_options or {})
+        if self.request_timeout is not None:
+            options.setdefault("timeout", self.request_timeout)
+        if self.hedging_policy is None:
+            return await self.transport.get(session, url, options)
+        return await self.hedging_policy.send(
+            url, request=lambda: self.transport.get(session, url, options), release=lambda response: response.release()
+        )
+
+    @staticmethod
+    def _build_payload(
+        url: str, status: int, response_url: URL, headers: Mapping[str, str], body: bytes, encoding: str
+    ) -> BasicResponse:
+        content_type = headers.get("Content-Type", "").lower()
 
         payload_obj = {
             "text": "",
             "json": {},
-            "status": response.status,
-            "ok": response.ok,
-            "url": response.url,
+            "status": status,
+            "ok": status < 400,
+            "url": response_url,
+            # The URL as requested, before redirects
+            "request_url": url,
+            "etag": headers.get("ETag"),
+            "last_modified": headers.get("Last-Modified"),
         }
         if "application/json" in content_type:
             try:
-                payload_obj["json"] = await response.json(
-                    encoding="utf-8", loads=json.loads, content_type="application/json"
-                )
-            except aiohttp.ContentTypeError:
-                logger.warning(f"Unable to process JSON from '{url}'. It could be a malformed.")
+                payload_obj["json"] = json_loads(body)
             except Exception as e:
-                logger.warning(f"Unable to process JSON from '{url}'. Details: {e}")
+                logger.warning(f"Unable to process JSON from '{url}'. It could be a malformed. Details: {e}")
         else:
-            payload_obj["text"] = await response.text()
+            payload_obj["text"] = body.decode(encoding)
+
+        return payload_obj
+
+    async def _read_body(self, response: TransportResponse, url: str) -> bytes | None:
+        if self.max_body_size is None:
+            return await response.read()
+
+        content_length = response.headers.get("Content-Length")
+        if content_length is not None and content_length.isdigit() and int(content_length) > self.max_body_size:
+            logger.warning(
+                f'"{url}" declares body of {convert_size(int(content_length))}, '
+                f"exceeding max_body_size of {convert_size(self.max_body_size)}. Skipping download..."
+            )
+            await response.close()
+            return None
+
+        # Content-Length may be missing or wrong, so the limit is also enforced while reading
+        body = bytearray()
+        async for chunk in response.iter_chunked(self.chunk_size):
+            body.extend(chunk)
+            if len(body) > self.max_body_size:
+                logger.warning(
+                    f'"{url}" body exceeded max_body_size of {convert_size(self.max_body_size)}. Aborting download...'
+                )
+                await response.close()
+                return None
 
-        kwargs = {"response": payload_obj, "session": session}
-
-        if inspect.iscoroutinefunction(on_response):
-            return await on_response(**kwargs)
-        else:
-            return on_response(**kwargs)
+        await response.release()
+        return bytes(body)
 
     @classmethod
     @asynccontextmanager
@@ -216,7 +723,12 @@ class ParallelFetcher(Fetcher):
     """
 
     def __init__(
-        self, max_concurrent_requests: int | None = None, termination_criteria: TerminationCriteria | None = None
+        self,
+        max_concurrent_requests: int | None = None,
+        termination_criteria: TerminationCriteria | None = None,
+        retry_policy: RetryPolicy | None = None,
+        max_bytes_in_flight: int | None = None,
+        **kwargs: Unpack[FetcherOptions],
     ):
         """Initializes a `ParallelFetcher` instance.
 
@@ -227,8 +739,9 @@ class ParallelFetcher(Fetcher):
 
                         * If set to `None` (default), the fetcher will attempt to run as many requests
                           concurrently as network and system resources allow. Use with caution for very large URL lists.
-                        * Setting an integer value limits the number of simultaneous function calls,
-                          helping to prevent resource exhaustion.
+                        * Setting an integer value limits the number of requests in flight at a time.
+                          URLs are pulled from the input only when a slot frees up, so memory usage
+                          stays flat regardless of the URL list size.
 
             termination_criteria (TerminationCriteria): Defines when the fetcher should stop processing requests
                         based on status codes or custom logic. This argument accepts one of two types:
@@ -243,6 +756,20 @@ class ParallelFetcher(Fetcher):
                           This function should return an `Exception` instance,
                           which will be raised to terminate the process.
                           Use this to explicitly handle irregular cases.
+
+            retry_policy (scraping.RetryPolicy, optional): Defines which failed requests are sent again.
+                        URLs waiting for a retry are re-queued and don't occupy concurrency slots.
+
+            max_bytes_in_flight (int, optional): The memory budget in bytes for response bodies that were read,
+                        but not yet processed by `on_response` (e.g., written to the output file). New requests
+                        are not sent while it's exceeded, and admission resumes as responses are processed.
+                        Requests still in flight are counted at the average body size received so far.
+                        Allows aggressive `max_concurrent_requests` for sites with large pages. Combine it with
+                        `max_body_size` to bound the size of a single response. Defaults to `None` (no budget).
+
+            **kwargs (FetcherOptions): Other options supported by all fetchers (e.g., `max_body_size`).
+                        See `Fetcher.__init__` for details.
+
         Examples:
 
                 1. To initialize with minimal arguments:
@@ -255,15 +782,18 @@ class ParallelFetcher(Fetcher):
                 >>> from arc_crawler import ParallelFetcher
                 >>> fetcher = ParallelFetcher(termination_criteria=[range(300, 600)])
         """
-        super().__init__(termination_criteria)
+        super().__init__(termination_criteria, retry_policy, **kwargs)
         self.max_concurrent_requests = max_concurrent_requests
+        self.max_bytes_in_flight = max_bytes_in_flight
 
     @session_decorator
-    async def get(self, urls, on_response, session: ClientSession, on_request=None, min_request_delay=0):
+    async def get(
+        self, urls, on_response, session: ClientSession, on_request=None, min_request_delay=0, rate_limiter=None
+    ):
         """Asynchronously fetches content from a list of URLs.
 
         Args:
-            urls (List[str]): A list of URLs to fetch.
+            urls (UrlSource): A list, iterable or async iterable of URLs to fetch. Consumed lazily.
 
             on_response (scraping.OnResponseCallback): A synchronous or asynchronous callback
                 function executed for each URL successfully fetched. It receives keyword
@@ -275,7 +805,8 @@ class ParallelFetcher(Fetcher):
 
             on_request (scraping.OnRequestCallback, optional): A synchronous or asynchronous
                 callback function executed just before each HTTP request is made. It receives
-                the URL being requested. Implementations must ensure this callback is passed
+                the URL being requested and may return `RequestOptions` (e.g., extra `headers`)
+                to be applied to the request. Implementations must ensure this callback is passed
                 to `self._do_request`.
 
             min_request_delay (int | float, optional): The minimum delay in seconds to wait
@@ -285,6 +816,10 @@ class ParallelFetcher(Fetcher):
             session (aiohttp.ClientSession, optional): The HTTP client session to use for requests.
                 To automate session management apply scrapping.session_decorator to `get()` implementation.
 
+            rate_limiter (scraping.RateLimiter, optional): Per-host rate and concurrency limits.
+                Requests to unrelated hosts proceed in parallel while each host is throttled independently.
+                Takes precedence over `min_request_delay` when provided.
+
         Examples:
 
                 1. To call with minimal arguments:
@@ -309,35 +844,123 @@ class ParallelFetcher(Fetcher):
                 >>>	fetcher.get(["https://example.com"], on_response=response_writer, min_request_delay=0.5)
         """
 
-        async def run_parallel_tasks():
-            last_request_time = 0
-
-            async def fetch(url: str, target_time: int | float):
-                nonlocal last_request_time
+        loop = asyncio.get_running_loop()
+        limiter = rate_limiter or RateLimiter.from_delay(min_request_delay)
+        pending = set()
+        # Heap of (due time, sequence number, url, attempt) for URLs waiting to be sent again
+        retries = []
+        retry_sequence = itertools.count()
 
-                current_time = asyncio.get_event_loop().time()
-                time_to_sleep = max(
-                    target_time - current_time,
-                    min_request_delay - (current_time - last_request_time),
+        async def fetch(url: str, attempt: int):
+            is_retried = False
+            try:
+                await self._do_request(
+                    session=session,
+                    url=url,
+                    on_response=on_response,
+                    on_request=on_request,
+                    rate_limiter=limiter,
+                    attempt=attempt,
+                )
+            except RetryRequested as retry:
+                logger.info(str(retry))
+                is_retried = True
+                heapq.heappush(retries, (loop.time() + retry.delay, next(retry_sequence), url, retry.attempt + 1))
+            finally:
+                if not is_retried:
+                    mark_url_done(urls, url)
+
+        def collect_finished():
+            # Raises the first exception encountered, so termination criteria stop admission right away
+            finished = {task for task in pending if task.done()}
+            pending.difference_update(finished)
+            exceptions = [task.exception() for task in finished if not task.cancelled()]
+            exception = next((e for e in exceptions if e is not None), None)
+            if exception is not None:
+                raise exception
+
+        def is_over_budget() -> bool:
+            if self.max_bytes_in_flight is None:
+                return False
+            # Requests sent but not received yet are expected to bring bodies of the average size
+            unread_count = max(0, len(pending) - self._responses_in_flight)
+            expected_bytes = self._bytes_in_flight + unread_count * self._average_body_size
+            return expected_bytes >= self.max_bytes_in_flight
+
+        async def wait_for_slot():
+            is_paused = False
+            # At least one request is always let through, so a single body above the budget doesn't stall the run
+            while pending and (
+                (self.max_concurrent_requests and len(pending) >= self.max_concurrent_requests) or is_over_budget()
+            ):
+                if not is_paused and is_over_budget():
+                    is_paused = True
+                    logger.debug(
+                        f"{convert_size(self._bytes_in_flight)} of responses are waiting to be processed. "
+                        f"Pausing new requests..."
+                    )
+                await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                collect_finished()
+
+        # URLs are pulled one at a time once a slot is free, so at most `max_concurrent_requests` coroutines exist.
+        # Async sources are pulled by a task, so retries and failures are handled while the source
+        # (e.g., a `Frontier` waiting for callbacks to push URLs) is blocked
+        is_async_source = isinstance(urls, AsyncIterable)
+        url_iterator = iterate_urls(urls) if is_async_source else iter(urls)
+        next_url: asyncio.Future | None = None
+        try:
+            is_input_exhausted = False
+            while True:
+                await wait_for_slot()
+                # New URLs are not pulled while more than a window of retries is deferred, so the heap stays bounded
+                is_pulling = not is_input_exhausted and not (
+                    self.max_concurrent_requests and len(retries) > self.max_concurrent_requests
                 )
-                if time_to_sleep > 0:
-                    await asyncio.sleep(time_to_sleep)
-
-                last_request_time = asyncio.get_event_loop().time()
-                await self._do_request(session=session, url=url, on_response=on_response, on_request=on_request)
-
-            tasks = []
-            start_time = asyncio.get_event_loop().time()
-            for index in range(len(urls)):
-                tasks.append(fetch(urls[index], start_time + min_request_delay * index))
-
-            await asyncio.gather(*tasks)
 
-        if self.max_concurrent_requests:
-            async with Semaphore(self.max_concurrent_requests):
-                await run_parallel_tasks()
-        else:
-            await run_parallel_tasks()
+                if retries and retries[0][0] <= loop.time():
+                    _, _, url, attempt = heapq.heappop(retries)
+                elif is_pulling and not is_async_source:
+                    url, attempt = next(url_iterator, None), 1
+                    if url is None:
+                        is_input_exhausted = True
+                        continue
+                elif is_pulling:
+                    if next_url is None:
+                        next_url = asyncio.ensure_future(get_next_url(url_iterator))
+                    if not next_url.done():
+                        timeout = max(0.0, retries[0][0] - loop.time()) if retries else None
+                        await asyncio.wait({next_url, *pending}, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+                        collect_finished()
+                        continue
+
+                    url, attempt, next_url = next_url.result(), 1, None
+                    if url is None:
+                        is_input_exhausted = True
+                        continue
+                elif pending or retries:
+                    # Nothing to send right now: wait for a request to finish or the next retry to become due
+                    timeout = max(0.0, retries[0][0] - loop.time()) if retries else None
+                    if pending:
+                        await asyncio.wait(pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+                    else:
+                        await asyncio.sleep(timeout)
+                    collect_finished()
+                    continue
+                else:
+                    break
+
+                collect_finished()
+                pending.add(asyncio.create_task(fetch(url, attempt)))
+        finally:
+            if next_url is not None:
+                next_url.cancel()
+                await asyncio.gather(next_url, return_exceptions=True)
+            if is_async_source:
+                await url_iterator.aclose()
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
 
 
 class SequentialFetcher(Fetcher):
@@ -362,11 +985,13 @@ class SequentialFetcher(Fetcher):
     """
 
     @session_decorator
-    async def get(self, urls, on_response, session: ClientSession, on_request=None, min_request_delay=0):
+    async def get(
+        self, urls, on_response, session: ClientSession, on_request=None, min_request_delay=0, rate_limiter=None
+    ):
         """Asynchronously fetches content from a list of URLs.
 
         Args:
-            urls (List[str]): A list of URLs to fetch.
+            urls (UrlSource): A list, iterable or async iterable of URLs to fetch. Consumed lazily.
             on_response (scraping.OnResponseCallback): A synchronous or asynchronous callback
                 function executed for each URL successfully fetched. It receives keyword
                 arguments as defined in `ResponseHandlerKwargs`: `response: scraping.BasicResponse`
@@ -377,7 +1002,8 @@ class SequentialFetcher(Fetcher):
 
             on_request (scraping.OnRequestCallback, optional): A synchronous or asynchronous
                 callback function executed just before each HTTP request is made. It receives
-                the URL being requested. Implementations must ensure this callback is passed
+                the URL being requested and may return `RequestOptions` (e.g., extra `headers`)
+                to be applied to the request. Implementations must ensure this callback is passed
                 to `self._do_request`.
 
             min_request_delay (int | float, optional): The minimum delay in seconds to wait
@@ -387,6 +1013,9 @@ class SequentialFetcher(Fetcher):
             session (aiohttp.ClientSession, optional): The HTTP client session to use for requests.
                 To automate session management apply scrapping.session_decorator to `get()` implementation.
 
+            rate_limiter (scraping.RateLimiter, optional): Per-host rate limits. Takes precedence over
+                `min_request_delay` when provided, so consecutive requests to different hosts are not delayed.
+
         Examples:
 
                         1. To call with minimal arguments:
@@ -406,14 +1035,169 @@ class SequentialFetcher(Fetcher):
                         ...         output.write(json.dumps(kwargs["response"], ensure_ascii=False))
                         >>>	fetcher.get(["https://example.com"], on_response=response_writer, min_request_delay=0.5)
         """
-        last_finished_time = 0
-        for index in range(len(urls)):
-            url = urls[index]
+        if rate_limiter is not None:
+            min_request_delay = 0
 
+        last_finished_time = 0
+        async for url in iterate_urls(urls):
             request_delta = asyncio.get_event_loop().time() - last_finished_time
 
             if request_delta < min_request_delay:
                 await asyncio.sleep(min_request_delay - request_delta)
 
-            await self._do_request(session=session, url=url, on_request=on_request, on_response=on_response)
+            attempt = 1
+            while True:
+                try:
+                    await self._do_request(
+                        session=session,
+                        url=url,
+                        on_request=on_request,
+                        on_response=on_response,
+                        rate_limiter=rate_limiter,
+                        attempt=attempt,
+                    )
+                    break
+                except RetryRequested as retry:
+                    logger.info(str(retry))
+                    attempt = retry.attempt + 1
+                    await asyncio.sleep(retry.delay)
+            mark_url_done(urls, url)
             last_finished_time = asyncio.get_event_loop().time()
+
+
+class OrderedFetcher(Fetcher):
+    """A `Fetcher` implementation that sends requests in parallel but delivers responses in input order.
+
+    Keeps up to `max_concurrent_requests` requests in flight, while `on_response` callbacks are executed
+    strictly in the order of the provided URLs. Responses received ahead of their turn wait in a reorder buffer
+    of the same size, so a slow response holds back the following ones, but never more than the buffer allows.
+    This produces deterministic output files at a speed close to `ParallelFetcher`.
+
+    Failed requests are retried in place, so they keep their position. Termination exceptions are raised once
+    all the preceding responses are delivered.
+    """
+
+    def __init__(
+        self,
+        max_concurrent_requests: int | None = 10,
+        termination_criteria: TerminationCriteria | None = None,
+        retry_policy: RetryPolicy | None = None,
+        **kwargs: Unpack[FetcherOptions],
+    ):
+        """Initializes an `OrderedFetcher` instance.
+
+        Args:
+            max_concurrent_requests (int, optional): The maximum number of requests in flight, which is
+                also the size of the reorder buffer. Defaults to 10.
+
+            termination_criteria (TerminationCriteria): Defines when the fetcher should stop processing requests.
+                See `Fetcher.__init__` for details.
+
+            retry_policy (scraping.RetryPolicy, optional): Defines which failed requests are sent again.
+
+            **kwargs (FetcherOptions): Other options supported by all fetchers (e.g., `max_body_size`).
+                See `Fetcher.__init__` for details.
+
+        Examples:
+                >>> from arc_crawler import OrderedFetcher
+                >>> fetcher = OrderedFetcher(max_concurrent_requests=16)
+        """
+        super().__init__(termination_criteria, retry_policy, **kwargs)
+        self.max_concurrent_requests = max_concurrent_requests or 10
+
+    @session_decorator
+    async def get(
+        self, urls, on_response, session: ClientSession, on_request=None, min_request_delay=0, rate_limiter=None
+    ):
+        """Asynchronously fetches content from a list of URLs, executing `on_response` in input order.
+
+        Args:
+            urls (UrlSource): A list, iterable or async iterable of URLs to fetch. Consumed lazily.
+
+            on_response (scraping.OnResponseCallback): A synchronous or asynchronous callback executed for each
+                URL successfully fetched, in the same order as `urls`. Receives `response` and `session`.
+
+            on_request (scraping.OnRequestCallback, optional): A synchronous or asynchronous callback executed
+                just before each HTTP request is made.
+
+            min_request_delay (int | float, optional): The minimum delay in seconds between consecutive requests.
+
+            session (aiohttp.ClientSession, optional): The HTTP client session to use for requests.
+
+            rate_limiter (scraping.RateLimiter, optional): Per-host rate and concurrency limits.
+                Takes precedence over `min_request_delay` when provided.
+
+        Examples:
+                >>> from arc_crawler import OrderedFetcher
+                >>> fetcher = OrderedFetcher()
+                >>> fetcher.get(["https://example.com/1", "https://example.com/2"], on_response=print)
+        """
+        limiter = rate_limiter or RateLimiter.from_delay(min_request_delay)
+        # Requests in input order: finished ones wait here until all the preceding responses are delivered
+        reorder_buffer: deque[asyncio.Task] = deque()
+
+        async def fetch(url: str) -> Tuple[str, Tuple[BasicResponse, int] | None]:
+            attempt = 1
+            while True:
+                try:
+                    # Response is returned instead of being processed, its body stays counted until it's delivered
+                    received = await self._do_request(
+                        session=session,
+                        url=url,
+                        on_response=None,
+                        on_request=on_request,
+                        rate_limiter=limiter,
+                        attempt=attempt,
+                    )
+                    return url, received
+                except RetryRequested as retry:
+                    logger.info(str(retry))
+                    attempt = retry.attempt + 1
+                    await asyncio.sleep(retry.delay)
+
+        async def deliver_next():
+            url, received = await reorder_buffer.popleft()
+            # Skipped by `response_filter` or `max_body_size`
+            if received is not None:
+                payload_obj, body_size = received
+                await self._notify_response(payload_obj, session, on_response, body_size=body_size)
+            mark_url_done(urls, url)
+
+        # Finished responses are delivered while waiting for the next URL, since an async source
+        # (e.g., a `Frontier`) may only produce it after callbacks of the buffered ones are executed
+        url_iterator = iterate_urls(urls)
+        next_url: asyncio.Future | None = None
+        try:
+            while True:
+                if len(reorder_buffer) >= self.max_concurrent_requests:
+                    await deliver_next()
+                    continue
+
+                if next_url is None:
+                    next_url = asyncio.ensure_future(get_next_url(url_iterator))
+                head = [reorder_buffer[0]] if reorder_buffer else []
+                await asyncio.wait({next_url, *head}, return_when=asyncio.FIRST_COMPLETED)
+                if reorder_buffer and reorder_buffer[0].done():
+                    await deliver_next()
+                    continue
+
+                url, next_url = next_url.result(), None
+                if url is None:
+                    break
+                reorder_buffer.append(asyncio.create_task(fetch(url)))
+
+            while reorder_buffer:
+                await deliver_next()
+        finally:
+            if next_url is not None:
+                next_url.cancel()
+                await asyncio.gather(next_url, return_exceptions=True)
+            await url_iterator.aclose()
+            for task in reorder_buffer:
+                task.cancel()
+            if reorder_buffer:
+                results = await asyncio.gather(*reorder_buffer, return_exceptions=True)
+                # Responses that were received but never delivered
+                for result in results:
+                    if isinstance(result, tuple) and result[1] is not None:
+                        self._release_body(result[1][1])
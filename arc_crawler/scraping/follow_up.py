@@ -0,0 +1,256 @@
+import asyncio
+from collections import OrderedDict
+from time import monotonic
+from typing import Any, Callable, Dict, Generator, Hashable, Mapping, Tuple
+
+from aiohttp import ClientSession, ClientResponseError, RequestInfo
+from yarl import URL
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+from arc_crawler.utils import json_loads
+from .types import FollowUpStats
+
+# Request arguments that are part of the memo key. Requests with other arguments are sent as is
+KEYED_ARGUMENTS = {"params", "headers"}
+
+
+class FollowUpResponse:
+    """A fully read response shared by all callers requesting the same URL.
+
+    Mirrors the commonly used part of `aiohttp.ClientResponse`: `status`, `headers`, `url`, `read()`, `text()`
+    and `json()`. It can be awaited or used as an async context manager, like responses of `ClientSession.get()`.
+    """
+
+    def __init__(
+        self, status: int, reason: str | None, headers: Mapping[str, str], url: URL, body: bytes, encoding: str
+    ):
+        self.status = status
+        self.reason = reason
+        self.headers = headers
+        self.url = url
+        self.body = body
+        self.encoding = encoding
+
+    @property
+    def ok(self) -> bool:
+        return self.status < 400
+
+    def get_encoding(self) -> str:
+        return self.encoding
+
+    async def read(self) -> bytes:
+        return self.body
+
+    async def text(self, encoding: str | None = None, errors: str = "strict") -> str:
+        return self.body.decode(encoding or self.encoding, errors=errors)
+
+    async def json(self, *, encoding: str | None = None, loads: Callable[[Any], Any] = json_loads, **_) -> Any:
+        if not self.body.strip():
+            return None
+        return loads(self.body.decode(encoding or self.encoding))
+
+    def raise_for_status(self):
+        if not self.ok:
+            request_info = RequestInfo(self.url, "GET", self.headers, self.url)
+            raise ClientResponseError(request_info, (), status=self.status, message=self.reason or "")
+
+    def release(self):
+        pass
+
+    def close(self):
+        pass
+
+    async def __aenter__(self) -> "FollowUpResponse":
+        return self
+
+    async def __aexit__(self, *_):
+        pass
+
+
+class _FollowUpRequest:
+    """Makes `session.get()` both awaitable and usable as an async context manager, like in aiohttp."""
+
+    def __init__(self, request):
+        self._request = request
+
+    def __await__(self) -> Generator[Any, None, FollowUpResponse]:
+        return self._request.__await__()
+
+    async def __aenter__(self) -> FollowUpResponse:
+        return await self._request
+
+    async def __aexit__(self, *_):
+        pass
+
+
+class FollowUpSession:
+    """Wraps the session passed to `on_response` callbacks, sending GET requests through a `FollowUpCache`.
+
+    Other methods and attributes are taken from the wrapped `aiohttp.ClientSession`.
+    """
+
+    def __init__(self, session: ClientSession, cache: "FollowUpCache"):
+        self.session = session
+        self._cache = cache
+
+    def get(self, url: str | URL, **kwargs) -> _FollowUpRequest:
+        return _FollowUpRequest(self._cache.fetch(self.session, url, **kwargs))
+
+    def __getattr__(self, name: str):
+        return getattr(self.session, name)
+
+
+class FollowUpCache:
+    """Deduplicates follow-up requests sent by response processors through the provided `session`.
+
+    When many responses trigger the same follow-up URL at once (e.g., details of the same user), only one request
+    is sent: callers requesting a URL that is already in flight wait for its response (single-flight). Successful
+    responses are also kept in memory for `ttl` seconds, up to `max_entries` of them (least recently used ones are
+    evicted first), so later requests of the URL don't reach the network at all.
+
+    Responses are read completely and shared by all callers, so they are returned as `FollowUpResponse`.
+    Only GET requests (with optional `params` and `headers`) are deduplicated.
+
+    Example:
+            >>> from arc_crawler import Crawler, FollowUpCache
+            >>> async def add_author(**kwargs):
+            ...     response, session = kwargs["response"], kwargs["session"]
+            ...     author = await session.get(f"https://example.com/users/{response['json']['userId']}")
+            ...     return {**response["json"], "author": await author.json()}
+            >>> crawler = Crawler(follow_up_cache=FollowUpCache(max_entries=1000, ttl=300))
+    """
+
+    def __init__(self, max_entries: int = 1024, ttl: float | None = 300, max_entry_size: int | None = 1024 * 1024):
+        """Initializes a `FollowUpCache` instance.
+
+        Args:
+            max_entries (int, optional): The maximum number of responses kept in memory. Defaults to 1024.
+                `0` disables memoization, so only requests in flight are deduplicated.
+
+            ttl (float, optional): Seconds a response is reused for. Defaults to 300. `None` keeps responses
+                until they are evicted.
+
+            max_entry_size (int, optional): The maximum body size in bytes of a kept response. Defaults to 1 MiB.
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.max_entry_size = max_entry_size
+
+        self._memo: OrderedDict[Hashable, Tuple[FollowUpResponse, float]] = OrderedDict()
+        self._stats: FollowUpStats = {}
+        self.reset_stats()
+        # Tasks are bound to the loop they were created in, so they are kept per loop
+        self._in_flight: Dict[Hashable, asyncio.Task] = {}
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    def reset_stats(self):
+        self._stats = {"requests": 0, "fetched": 0, "coalesced": 0, "memo_hits": 0}
+
+    @property
+    def stats(self) -> FollowUpStats:
+        return FollowUpStats(**self._stats)
+
+    @property
+    def hit_rate(self) -> float:
+        """The share of requests served without a request of their own."""
+        requests = self._stats["requests"]
+        return (self._stats["coalesced"] + self._stats["memo_hits"]) / requests if requests else 0.0
+
+    def wrap(self, session: ClientSession) -> FollowUpSession:
+        return FollowUpSession(session, self)
+
+    def clear(self):
+        self._memo.clear()
+
+    @staticmethod
+    def get_key(url: str | URL, kwargs: Dict[str, Any]) -> Hashable | None:
+        if not KEYED_ARGUMENTS.issuperset(kwargs):
+            return None
+        try:
+            return (
+                str(url),
+                tuple(sorted((kwargs.get("params") or {}).items())),
+                tuple(sorted((key.lower(), value) for key, value in (kwargs.get("headers") or {}).items())),
+            )
+        except (AttributeError, TypeError):
+            # E.g., params passed as a string or a list of pairs
+            return None
+
+    def _get_in_flight(self) -> Dict[Hashable, asyncio.Task]:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._in_flight = {}
+        return self._in_flight
+
+    def _load(self, key: Hashable) -> FollowUpResponse | None:
+        entry = self._memo.get(key)
+        if entry is None:
+            return None
+        response, stored_at = entry
+        if self.ttl is not None and monotonic() - stored_at >= self.ttl:
+            del self._memo[key]
+            return None
+        self._memo.move_to_end(key)
+        return response
+
+    def _store(self, key: Hashable, response: FollowUpResponse):
+        if not self.max_entries or not response.ok:
+            return
+        if self.max_entry_size is not None and len(response.body) > self.max_entry_size:
+            return
+        self._memo[key] = (response, monotonic())
+        self._memo.move_to_end(key)
+        while len(self._memo) > self.max_entries:
+            self._memo.popitem(last=False)
+
+    async def fetch(self, session: ClientSession, url: str | URL, **kwargs) -> FollowUpResponse:
+        """Sends a GET request, unless the same one is in flight or its response is kept."""
+        self._stats["requests"] += 1
+        key = self.get_key(url, kwargs)
+        if key is None:
+            self._stats["fetched"] += 1
+            return await self._request(session, url, **kwargs)
+
+        response = self._load(key)
+        if response is not None:
+            self._stats["memo_hits"] += 1
+            return response
+
+        in_flight = self._get_in_flight()
+        task = in_flight.get(key)
+        if task is not None:
+            self._stats["coalesced"] += 1
+        else:
+            self._stats["fetched"] += 1
+            task = in_flight[key] = asyncio.ensure_future(self._request(session, url, **kwargs))
+            task.add_done_callback(lambda done: self._on_fetched(key, done))
+        # Cancelling one of the callers doesn't cancel the request awaited by the others
+        return await asyncio.shield(task)
+
+    def _on_fetched(self, key: Hashable, task: asyncio.Task):
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        # Retrieved here, so errors of requests whose callers were cancelled are not reported as unhandled
+        if not task.cancelled() and task.exception() is None:
+            self._store(key, task.result())
+
+    @staticmethod
+    async def _request(session: ClientSession, url: str | URL, **kwargs) -> FollowUpResponse:
+        async with session.get(url, **kwargs) as response:
+            body = await response.read()
+            return FollowUpResponse(
+                response.status, response.reason, response.headers, response.url, body, response.get_encoding()
+            )
+
+    def log_stats(self):
+        stats = self._stats
+        if not stats["requests"]:
+            return
+        logger.info(
+            f"Follow-up requests: {stats['requests']} in total, {stats['fetched']} sent, "
+            f"{stats['coalesced']} coalesced, {stats['memo_hits']} served from memory ({self.hit_rate:.0%} hit rate)"
+        )
@@ -0,0 +1,258 @@
+import asyncio
+import heapq
+import itertools
+import os
+import tempfile
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Set, Tuple
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+from arc_crawler.utils import json_dumps, json_loads
+
+# Heap entries: (negated priority, sequence number, url). Sequence numbers keep FIFO order within a priority
+# and identify the current entry of a URL, so entries left behind by re-prioritization are skipped
+FrontierEntry = Tuple[float, int, str]
+
+
+class Frontier:
+    """A priority queue of URLs that can be extended while crawling.
+
+    URLs with higher priority are fetched first, URLs with equal priority are fetched in the order they were pushed.
+    Pass a `Frontier` as `urls` to any fetcher or `Crawler.get()`, and push newly discovered URLs from callbacks
+    (e.g., `response_processor`): iteration ends only when the frontier is empty and all the URLs taken from it
+    are processed, since their callbacks may still push new URLs.
+
+    With `max_memory_items` set, the least important URLs are spilled to a temporary file once the in-memory heap
+    grows beyond the limit, and loaded back when they are up next. Each spill is appended as a sorted run, so only
+    the best entries across runs are read back, as many as fit in memory. A small key per pending URL is kept
+    in memory, so pending URLs can be deduplicated and re-prioritized regardless of where they're stored.
+
+    Not thread-safe: push URLs from callbacks running on the event loop (i.e., not in `processor_executor`).
+
+    Example:
+            >>> from arc_crawler import Crawler, Frontier
+            >>> frontier = Frontier(["https://example.com"], default_priority=10)
+            >>> def follow_links(**kwargs):
+            ...     for link in extract_links(kwargs["response"]):
+            ...         frontier.push(link, priority=1 if "/blog/" in link else 5)
+            ...     return kwargs["response"]
+            >>> Crawler().get(frontier, out_file_name="site", response_processor=follow_links)
+    """
+
+    def __init__(
+        self,
+        urls: Iterable[str] | None = None,
+        default_priority: float = 0,
+        max_memory_items: int | None = None,
+        spill_dir: str | Path | None = None,
+    ):
+        """Initializes a `Frontier` instance.
+
+        Args:
+            urls (Iterable[str], optional): Initial URLs, pushed with `default_priority`.
+
+            default_priority (float, optional): Priority of URLs pushed without one. Defaults to 0.
+
+            max_memory_items (int, optional): The maximum number of heap entries kept in memory before
+                the least important half is spilled to disk. Defaults to `None` (never spill).
+
+            spill_dir (str | Path, optional): The directory for the spill file. Defaults to the system temp directory.
+        """
+        self.default_priority = default_priority
+        self.max_memory_items = max_memory_items
+        self.spill_dir = spill_dir
+
+        self._heap: List[FrontierEntry] = []
+        self._sequence = itertools.count()
+        # Sequence number and priority of the current entry of each pending URL
+        self._pending: Dict[str, Tuple[int, float]] = {}
+        self._excluded: Set[str] = set()
+        self._skip: Callable[[str], bool] | None = None
+
+        self._spill_path: Path | None = None
+        self._spilled_count = 0
+        # Heap of sorted runs in the spill file: (next entry, offset of the entry after it, end offset of the run)
+        self._runs: List[Tuple[FrontierEntry, int, int]] = []
+
+        # Number of URLs taken from the frontier whose processing hasn't finished yet
+        self._unfinished = 0
+        # Priorities of URLs taken from the frontier, until they are reported as done
+        self._in_progress: Dict[str, float] = {}
+        self._changed = asyncio.Event()
+
+        self.push_many(urls or [])
+
+    def __len__(self):
+        return len(self._pending)
+
+    def __contains__(self, url: str):
+        return url in self._pending
+
+    @property
+    def unfinished(self) -> int:
+        return self._unfinished
+
+    def get_priority(self, url: str) -> float | None:
+        """Returns the priority of a pending URL, or of one taken from the frontier and not reported as done yet."""
+        current = self._pending.get(url)
+        if current is not None:
+            return current[1]
+        return self._in_progress.get(url)
+
+    def push(self, url: str, priority: float | None = None) -> bool:
+        """Adds the URL to the frontier. Raises its priority if it's already pending.
+
+        Returns:
+            bool: `False` if the URL was excluded or is already pending with the same or higher priority.
+        """
+        if url in self._excluded or (self._skip is not None and self._skip(url)):
+            return False
+        priority = self.default_priority if priority is None else priority
+
+        current = self._pending.get(url)
+        if current is not None and current[1] >= priority:
+            return False
+        self._add(url, priority)
+        return True
+
+    def push_many(self, urls: Iterable[str], priority: float | None = None):
+        for url in urls:
+            self.push(url, priority)
+
+    def reprioritize(self, url: str, priority: float) -> bool:
+        """Changes the priority of a pending URL, either raising or lowering it.
+
+        Returns:
+            bool: `False` if the URL is not pending.
+        """
+        if url not in self._pending:
+            return False
+        self._add(url, priority)
+        return True
+
+    def exclude(self, urls: Iterable[str]):
+        """Prevents URLs from being returned, e.g., ones already fetched by a previous run."""
+        urls = set(urls)
+        self._excluded.update(urls)
+        for url in urls:
+            self._pending.pop(url, None)
+
+    def skip_if(self, predicate: Callable[[str], bool] | None):
+        """Drops URLs matching the predicate when they are pushed or up next, e.g., ones found in `reader.DoneSet`."""
+        self._skip = predicate
+
+    def pop(self) -> str | None:
+        """Takes the URL with the highest priority. Returns `None` if the frontier is empty."""
+        while True:
+            if self._runs and (not self._heap or self._runs[0][0] < self._heap[0]):
+                self._load_spilled()
+            if not self._heap:
+                return None
+
+            entry = heapq.heappop(self._heap)
+            # Entries replaced by re-prioritization or excluded later are skipped
+            if self._is_current(entry):
+                url = entry[2]
+                del self._pending[url]
+                if self._skip is not None and self._skip(url):
+                    continue
+                self._unfinished += 1
+                self._in_progress[url] = -entry[0]
+                return url
+
+    def task_done(self, url: str | None = None):
+        """Marks a URL taken from the frontier as processed. Called by fetchers."""
+        self._unfinished = max(0, self._unfinished - 1)
+        if url is not None:
+            self._in_progress.pop(url, None)
+        self._changed.set()
+
+    def __aiter__(self):
+        # The event is bound to the loop it's awaited in, and a frontier may be iterated by several runs
+        self._changed = asyncio.Event()
+        return self
+
+    async def __anext__(self) -> str:
+        while True:
+            url = self.pop()
+            if url is not None:
+                return url
+            if self._unfinished == 0:
+                raise StopAsyncIteration
+            # Callbacks of URLs in progress may push new ones
+            self._changed.clear()
+            await self._changed.wait()
+
+    def _is_current(self, entry: FrontierEntry) -> bool:
+        current = self._pending.get(entry[2])
+        return current is not None and current[0] == entry[1]
+
+    def _add(self, url: str, priority: float):
+        seq = next(self._sequence)
+        self._pending[url] = (seq, priority)
+        heapq.heappush(self._heap, (-priority, seq, url))
+        self._changed.set()
+
+        if self.max_memory_items is not None and len(self._heap) > self.max_memory_items:
+            self._spill()
+
+    def _spill(self):
+        self._heap.sort()
+        keep = max(1, len(self._heap) // 2)
+        spilled = [entry for entry in self._heap[keep:] if self._is_current(entry)]
+        del self._heap[keep:]
+
+        if self._spill_path is None:
+            descriptor, path = tempfile.mkstemp(prefix="frontier-", suffix=".jsonl", dir=self.spill_dir)
+            os.close(descriptor)
+            self._spill_path = Path(path)
+
+        if not spilled:
+            return
+        lines = [json_dumps(entry) + b"\n" for entry in spilled]
+        with open(self._spill_path, "ab") as file:
+            start = file.tell()
+            file.writelines(lines)
+            end = file.tell()
+        # The first entry of the run is kept in memory, so runs are ordered without reading them
+        heapq.heappush(self._runs, (spilled[0], start + len(lines[0]), end))
+        self._spilled_count += len(spilled)
+        logger.debug(f"Spilled {len(spilled)} frontier entries to disk ({self._spilled_count} in total)")
+
+    def _load_spilled(self):
+        # Only the best entries across runs are loaded, filling the heap up to the limit. The rest stay on disk
+        capacity = max(1, self.max_memory_items - len(self._heap))
+        loaded = 0
+        with open(self._spill_path, "rb") as file:
+            while self._runs and loaded < capacity:
+                entry, offset, end = self._runs[0]
+                self._spilled_count -= 1
+                if self._is_current(entry):
+                    heapq.heappush(self._heap, entry)
+                    loaded += 1
+
+                if offset < end:
+                    file.seek(offset)
+                    line = file.readline()
+                    heapq.heapreplace(self._runs, (tuple(json_loads(line)), offset + len(line), end))
+                else:
+                    heapq.heappop(self._runs)
+
+        if not self._runs:
+            # All the runs are read, so the file is reused from the start
+            self._spill_path.write_bytes(b"")
+            self._spilled_count = 0
+
+    def close(self):
+        """Removes the spill file."""
+        if self._spill_path is not None:
+            self._spill_path.unlink(missing_ok=True)
+            self._spill_path = None
+            self._spilled_count = 0
+            self._runs = []
+
+    def __del__(self):
+        self.close()
@@ -0,0 +1,148 @@
+import asyncio
+import inspect
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, TypeVar
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+from .limiter import RateLimiter
+from .types import HedgingStats
+
+T = TypeVar("T")
+
+
+class HedgingPolicy:
+    """Sends a duplicate request when a response takes longer than usual, using whichever one arrives first.
+
+    Latencies (time to response headers) are tracked per host over the latest `window_size` requests.
+    Once a host has `min_samples` of them, a request still waiting after the `percentile` latency (p95 by default)
+    is hedged: a second identical request is sent and the slower one is cancelled. This trims tail latency caused
+    by occasional stalled connections or slow backends, at the cost of a few extra requests. Hedges are limited
+    to `max_hedge_ratio` of all requests, so a host that is slow across the board is not hit twice as often.
+
+    Hedged requests share the rate limiting slot of the original one. Only use hedging for idempotent requests.
+
+    Example:
+            >>> from arc_crawler import Crawler, HedgingPolicy
+            >>> crawler = Crawler(request_timeout=30, hedging_policy=HedgingPolicy(percentile=0.95))
+    """
+
+    def __init__(
+        self,
+        percentile: float = 0.95,
+        min_samples: int = 20,
+        window_size: int = 200,
+        min_delay: float = 0.05,
+        max_hedge_ratio: float = 0.1,
+    ):
+        """Initializes a `HedgingPolicy` instance.
+
+        Args:
+            percentile (float, optional): The latency percentile (0 to 1) after which requests are hedged.
+                Defaults to 0.95.
+
+            min_samples (int, optional): The number of latencies of a host needed before its requests are hedged.
+
+            window_size (int, optional): The number of the latest latencies per host considered.
+
+            min_delay (float, optional): The minimum delay in seconds before hedging, so fast hosts
+                are not hedged because of jitter.
+
+            max_hedge_ratio (float, optional): The maximum share of requests that can be hedged. Defaults to 0.1.
+        """
+        self.percentile = percentile
+        self.min_samples = min_samples
+        self.window_size = window_size
+        self.min_delay = min_delay
+        self.max_hedge_ratio = max_hedge_ratio
+
+        self._latencies: Dict[str, Deque[float]] = {}
+        self._stats: HedgingStats = {"requests": 0, "hedged": 0, "hedges_won": 0}
+
+    @property
+    def stats(self) -> HedgingStats:
+        return HedgingStats(**self._stats)
+
+    def get_delay(self, url: str) -> float | None:
+        """Returns seconds after which a request to the URL is hedged, or `None` if there's not enough data yet."""
+        latencies = self._latencies.get(RateLimiter.get_host(url))
+        if latencies is None or len(latencies) < self.min_samples:
+            return None
+        ordered = sorted(latencies)
+        return max(self.min_delay, ordered[min(len(ordered) - 1, int(self.percentile * len(ordered)))])
+
+    def record(self, url: str, latency: float):
+        host = RateLimiter.get_host(url)
+        latencies = self._latencies.get(host)
+        if latencies is None:
+            latencies = self._latencies[host] = deque(maxlen=self.window_size)
+        latencies.append(latency)
+
+    def _take_budget(self) -> bool:
+        if self._stats["hedged"] + 1 > self.max_hedge_ratio * self._stats["requests"]:
+            return False
+        self._stats["hedged"] += 1
+        return True
+
+    async def send(self, url: str, request: Callable[[], Awaitable[T]], release: Callable[[T], Any]) -> T:
+        """Awaits `request()`, calling it again if it takes longer than the hedging delay.
+
+        Args:
+            url (str): The requested URL, used to look up latencies of its host.
+
+            request (Callable[[], Awaitable]): Sends the request and returns its response.
+
+            release (Callable): Frees a response of a request that lost the race. May be a coroutine function.
+
+        Returns:
+            The first response received. If one of the requests fails, the other one is awaited.
+        """
+        loop = asyncio.get_running_loop()
+        self._stats["requests"] += 1
+        delay = self.get_delay(url)
+
+        started: Dict[asyncio.Future, float] = {asyncio.ensure_future(request()): loop.time()}
+        pending = set(started)
+        winner: asyncio.Future | None = None
+        try:
+            if delay is not None:
+                done, _ = await asyncio.wait(pending, timeout=delay)
+                if not done and self._take_budget():
+                    logger.debug(f'"{url}" is slower than {delay:.2f}s. Sending a hedged request...')
+                    hedge = asyncio.ensure_future(request())
+                    started[hedge] = loop.time()
+                    pending.add(hedge)
+
+            while True:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                # A failed request is only reported if there's no other one left to wait for
+                succeeded = [task for task in done if not task.cancelled() and task.exception() is None]
+                if succeeded or not pending:
+                    winner = succeeded[0] if succeeded else next(iter(done))
+                    break
+
+            response = winner.result()
+            self.record(url, loop.time() - started[winner])
+            if len(started) > 1 and winner is not next(iter(started)):
+                self._stats["hedges_won"] += 1
+            return response
+        finally:
+            losers = [task for task in started if task is not winner]
+            for task in losers:
+                task.cancel()
+            if losers:
+                await asyncio.gather(*losers, return_exceptions=True)
+            for task in losers:
+                if not task.cancelled() and task.exception() is None:
+                    released = release(task.result())
+                    if inspect.isawaitable(released):
+                        await released
+
+    def log_stats(self):
+        stats = self._stats
+        logger.info(
+            f"Hedging: {stats['hedged']} out of {stats['requests']} requests were hedged, "
+            f"{stats['hedges_won']} hedges were faster"
+        )
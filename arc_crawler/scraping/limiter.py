@@ -0,0 +1,372 @@
+import asyncio
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from contextlib import asynccontextmanager
+from typing import Dict, Iterable, Unpack
+from urllib.parse import urlsplit
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+from .types import HostLimits
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Converts `Retry-After` header value (either delay in seconds or HTTP date) to seconds from now."""
+    if not value:
+        return None
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        retry_date = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        logger.debug(f'Unable to parse Retry-After header value "{value}"')
+        return None
+    if retry_date.tzinfo is None:
+        retry_date = retry_date.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_date - datetime.now(timezone.utc)).total_seconds())
+
+
+class _HostBucket:
+    def __init__(self, rate: int | float | None, burst: int, max_concurrent_requests: int | None):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.updated = asyncio.get_running_loop().time()
+        self.paused_until = 0
+        self.lock = asyncio.Lock()
+
+        self.max_concurrent_requests = max_concurrent_requests
+        self.active_requests = 0
+        self.slot_released = asyncio.Condition()
+        self._notify_task: asyncio.Task | None = None
+
+    async def take(self):
+        loop = asyncio.get_running_loop()
+        # Lock keeps waiters in FIFO order, so requests to the same host are sent in the order they were queued
+        async with self.lock:
+            while loop.time() < self.paused_until:
+                await asyncio.sleep(self.paused_until - loop.time())
+
+            if not self.rate:
+                return
+
+            while True:
+                now = loop.time()
+                self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+    async def acquire_slot(self):
+        async with self.slot_released:
+            await self.slot_released.wait_for(
+                lambda: not self.max_concurrent_requests or self.active_requests < self.max_concurrent_requests
+            )
+            self.active_requests += 1
+
+    async def release_slot(self):
+        async with self.slot_released:
+            self.active_requests -= 1
+            self.slot_released.notify_all()
+
+    def set_max_concurrent_requests(self, max_concurrent_requests: int):
+        is_raised = max_concurrent_requests > (self.max_concurrent_requests or 0)
+        self.max_concurrent_requests = max_concurrent_requests
+        # Waiters are woken up right away instead of on the next release. Notifying requires the condition lock,
+        # which can only be awaited, so it's done in a task
+        if is_raised and (self._notify_task is None or self._notify_task.done()):
+            self._notify_task = asyncio.get_running_loop().create_task(self._notify_slots())
+
+    async def _notify_slots(self):
+        async with self.slot_released:
+            self.slot_released.notify_all()
+
+    def set_rate(self, rate: int | float):
+        # Tokens are settled at the previous rate before switching to the new one
+        now = asyncio.get_running_loop().time()
+        if self.rate:
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        self.rate = rate
+
+
+class RateLimiter:
+    """Token-bucket rate limiter keyed by request host.
+
+    Every host receives its own bucket, so a URL list spanning many domains is not throttled as if it
+    were a single server: unrelated hosts proceed in parallel while each host still gets its politeness budget.
+
+    Example:
+            To allow 2 requests per second (with bursts of up to 5) and 4 parallel requests per host:
+
+            >>> from arc_crawler import Crawler, RateLimiter
+            >>> limiter = RateLimiter(rate=2, burst=5, max_concurrent_requests=4)
+            >>> Crawler().get(["https://example.com", "https://example.org"], rate_limiter=limiter)
+    """
+
+    def __init__(
+        self,
+        rate: int | float | None = None,
+        burst: int = 1,
+        max_concurrent_requests: int | None = None,
+        per_host: bool = True,
+        host_limits: Dict[str, HostLimits] | None = None,
+    ):
+        """Initializes a `RateLimiter` instance.
+
+        Args:
+            rate (int | float, optional): The number of requests per second allowed for each host.
+                `None` (default) disables rate limiting, leaving only the concurrency limit in place.
+
+            burst (int, optional): The number of requests that can be sent at once before `rate` applies.
+                Defaults to 1, meaning requests to the same host are evenly spaced by `1 / rate` seconds.
+
+            max_concurrent_requests (int, optional): The maximum number of requests in flight per host.
+                Defaults to `None` (no limit).
+
+            per_host (bool, optional): When `False`, a single bucket is shared by all the requests
+                regardless of their host. Defaults to `True`.
+
+            host_limits (dict[str, HostLimits], optional): Overrides of `rate`, `burst` and
+                `max_concurrent_requests` for specific hosts, keyed by host name (e.g., `"api.example.com"`).
+        """
+        self.rate = rate
+        self.burst = burst
+        self.max_concurrent_requests = max_concurrent_requests
+        self.per_host = per_host
+        self.host_limits = {host.lower(): limits for host, limits in (host_limits or {}).items()}
+
+        self._buckets: Dict[str, _HostBucket] = {}
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    @classmethod
+    def from_delay(cls, min_request_delay: int | float | None):
+        """Creates a limiter equivalent to a single global `min_request_delay` between consecutive requests."""
+        rate = 1 / min_request_delay if min_request_delay else None
+        return cls(rate=rate, burst=1, per_host=False)
+
+    @staticmethod
+    def get_host(url: str) -> str:
+        return urlsplit(str(url)).netloc.lower()
+
+    def _get_key(self, url: str) -> str:
+        return self.get_host(url) if self.per_host else ""
+
+    def _get_bucket(self, url: str) -> _HostBucket:
+        # Buckets hold asyncio primitives, which can't be shared between event loops (e.g. consecutive `Crawler.get` calls)
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._reset()
+
+        host = self._get_key(url)
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            limits: HostLimits = {
+                "rate": self.rate,
+                "burst": self.burst,
+                "max_concurrent_requests": self.max_concurrent_requests,
+                **self.host_limits.get(host, {}),
+            }
+            bucket = _HostBucket(**limits)
+            self._buckets[host] = bucket
+            logger.debug(f'Created rate limiting bucket for "{host or "*"}": {limits}')
+
+        return bucket
+
+    def _reset(self):
+        """Drops the per-host state of a previous event loop."""
+        self._buckets = {}
+
+    @asynccontextmanager
+    async def acquire(self, url: str):
+        """Waits until a request to `url` is allowed and holds its host concurrency slot until the context exits."""
+        bucket = self._get_bucket(url)
+
+        await bucket.acquire_slot()
+        try:
+            await bucket.take()
+            yield
+        finally:
+            await bucket.release_slot()
+
+    def feedback(self, url: str, status: int | None, latency: float, retry_after: float | None = None) -> bool:
+        """Reports the outcome of a request made to `url`.
+
+        Static limiter ignores the feedback. Subclasses use it to tune the host limits on the fly.
+
+        Args:
+            url (str): The requested URL.
+            status (int, optional): The response status code, or `None` if the request failed without a response.
+            latency (float): Seconds elapsed until the response headers were received.
+            retry_after (float, optional): Seconds to wait before the next request, as advised by the server.
+
+        Returns:
+            bool: `True` if the response indicates throttling and the request should be sent again later.
+        """
+        return False
+
+    def configure_host(self, host: str, **limits: Unpack[HostLimits]):
+        """Sets `rate`, `burst` or `max_concurrent_requests` overrides for a single host."""
+        host = host.lower()
+        self.host_limits[host] = {**self.host_limits.get(host, {}), **limits}
+        self._buckets.pop(host, None)
+
+
+class AdaptiveRateLimiter(RateLimiter):
+    """Rate limiter that tunes per-host rate and concurrency using AIMD (additive increase, multiplicative decrease).
+
+    Each host starts at `rate` and `max_concurrent_requests`. Both are cut by `decrease_factor` when the host
+    responds with one of the `throttle_statuses` (429 and 503 by default) or when its latency rises above
+    `latency_factor` times the lowest latency observed, and grow back additively while the host stays healthy.
+    `Retry-After` headers pause the host for the requested time. Throttled requests are sent again (up to
+    `max_retries` times) instead of hitting termination criteria, so a run settles at the maximum rate a target
+    tolerates without hand-tuning `request_delay`.
+
+    Example:
+            >>> from arc_crawler import Crawler, AdaptiveRateLimiter
+            >>> limiter = AdaptiveRateLimiter(rate=2, max_rate=20, max_concurrent_requests=2, max_concurrency=16)
+            >>> Crawler().get(["https://example.com"], rate_limiter=limiter)
+    """
+
+    def __init__(
+        self,
+        rate: int | float = 1,
+        burst: int = 1,
+        max_concurrent_requests: int = 4,
+        per_host: bool = True,
+        host_limits: Dict[str, HostLimits] | None = None,
+        min_rate: int | float = 0.1,
+        max_rate: int | float | None = None,
+        max_concurrency: int | None = None,
+        increase_step: int | float = 1,
+        decrease_factor: float = 0.5,
+        latency_factor: float | None = 3,
+        throttle_statuses: Iterable[int] = (429, 503),
+        max_retries: int = 5,
+    ):
+        """Initializes an `AdaptiveRateLimiter` instance.
+
+        Args:
+            rate (int | float, optional): Initial number of requests per second for each host. Defaults to 1.
+
+            burst (int, optional): The number of requests that can be sent at once before `rate` applies.
+
+            max_concurrent_requests (int, optional): Initial number of requests in flight per host. Defaults to 4.
+
+            per_host (bool, optional): When `False`, a single set of limits is shared by all the hosts.
+
+            host_limits (dict[str, HostLimits], optional): Initial limits overrides for specific hosts.
+
+            min_rate (int | float, optional): The rate is never decreased below this value.
+
+            max_rate (int | float, optional): The rate is never increased above this value. Defaults to `None`
+                (no upper bound).
+
+            max_concurrency (int, optional): The per-host concurrency is never increased above this value.
+                Defaults to `None` (no upper bound).
+
+            increase_step (int | float, optional): How much rate and concurrency grow per round trip
+                while the host is healthy.
+
+            decrease_factor (float, optional): Multiplier applied to rate and concurrency when the host
+                shows signs of overload. Defaults to 0.5.
+
+            latency_factor (float, optional): Latency above `latency_factor` times the lowest observed
+                latency is treated as overload. `None` disables latency tracking.
+
+            throttle_statuses (Iterable[int], optional): Status codes that signal overload and get retried.
+
+            max_retries (int, optional): How many times a throttled request is sent again before its response
+                is passed through as is (and checked against termination criteria).
+        """
+        super().__init__(rate, burst, max_concurrent_requests, per_host, host_limits)
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.max_concurrency = max_concurrency
+        self.increase_step = increase_step
+        self.decrease_factor = decrease_factor
+        self.latency_factor = latency_factor
+        self.throttle_statuses = set(throttle_statuses)
+        self.max_retries = max_retries
+
+        self._host_stats: Dict[str, Dict[str, float]] = {}
+
+    def _reset(self):
+        # AIMD state is tied to the buckets it was tuning, so every run starts from the initial limits
+        super()._reset()
+        self._host_stats = {}
+
+    def _get_stats(self, host: str) -> Dict[str, float]:
+        stats = self._host_stats.get(host)
+        if stats is None:
+            stats = {"latency": 0, "min_latency": 0, "last_decrease": float("-inf"), "concurrency": 0}
+            self._host_stats[host] = stats
+        return stats
+
+    def feedback(self, url: str, status: int | None, latency: float, retry_after: float | None = None) -> bool:
+        bucket = self._get_bucket(url)
+        host = self._get_key(url)
+        stats = self._get_stats(host)
+        now = asyncio.get_running_loop().time()
+
+        # Exponentially weighted latency smooths out single slow responses
+        stats["latency"] = latency if not stats["latency"] else 0.8 * stats["latency"] + 0.2 * latency
+        stats["min_latency"] = min(stats["min_latency"] or latency, latency)
+
+        is_throttled = status in self.throttle_statuses
+        is_slow = (
+            self.latency_factor is not None
+            and stats["min_latency"] > 0
+            and stats["latency"] > stats["min_latency"] * self.latency_factor
+        )
+
+        if is_throttled and retry_after:
+            bucket.paused_until = max(bucket.paused_until, now + retry_after)
+            logger.warning(f'"{host}" asked to retry after {retry_after:.2f}s. Pausing requests to the host.')
+
+        if is_throttled or is_slow:
+            # Requests that were already in flight report the same overload; decrease once per round trip only
+            if now - stats["last_decrease"] >= stats["latency"]:
+                stats["last_decrease"] = now
+                self._decrease(host, bucket, stats)
+        elif status is not None:
+            self._increase(bucket, stats)
+
+        return is_throttled
+
+    def _decrease(self, host: str, bucket: _HostBucket, stats: Dict[str, float]):
+        bucket.set_rate(max(self.min_rate, (bucket.rate or self.min_rate) * self.decrease_factor))
+        bucket.tokens = min(bucket.tokens, 0)
+
+        if bucket.max_concurrent_requests:
+            bucket.set_max_concurrent_requests(max(1, int(bucket.max_concurrent_requests * self.decrease_factor)))
+            stats["concurrency"] = bucket.max_concurrent_requests
+        logger.info(
+            f'Decreased limits for "{host or "*"}": {bucket.rate:.2f} requests/s, '
+            f"{bucket.max_concurrent_requests or 'unlimited'} concurrent requests"
+        )
+
+    def _increase(self, bucket: _HostBucket, stats: Dict[str, float]):
+        # Growing by `increase_step / current` per response adds roughly `increase_step` per round trip
+        if bucket.rate:
+            rate = bucket.rate + self.increase_step / bucket.rate
+            bucket.set_rate(min(self.max_rate, rate) if self.max_rate else rate)
+
+        if bucket.max_concurrent_requests:
+            concurrency = (stats["concurrency"] or bucket.max_concurrent_requests) + (
+                self.increase_step / bucket.max_concurrent_requests
+            )
+            if self.max_concurrency:
+                concurrency = min(self.max_concurrency, concurrency)
+            stats["concurrency"] = concurrency
+            bucket.set_max_concurrent_requests(int(concurrency))
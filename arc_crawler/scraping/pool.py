@@ -0,0 +1,205 @@
+import asyncio
+import itertools
+from collections.abc import Iterable, Sequence
+from time import perf_counter
+from typing import Any, Dict, List
+
+import aiohttp
+from aiohttp import ClientSession, ClientTimeout, TCPConnector, TraceConfig
+from yarl import URL
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+from .types import PoolStats, UrlSource
+
+
+class ConnectionPool:
+    """Configuration of the connection pool used by sessions that fetchers create.
+
+    Wraps `aiohttp.TCPConnector` settings (total and per-host limits, keep-alive, DNS cache, happy eyeballs)
+    and collects statistics of connections opened vs reused, so connection reuse can be verified under load.
+    The same instance can be shared by several runs; statistics accumulate until `reset_stats()` is called.
+
+    With `warm_up_connections` set, hosts of the URLs are resolved and connected to concurrently before fetching
+    starts, instead of paying DNS lookups and TCP/TLS handshakes one host at a time as they are first requested.
+
+    Example:
+            >>> from arc_crawler import Crawler, ConnectionPool
+            >>> pool = ConnectionPool(limit=200, limit_per_host=8, keepalive_timeout=30, ttl_dns_cache=300)
+            >>> Crawler(connection_pool=pool).get(["https://example.com"])
+            >>> pool.stats["connections_opened"], pool.stats["connections_reused"]
+            (1, 0)
+    """
+
+    def __init__(
+        self,
+        limit: int = 100,
+        limit_per_host: int = 0,
+        keepalive_timeout: int | float | None = 15,
+        ttl_dns_cache: int | None = 10,
+        use_dns_cache: bool = True,
+        happy_eyeballs_delay: float | None = 0.25,
+        force_close: bool = False,
+        warm_up_connections: int = 0,
+        warm_up_scan_limit: int = 10_000,
+        warm_up_timeout: float = 10,
+        **connector_kwargs: Dict[str, Any],
+    ):
+        """Initializes a `ConnectionPool` instance.
+
+        Args:
+            limit (int, optional): The total number of simultaneous connections. `0` means no limit.
+
+            limit_per_host (int, optional): The number of simultaneous connections to a single host.
+                `0` (default) means no limit.
+
+            keepalive_timeout (int | float, optional): Seconds to keep idle connections open for reuse.
+
+            ttl_dns_cache (int, optional): Seconds to keep resolved host addresses cached.
+                `None` caches them forever.
+
+            use_dns_cache (bool, optional): Whether to cache DNS lookups at all. Defaults to `True`.
+
+            happy_eyeballs_delay (float, optional): Seconds to wait for a connection attempt before starting
+                the next one in parallel (RFC 8305). `None` disables happy eyeballs.
+
+            force_close (bool, optional): Closes connections after each request, disabling keep-alive.
+
+            warm_up_connections (int, optional): The number of keep-alive connections opened to each distinct host
+                (scheme, host and port) before fetching starts. Connections are opened with `HEAD /` requests,
+                which are counted in `stats` and are not subject to rate limits. Defaults to 0 (no warm-up).
+
+            warm_up_scan_limit (int, optional): The number of URLs scanned for hosts to warm up. Only URLs from
+                lists and other synchronous iterables are scanned, since async sources (e.g., `Frontier`) may
+                depend on responses. Defaults to 10,000.
+
+            warm_up_timeout (float, optional): Seconds the warm-up may take. Hosts not connected by then
+                are connected to as usual, when their URLs are requested.
+
+            **connector_kwargs: Any other `aiohttp.TCPConnector` arguments (e.g., `ssl`, `family`, `resolver`).
+        """
+        self.connector_kwargs = {
+            "limit": limit,
+            "limit_per_host": limit_per_host,
+            "ttl_dns_cache": ttl_dns_cache,
+            "use_dns_cache": use_dns_cache,
+            "happy_eyeballs_delay": happy_eyeballs_delay,
+            "force_close": force_close,
+            # keep-alive can't be set together with force_close
+            **({"keepalive_timeout": keepalive_timeout} if not force_close else {}),
+            **connector_kwargs,
+        }
+        self.warm_up_connections = warm_up_connections
+        self.warm_up_scan_limit = warm_up_scan_limit
+        self.warm_up_timeout = warm_up_timeout
+        self._stats: PoolStats = {}
+        self.reset_stats()
+
+    def reset_stats(self):
+        self._stats = {
+            "requests": 0,
+            "connections_opened": 0,
+            "connections_reused": 0,
+            "dns_cache_hits": 0,
+            "dns_cache_misses": 0,
+            "warmed_up_connections": 0,
+        }
+
+    @property
+    def stats(self) -> PoolStats:
+        """Counters collected by all the sessions created with this pool.
+
+        Returns:
+            PoolStats: A copy of counters: `requests`, `connections_opened`, `connections_reused`,
+            `dns_cache_hits`, `dns_cache_misses` and `warmed_up_connections`.
+        """
+        return PoolStats(**self._stats)
+
+    def create_connector(self) -> TCPConnector:
+        return TCPConnector(**self.connector_kwargs)
+
+    def create_trace_config(self) -> TraceConfig:
+        trace_config = TraceConfig()
+
+        def count(key: str):
+            async def handler(*_):
+                self._stats[key] += 1
+
+            return handler
+
+        trace_config.on_request_start.append(count("requests"))
+        trace_config.on_connection_create_end.append(count("connections_opened"))
+        trace_config.on_connection_reuseconn.append(count("connections_reused"))
+        trace_config.on_dns_cache_hit.append(count("dns_cache_hits"))
+        trace_config.on_dns_cache_miss.append(count("dns_cache_misses"))
+        return trace_config
+
+    def session_kwargs(self) -> Dict[str, Any]:
+        """Returns `aiohttp.ClientSession` arguments that make the session use this pool.
+
+        Must be called within a running event loop, since it creates a new connector.
+        """
+        return {"connector": self.create_connector(), "trace_configs": [self.create_trace_config()]}
+
+    async def warm_up(self, session: ClientSession, urls: UrlSource) -> UrlSource:
+        """Opens `warm_up_connections` keep-alive connections to each host found among the first URLs.
+
+        Args:
+            session (aiohttp.ClientSession): The session whose connector keeps the connections.
+
+            urls (UrlSource): URLs of the run.
+
+        Returns:
+            UrlSource: URLs to fetch. Iterators are scanned by consuming them, so scanned URLs are put back in front.
+        """
+        if not self.warm_up_connections or not isinstance(urls, Iterable) or isinstance(urls, (str, bytes)):
+            return urls
+
+        if isinstance(urls, Sequence):
+            scanned = urls[: self.warm_up_scan_limit]
+        else:
+            iterator = iter(urls)
+            scanned = list(itertools.islice(iterator, self.warm_up_scan_limit))
+            urls = itertools.chain(scanned, iterator)
+
+        origins: Dict[URL, None] = {}
+        for url in scanned:
+            try:
+                origin = URL(url).origin()
+            except ValueError:
+                # Invalid URLs are reported when they are requested
+                continue
+            origins[origin] = None
+        if not origins:
+            return urls
+
+        start_time = perf_counter()
+        timeout = ClientTimeout(total=self.warm_up_timeout)
+        connections = [origin for origin in origins for _ in range(self.warm_up_connections)]
+        results: List[bool] = await asyncio.gather(
+            *(self._open_connection(session, origin, timeout) for origin in connections)
+        )
+        self._stats["warmed_up_connections"] += sum(results)
+        logger.info(
+            f"Warmed up {sum(results)} connections to {len(origins)} hosts in {perf_counter() - start_time:.2f}s"
+        )
+        return urls
+
+    @staticmethod
+    async def _open_connection(session: ClientSession, origin: URL, timeout: ClientTimeout) -> bool:
+        try:
+            # Released connections stay in the pool until `keepalive_timeout` expires
+            async with session.head(origin, timeout=timeout, allow_redirects=False):
+                return True
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logger.debug(f'Unable to warm up a connection to "{origin}": {e!r}')
+            return False
+
+    def log_stats(self):
+        stats = self._stats
+        logger.info(
+            f"Connection pool: {stats['requests']} requests, {stats['connections_opened']} connections opened, "
+            f"{stats['connections_reused']} reused"
+        )
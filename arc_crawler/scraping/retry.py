@@ -0,0 +1,119 @@
+import asyncio
+import random
+from typing import Dict, Iterable, Tuple
+
+import aiohttp
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class RetryRequested(Exception):
+    """Raised by `Fetcher._do_request` when a URL should be requested again after `delay` seconds.
+
+    Fetchers catch it to re-queue the URL: `ParallelFetcher` frees the concurrency slot while waiting,
+    `SequentialFetcher` waits and sends the request again.
+    """
+
+    def __init__(self, url: str, attempt: int, delay: float, reason: str):
+        super().__init__(f'Retrying "{url}" in {delay:.2f}s (attempt {attempt + 1}). Reason: {reason}')
+        self.url = url
+        self.attempt = attempt
+        self.delay = delay
+        self.reason = reason
+
+
+class RetryPolicy:
+    """Decides which failed requests are sent again and how long to wait before that.
+
+    Waiting time grows exponentially with each attempt (`backoff_factor * 2 ** (attempt - 1)`, capped by
+    `max_backoff`). With `jitter` enabled, the actual delay is picked randomly between zero and that value
+    ("full jitter"), so requests that failed together are not retried together. A `Retry-After` header
+    always takes precedence when it asks for a longer delay.
+
+    Example:
+            To retry connection errors and 5XX responses up to 5 times, with at most 20 retries per host:
+
+            >>> from arc_crawler import Crawler, RetryPolicy
+            >>> crawler = Crawler(retry_policy=RetryPolicy(max_attempts=5, host_budget=20))
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        backoff_factor: int | float = 0.5,
+        max_backoff: int | float = 30,
+        jitter: bool = True,
+        retry_statuses: Iterable[int | range] = (408, 429, 500, 502, 503, 504),
+        retry_exceptions: Tuple[type[BaseException], ...] = (aiohttp.ClientError, asyncio.TimeoutError),
+        host_budget: int | None = None,
+    ):
+        """Initializes a `RetryPolicy` instance.
+
+        Args:
+            max_attempts (int, optional): The total number of attempts per URL, including the first one.
+
+            backoff_factor (int | float, optional): The base delay in seconds before the first retry.
+
+            max_backoff (int | float, optional): The upper bound of the delay between attempts.
+
+            jitter (bool, optional): Whether to randomize delays. Defaults to `True`.
+
+            retry_statuses (Iterable[int | range], optional): Response status codes that are retried.
+                Responses that keep failing after the last attempt are passed through as is
+                (and checked against termination criteria).
+
+            retry_exceptions (tuple[type[BaseException]], optional): Exception types that are retried.
+                Exceptions that keep occurring after the last attempt are raised as usual.
+
+            host_budget (int, optional): The maximum number of retries per host within a single run.
+                Prevents a broken host from consuming the whole crawl time. Defaults to `None` (no limit).
+        """
+        self.max_attempts = max_attempts
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.retry_statuses = list(retry_statuses)
+        self.retry_exceptions = retry_exceptions
+        self.host_budget = host_budget
+
+        self._host_retries: Dict[str, int] = {}
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    def _is_retryable_status(self, status: int) -> bool:
+        return any(status in code if isinstance(code, range) else status == code for code in self.retry_statuses)
+
+    def _take_budget(self, host: str) -> bool:
+        # Budget is tracked per run, i.e. per event loop
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._host_retries = {}
+
+        retries = self._host_retries.get(host, 0)
+        if self.host_budget is not None and retries >= self.host_budget:
+            logger.warning(f'Retry budget of "{host}" is exhausted. Failed requests won\'t be retried')
+            return False
+
+        self._host_retries[host] = retries + 1
+        return True
+
+    def should_retry(
+        self, host: str, attempt: int, status: int | None = None, exception: BaseException | None = None
+    ) -> bool:
+        """Checks whether a request that failed on `attempt` should be sent again."""
+        if attempt >= self.max_attempts:
+            return False
+
+        is_retryable = (exception is not None and isinstance(exception, self.retry_exceptions)) or (
+            status is not None and self._is_retryable_status(status)
+        )
+        return is_retryable and self._take_budget(host)
+
+    def get_delay(self, attempt: int, retry_after: float | None = None) -> float:
+        """Returns seconds to wait before sending the next attempt."""
+        delay = min(self.max_backoff, self.backoff_factor * 2 ** (attempt - 1))
+        if self.jitter:
+            delay = random.uniform(0, delay)
+        return max(delay, retry_after or 0)
@@ -0,0 +1,58 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Coroutine, Literal, TypeVar
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+LoopFactory = Callable[[], asyncio.AbstractEventLoop]
+
+
+def get_loop_factory(loop: Literal["asyncio", "uvloop"] | LoopFactory | None) -> LoopFactory | None:
+    """Resolves the event loop option of `Crawler` into a loop factory accepted by `asyncio.Runner`.
+
+    Raises:
+        ImportError: If "uvloop" is requested but not installed.
+        ValueError: If the loop name is unknown.
+    """
+    if loop is None or loop == "asyncio":
+        return None
+    if callable(loop):
+        return loop
+    if loop == "uvloop":
+        try:
+            import uvloop
+        except ImportError:
+            logger.error("uvloop is not installed")
+            raise ImportError('Install uvloop to use it as event loop: pip install "arc-crawler[uvloop]"')
+        return uvloop.new_event_loop
+
+    logger.error(f'Unknown event loop "{loop}"')
+    raise ValueError('Acceptable values are: "asyncio", "uvloop" or a function creating an event loop')
+
+
+def run(
+    coroutine: Coroutine[Any, Any, T],
+    loop_factory: LoopFactory | None = None,
+    default_executor_workers: int | None = None,
+) -> T:
+    """Runs the coroutine in a new event loop, like `asyncio.run()`, applying loop-level settings.
+
+    Args:
+        coroutine (Coroutine): The coroutine to run.
+
+        loop_factory (Callable[[], asyncio.AbstractEventLoop], optional): Creates the event loop
+            (e.g., `uvloop.new_event_loop`). Defaults to `None` (the default asyncio loop).
+
+        default_executor_workers (int, optional): The number of threads of the loop's default executor
+            used by `asyncio.to_thread()` and `loop.run_in_executor(None, ...)` (e.g., by `ResponseCache`).
+            Defaults to `None` (asyncio default).
+    """
+    with asyncio.Runner(loop_factory=loop_factory) as runner:
+        if default_executor_workers is not None:
+            # Runner shuts the default executor down on exit
+            runner.get_loop().set_default_executor(ThreadPoolExecutor(max_workers=default_executor_workers))
+        return runner.run(coroutine)
@@ -0,0 +1,59 @@
+import asyncio
+import hashlib as hl
+from queue import Queue, Full
+from typing import AsyncIterator, Callable, List, Sequence
+
+from .fetcher import iterate_urls
+from .limiter import RateLimiter
+from .types import UrlSource
+
+# Marks the end of URLs sent to a shard
+SHARD_END = None
+
+
+def get_shard(url: str, shards: int) -> int:
+    """Picks a shard for the URL based on its host, so all requests to a host are sent by the same worker.
+
+    Stable across processes and runs (unlike built-in `hash()`), so resumed jobs pick the same shards.
+    """
+    digest = hl.sha1(RateLimiter.get_host(url).encode("utf-8")).digest()
+    return int.from_bytes(digest[:8], "big") % shards
+
+
+def get_shard_name(name: str, shard: int, shards: int) -> str:
+    return f"{name}_shard_{shard}_of_{shards}"
+
+
+def split_urls(urls: List[str], shards: int) -> List[List[str]]:
+    shard_urls = [[] for _ in range(shards)]
+    for url in urls:
+        shard_urls[get_shard(url, shards)].append(url)
+    return shard_urls
+
+
+async def feed_shards(urls: UrlSource, queues: Sequence[Queue], is_alive: Callable[[int], bool]):
+    """Distributes lazily consumed URLs between shard queues, blocking while queues are full.
+
+    Stops early if a worker fails, so the rest of the workers finish their current URLs and exit.
+    """
+
+    async def put(shard: int, item: str | None) -> bool:
+        while is_alive(shard):
+            try:
+                await asyncio.to_thread(queues[shard].put, item, timeout=1)
+                return True
+            except Full:
+                pass
+        return False
+
+    async for url in iterate_urls(urls):
+        if not await put(get_shard(url, len(queues)), url):
+            break
+
+    for shard in range(len(queues)):
+        await put(shard, SHARD_END)
+
+
+async def iterate_queue(queue: Queue) -> AsyncIterator[str]:
+    while (url := await asyncio.to_thread(queue.get)) is not SHARD_END:
+        yield url
@@ -0,0 +1,225 @@
+import asyncio
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from importlib.util import find_spec
+from typing import Any, AsyncIterator, Dict, Mapping
+
+import aiohttp
+from aiohttp import ClientSession, ClientResponse, ClientTimeout
+from yarl import URL
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+from .types import RequestOptions, TransportResponse
+
+
+class Transport(ABC):
+    """Sends requests of a fetcher and returns their responses.
+
+    `AiohttpTransport` (used by default) sends requests through the aiohttp session of the run. Other transports
+    may use any HTTP client, as long as responses implement `TransportResponse` and failures are raised as
+    `aiohttp.ClientError` or `asyncio.TimeoutError`, so retry policies and circuit breakers handle them the same way.
+
+    The session is still created for every run and passed to `on_response` callbacks for follow-up requests.
+
+    Example:
+            >>> from arc_crawler import Transport, AiohttpTransport
+            >>> class LoggingTransport(Transport):
+            ...     def __init__(self):
+            ...         self.default = AiohttpTransport()
+            ...
+            ...     async def get(self, session, url, options):
+            ...         print(f"GET {url}")
+            ...         return await self.default.get(session, url, options)
+    """
+
+    @abstractmethod
+    async def get(self, session: ClientSession, url: str, options: RequestOptions) -> TransportResponse:
+        """Sends a GET request and returns the response once its headers are received.
+
+        Args:
+            session (aiohttp.ClientSession): The session of the current run.
+
+            url (str): The requested URL.
+
+            options (RequestOptions): Request options (`headers`, `timeout`, `proxy`).
+        """
+        pass
+
+    async def aclose(self):
+        """Releases resources (e.g., connections) held by the transport. Called at the end of every run."""
+        pass
+
+
+class AiohttpResponse:
+    __slots__ = ("_response",)
+
+    def __init__(self, response: ClientResponse):
+        self._response = response
+
+    @property
+    def status(self) -> int:
+        return self._response.status
+
+    @property
+    def headers(self) -> Mapping[str, str]:
+        return self._response.headers
+
+    @property
+    def url(self) -> URL:
+        return self._response.url
+
+    async def read(self) -> bytes:
+        return await self._response.read()
+
+    def iter_chunked(self, size: int) -> AsyncIterator[bytes]:
+        return self._response.content.iter_chunked(size)
+
+    def get_encoding(self) -> str:
+        return self._response.get_encoding()
+
+    async def release(self):
+        self._response.release()
+
+    async def close(self):
+        # Drops the connection, so the rest of the body is never transferred
+        self._response.close()
+
+
+class AiohttpTransport(Transport):
+    """Sends requests through the aiohttp session of the run (HTTP/1.1). The default transport."""
+
+    async def get(self, session: ClientSession, url: str, options: RequestOptions) -> AiohttpResponse:
+        return AiohttpResponse(await session.get(url, **options))
+
+
+@contextmanager
+def _translate_httpx_errors():
+    import httpx
+
+    try:
+        yield
+    except httpx.TimeoutException as e:
+        raise asyncio.TimeoutError(str(e)) from e
+    except httpx.TransportError as e:
+        raise aiohttp.ClientConnectionError(f"{type(e).__name__}: {e}") from e
+
+
+class HttpxResponse:
+    __slots__ = ("_response",)
+
+    def __init__(self, response: Any):
+        self._response = response
+
+    @property
+    def status(self) -> int:
+        return self._response.status_code
+
+    @property
+    def headers(self) -> Mapping[str, str]:
+        return self._response.headers
+
+    @property
+    def url(self) -> URL:
+        return URL(str(self._response.url), encoded=True)
+
+    async def read(self) -> bytes:
+        with _translate_httpx_errors():
+            return await self._response.aread()
+
+    async def iter_chunked(self, size: int) -> AsyncIterator[bytes]:
+        with _translate_httpx_errors():
+            async for chunk in self._response.aiter_bytes(size):
+                yield chunk
+
+    def get_encoding(self) -> str:
+        return self._response.encoding or "utf-8"
+
+    async def release(self):
+        await self._response.aclose()
+
+    async def close(self):
+        await self._response.aclose()
+
+
+class HttpxTransport(Transport):
+    """Sends requests with `httpx`, multiplexing requests to the same host over a single HTTP/2 connection.
+
+    Useful for jobs sending many small requests to a few hosts: instead of opening a connection per concurrent
+    request, HTTP/2 hosts are served by one connection carrying many concurrent streams. HTTP/2 is negotiated
+    over TLS (ALPN), while hosts that don't support it are requested over HTTP/1.1. Requires `httpx` with HTTP/2
+    support (`pip install arc-crawler[http2]`).
+
+    Headers of the run's session are sent with every request, but other session settings (cookies, connector,
+    `ConnectionPool` limits) don't apply: pass httpx client arguments instead (e.g., `limits`, `verify`, `proxy`).
+    Per-request proxies (`ProxyPool` or `proxy` returned by `on_request`) are not supported by httpx.
+
+    Example:
+            >>> import httpx
+            >>> from arc_crawler import Crawler, HttpxTransport
+            >>> crawler = Crawler(transport=HttpxTransport(limits=httpx.Limits(max_connections=20)))
+    """
+
+    def __init__(self, http2: bool = True, **client_kwargs):
+        """Initializes a `HttpxTransport` instance.
+
+        Args:
+            http2 (bool, optional): Enables HTTP/2. Defaults to `True`.
+
+            **client_kwargs: Arguments of `httpx.AsyncClient`. E.g., `http1=False` sends HTTP/2 requests
+                with prior knowledge to plain-text (`http://`) hosts supporting it.
+
+        Raises:
+            ImportError: If `httpx` (or `h2` for HTTP/2) is not installed.
+        """
+        # Only checked here, httpx is imported once the client is created
+        required_modules = ("httpx", "h2") if http2 else ("httpx",)
+        if any(find_spec(module) is None for module in required_modules):
+            raise ImportError(
+                "HttpxTransport requires httpx with HTTP/2 support. Install it with `pip install arc-crawler[http2]`"
+            )
+
+        self.http2 = http2
+        self.client_kwargs = client_kwargs
+        # Created on first use, so the transport can be sent to worker processes and reused across runs
+        self._client: Any = None
+
+    def _get_client(self):
+        if self._client is None:
+            import httpx
+
+            self._client = httpx.AsyncClient(http2=self.http2, **self.client_kwargs)
+        return self._client
+
+    @staticmethod
+    def _convert_timeout(timeout: ClientTimeout):
+        import httpx
+
+        # httpx has no deadline for the whole request, so `total` limits each connect/read/write operation
+        return httpx.Timeout(
+            timeout.total,
+            connect=timeout.connect or timeout.sock_connect or timeout.total,
+            read=timeout.sock_read or timeout.total,
+        )
+
+    async def get(self, session: ClientSession, url: str, options: RequestOptions) -> HttpxResponse:
+        if "proxy" in options:
+            logger.error("Per-request proxies are not supported by HttpxTransport")
+            raise ValueError("Pass a proxy to HttpxTransport(proxy=...) instead of per-request options")
+
+        client = self._get_client()
+        headers: Dict[str, str] = {**session.headers, **options.get("headers", {})}
+        request_kwargs = {"headers": headers}
+        if "timeout" in options:
+            request_kwargs["timeout"] = self._convert_timeout(options["timeout"])
+
+        with _translate_httpx_errors():
+            request = client.build_request("GET", url, **request_kwargs)
+            return HttpxResponse(await client.send(request, stream=True, follow_redirects=True))
+
+    async def aclose(self):
+        if self._client is not None:
+            client, self._client = self._client, None
+            await client.aclose()
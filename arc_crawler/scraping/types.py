@@ -1,8 +1,33 @@
-from typing import List, Callable, Any, TypedDict, Protocol, Unpack, overload
-from aiohttp import ClientSession
+from typing import (
+    List,
+    Dict,
+    Callable,
+    Any,
+    TypedDict,
+    Protocol,
+    Unpack,
+    Mapping,
+    Iterable,
+    AsyncIterable,
+    TYPE_CHECKING,
+    Literal,
+    AsyncIterator,
+    overload,
+)
+from aiohttp import ClientSession, ClientTimeout
+from yarl import URL
 
 from arc_crawler.reader import JsonSerializable
 
+if TYPE_CHECKING:
+    from .pool import ConnectionPool
+    from .cache import ResponseCache
+    from .breaker import CircuitBreaker
+    from .hedging import HedgingPolicy
+    from .proxy import ProxyPool
+    from .transport import Transport
+    from .follow_up import FollowUpCache
+
 
 class BasicResponse(TypedDict):
     text: str | None
@@ -10,6 +35,9 @@ class BasicResponse(TypedDict):
     status: int
     ok: bool
     url: str
+    request_url: str
+    etag: str | None
+    last_modified: str | None
 
 
 class TerminationFuncKwargs(TypedDict):
@@ -26,6 +54,16 @@ TerminationCriteria = TerminationFunc | List[int | range]
 
 RequestProcessor = Callable[[str], None]
 
+# Lists, generators (e.g., over a database cursor) and async iterables are consumed lazily by fetchers
+UrlSource = Iterable[str] | AsyncIterable[str]
+
+# Extracts absolute URLs of links from a response
+LinkExtractor = Callable[[BasicResponse], Iterable[str]]
+
+# Which discovered links are followed: links to the hosts of seeds, their domains (including subdomains),
+# any links (`None`) or the ones accepted by a function receiving a canonical URL
+CrawlScope = Literal["host", "domain"] | Callable[[str], bool] | None
+
 
 class ResponseHandlerKwargs(TypedDict):
     response: BasicResponse
@@ -41,11 +79,39 @@ class OnResponseCallback(Protocol):
         pass
 
 
+class RequestOptions(TypedDict, total=False):
+    headers: Dict[str, str]
+    timeout: ClientTimeout
+    proxy: str
+
+
+class TransportResponse(Protocol):
+    """A response returned by `Transport.get()` once its headers are received."""
+
+    status: int
+    headers: Mapping[str, str]
+    url: URL
+
+    async def read(self) -> bytes: ...
+
+    def iter_chunked(self, size: int) -> AsyncIterator[bytes]: ...
+
+    def get_encoding(self) -> str: ...
+
+    async def release(self) -> None:
+        """Returns the connection to the pool once the body is read (or drains it)."""
+        ...
+
+    async def close(self) -> None:
+        """Drops the connection without reading the rest of the body."""
+        ...
+
+
 class OnRequestCallback(Protocol):
     @overload
-    async def __call__(self, url: str) -> None: ...
+    async def __call__(self, url: str) -> RequestOptions | None: ...
 
-    def __call__(self, url: str) -> None: ...
+    def __call__(self, url: str) -> RequestOptions | None: ...
 
 
 class ResponseProcessor(Protocol):
@@ -53,3 +119,80 @@ class ResponseProcessor(Protocol):
     async def __call__(self, **kwargs: Unpack[ResponseHandlerKwargs]) -> JsonSerializable: ...
 
     def __call__(self, **kwargs: Unpack[ResponseHandlerKwargs]) -> JsonSerializable: ...
+
+
+class HostLimits(TypedDict, total=False):
+    rate: int | float | None
+    burst: int
+    max_concurrent_requests: int | None
+
+
+class ResponseFilterKwargs(TypedDict):
+    url: str
+    status: int
+    headers: Mapping[str, str]
+
+
+class ResponseFilter(Protocol):
+    def __call__(self, **kwargs: Unpack[ResponseFilterKwargs]) -> bool:
+        pass
+
+
+class FetcherOptions(TypedDict, total=False):
+    max_body_size: int | None
+    response_filter: ResponseFilter | None
+    chunk_size: int
+    connection_pool: "ConnectionPool | None"
+    response_cache: "ResponseCache | None"
+    circuit_breaker: "CircuitBreaker | None"
+    request_timeout: float | ClientTimeout | None
+    hedging_policy: "HedgingPolicy | None"
+    proxy_pool: "ProxyPool | None"
+    transport: "Transport | None"
+    follow_up_cache: "FollowUpCache | None"
+
+
+class PoolStats(TypedDict):
+    requests: int
+    connections_opened: int
+    connections_reused: int
+    dns_cache_hits: int
+    dns_cache_misses: int
+    warmed_up_connections: int
+
+
+class CachedResponse(TypedDict):
+    status: int
+    url: str
+    headers: Dict[str, str]
+    encoding: str
+    stored_at: float
+    body: bytes
+
+
+class CacheStats(TypedDict):
+    hits: int
+    misses: int
+    stores: int
+    evictions: int
+
+
+class HedgingStats(TypedDict):
+    requests: int
+    hedged: int
+    hedges_won: int
+
+
+class FollowUpStats(TypedDict):
+    requests: int
+    fetched: int
+    coalesced: int
+    memo_hits: int
+
+
+class ProxyStats(TypedDict):
+    requests: int
+    failures: int
+    latency: float | None
+    evictions: int
+    is_evicted: bool
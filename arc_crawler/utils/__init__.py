@@ -1,4 +1,7 @@
 from .common import input_prompt, convert_size
+from .codec import JsonCodec, get_codec, set_codec, current_codec, json_dumps, json_loads
 from .file import open_lines, open_json, overwrite_file, write_line
 from .logger import FormatedLogger
 from .timer import Timer
+from .url import canonicalize_url
+from .bloom import BloomFilter
@@ -0,0 +1,139 @@
+from abc import ABC, abstractmethod
+from typing import Any, Dict
+import json
+import os
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class JsonCodec(ABC):
+    """Encodes and decodes JSON documents used across fetching and storage.
+
+    Works with bytes on both ends, so data read from network or disk is never decoded to `str` first.
+    Extend this class to plug in another JSON library with `set_codec()`.
+    """
+
+    name: str = ""
+
+    @abstractmethod
+    def dumps(self, obj: Any) -> bytes:
+        """Serializes the object into compact UTF-8 encoded JSON without a trailing newline."""
+        pass
+
+    @abstractmethod
+    def loads(self, data: bytes | str) -> Any:
+        """Deserializes a JSON document. Surrounding whitespace is ignored."""
+        pass
+
+
+class StdlibCodec(JsonCodec):
+    name = "json"
+
+    def dumps(self, obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+    def loads(self, data: bytes | str) -> Any:
+        return json.loads(data)
+
+
+class OrjsonCodec(JsonCodec):
+    name = "orjson"
+
+    def __init__(self):
+        import orjson
+
+        self._orjson = orjson
+        self._fallback = StdlibCodec()
+
+    def dumps(self, obj: Any) -> bytes:
+        try:
+            return self._orjson.dumps(obj, option=self._orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            # Some values are handled by stdlib only (e.g., integers exceeding 64 bits)
+            return self._fallback.dumps(obj)
+
+    def loads(self, data: bytes | str) -> Any:
+        return self._orjson.loads(data)
+
+
+class MsgspecCodec(JsonCodec):
+    name = "msgspec"
+
+    def __init__(self):
+        import msgspec
+
+        self._encoder = msgspec.json.Encoder()
+        self._decoder = msgspec.json.Decoder()
+        self._fallback = StdlibCodec()
+
+    def dumps(self, obj: Any) -> bytes:
+        try:
+            return self._encoder.encode(obj)
+        except (TypeError, OverflowError):
+            return self._fallback.dumps(obj)
+
+    def loads(self, data: bytes | str) -> Any:
+        return self._decoder.decode(data)
+
+
+# Ordered by preference: the first installed one is used by default
+CODECS: Dict[str, type[JsonCodec]] = {
+    OrjsonCodec.name: OrjsonCodec,
+    MsgspecCodec.name: MsgspecCodec,
+    StdlibCodec.name: StdlibCodec,
+}
+
+
+def get_codec(name: str | None = None) -> JsonCodec:
+    """Creates a codec by name ("orjson", "msgspec" or "json").
+
+    Without a name, picks the fastest installed library, unless `ARC_CRAWLER_JSON_CODEC` environment variable
+    names a specific one.
+
+    Raises:
+        ValueError: If the codec name is unknown.
+        ImportError: If the requested library is not installed.
+    """
+    name = name or os.environ.get("ARC_CRAWLER_JSON_CODEC")
+    if name is not None:
+        codec = CODECS.get(name)
+        if codec is None:
+            logger.error(f'Unknown JSON codec "{name}"')
+            raise ValueError(f"Acceptable values are: {', '.join(CODECS.keys())}")
+        return codec()
+
+    for codec in CODECS.values():
+        try:
+            return codec()
+        except ImportError:
+            continue
+
+
+_codec: JsonCodec = get_codec()
+
+
+def set_codec(codec: str | JsonCodec) -> JsonCodec:
+    """Sets the codec used by fetchers, `IndexReader` and file utilities.
+
+    Examples:
+        >>> from arc_crawler.utils import set_codec
+        >>> set_codec("json")
+    """
+    global _codec
+    _codec = get_codec(codec) if isinstance(codec, str) else codec
+    logger.debug(f'Using "{_codec.name}" JSON codec')
+    return _codec
+
+
+def current_codec() -> JsonCodec:
+    return _codec
+
+
+def json_dumps(obj: Any) -> bytes:
+    return _codec.dumps(obj)
+
+
+def json_loads(data: bytes | str) -> Any:
+    return _codec.loads(data)
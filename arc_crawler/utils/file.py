@@ -1,30 +1,35 @@
 from typing import Any
 
-import json
 from pathlib import Path
 
+from .codec import json_dumps, json_loads
+
 
 def open_lines(path: str | Path):
     result = []
-    with open(path, "r", encoding="utf-8") as file:
+    with open(path, "rb") as file:
         for line in file:
-            data = json.loads(line.strip())
+            if not line.strip():
+                continue
+            data = json_loads(line)
             if data:
                 result.append(data)
     return result
 
 
-def write_line(path: str | Path, line: Any):
-    with open(path, "a", encoding="utf-8") as file:
-        json.dump(line, file, ensure_ascii=False)
-        file.write("\n")
+def write_line(path: str | Path, line: Any) -> int:
+    """Appends an object as a JSON line. Returns the number of bytes written."""
+    payload = json_dumps(line) + b"\n"
+    with open(path, "ab") as file:
+        file.write(payload)
+    return len(payload)
 
 
 def overwrite_file(path: str | Path, content: Any):
-    with open(path, "w", encoding="utf-8") as file:
-        json.dump(content, file, ensure_ascii=False)
+    with open(path, "wb") as file:
+        file.write(json_dumps(content))
 
 
 def open_json(path: str | Path):
-    with open(path, "r", encoding="utf-8") as file:
-        return json.load(file)
+    with open(path, "rb") as file:
+        return json_loads(file.read())
@@ -7,7 +7,7 @@ logger = logging.getLogger(__name__)
 
 
 class Timer:
-    def __init__(self, total_measures: int = 0, measures_completed: int = 0):
+    def __init__(self, total_measures: int | None = 0, measures_completed: int = 0):
         self.measurement_id = None
         self.timestamps = {}
         self.default_key = object()
@@ -32,6 +32,12 @@ class Timer:
             del self.timestamps[uid]
 
     def print_status(self, with_progressbar=True, with_time_remaining=False):
+        if self.total_measures is None:
+            # Total is unknown for lazily consumed inputs, so there's no progress to estimate
+            logger.info(f"Finished {self.measured_count + self.already_completed}.")
+            print("\n\n")
+            return
+
         logger.info(f"Finished {self.measured_count + self.already_completed} out of {self.total_measures}.")
 
         if with_progressbar:
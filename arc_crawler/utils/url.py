@@ -0,0 +1,66 @@
+import re
+from urllib.parse import quote, urlsplit, urlunsplit
+
+DEFAULT_PORTS = {"http": 80, "https": 443}
+UNRESERVED = frozenset("ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-._~")
+# Characters left as is when re-quoting: reserved ones keep their meaning, "%" keeps existing escapes
+SAFE_CHARS = "/%:@!$&'()*+,;=~"
+
+_escape_pattern = re.compile(r"%([0-9a-fA-F]{2})")
+
+
+def _normalize_escapes(value: str) -> str:
+    def replace(match: re.Match) -> str:
+        char = chr(int(match.group(1), 16))
+        return char if char in UNRESERVED else f"%{match.group(1).upper()}"
+
+    return quote(_escape_pattern.sub(replace, value), safe=SAFE_CHARS)
+
+
+def _remove_dot_segments(path: str) -> str:
+    segments = []
+    for segment in path.split("/"):
+        if segment == "..":
+            if len(segments) > 1:
+                segments.pop()
+        elif segment != ".":
+            segments.append(segment)
+    if path.endswith(("/.", "/..")):
+        segments.append("")
+    return "/".join(segments)
+
+
+def canonicalize_url(url: str, sort_query: bool = True) -> str:
+    """Normalizes a URL, so different spellings of the same address compare equal.
+
+    Lowercases scheme and host, drops default ports, fragments and empty query strings, resolves `.` and `..`
+    path segments and normalizes percent-encoding (unreserved characters are decoded, the rest are encoded
+    with uppercase hex digits). Query parameters are sorted unless `sort_query` is `False`.
+
+    Raises:
+        ValueError: If the URL is malformed (e.g., an invalid port or IPv6 host).
+
+    Examples:
+        >>> from arc_crawler.utils import canonicalize_url
+        >>> canonicalize_url("HTTPS://Example.com:443/a/./b/../c?b=2&a=%7e1#top")
+        'https://example.com/a/c?a=~1&b=2'
+    """
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+
+    host = (parts.hostname or "").rstrip(".")
+    if ":" in host:
+        host = f"[{host}]"
+    if parts.port is not None and parts.port != DEFAULT_PORTS.get(scheme):
+        host = f"{host}:{parts.port}"
+    if parts.username is not None:
+        credentials = parts.username + (f":{parts.password}" if parts.password is not None else "")
+        host = f"{credentials}@{host}"
+
+    path = _remove_dot_segments(_normalize_escapes(parts.path)) or "/"
+
+    params = [_normalize_escapes(param) for param in parts.query.split("&") if param]
+    if sort_query:
+        params.sort()
+
+    return urlunsplit((scheme, host, path, "&".join(params), ""))
@@ -0,0 +1,101 @@
+"""Compares throughput of the fetching path on the default asyncio event loop and uvloop.
+
+A local aiohttp server is started in separate processes, so the client loop is the measured bottleneck.
+
+Usage:
+    python benchmarks/event_loop.py --requests 20000 --concurrency 256
+"""
+
+import argparse
+import multiprocessing
+import socket
+from time import perf_counter, sleep
+
+from aiohttp import web
+
+from arc_crawler import ParallelFetcher, ConnectionPool
+from arc_crawler.scraping.runner import get_loop_factory, run
+
+BODY = "x" * 1024
+
+
+def serve(port: int):
+    async def handle(_):
+        return web.Response(text=BODY)
+
+    app = web.Application()
+    app.router.add_get("/{path:.*}", handle)
+    try:
+        import uvloop
+
+        loop_factory = uvloop.new_event_loop
+    except ImportError:
+        loop_factory = None
+    web.run_app(app, host="127.0.0.1", port=port, reuse_port=True, print=None, loop=loop_factory and loop_factory())
+
+
+def wait_for_server(port: int, timeout: float = 10):
+    start_time = perf_counter()
+    while perf_counter() - start_time < timeout:
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=1).close()
+            return
+        except OSError:
+            sleep(0.05)
+    raise TimeoutError("Benchmark server didn't start")
+
+
+def get_free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def crawl(urls, concurrency: int) -> int:
+    fetcher = ParallelFetcher(max_concurrent_requests=concurrency, connection_pool=ConnectionPool(limit=concurrency))
+    received = 0
+
+    def on_response(**_):
+        nonlocal received
+        received += 1
+
+    await fetcher.get(urls, on_response=on_response)
+    return received
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=20000)
+    parser.add_argument("--concurrency", type=int, default=256)
+    parser.add_argument("--server-processes", type=int, default=2)
+    parser.add_argument("--loops", nargs="+", default=["asyncio", "uvloop"])
+    args = parser.parse_args()
+
+    port = get_free_port()
+    servers = [multiprocessing.Process(target=serve, args=(port,), daemon=True) for _ in range(args.server_processes)]
+    for server in servers:
+        server.start()
+
+    base_url = f"http://127.0.0.1:{port}"
+    urls = [f"{base_url}/{i}" for i in range(args.requests)]
+    try:
+        wait_for_server(port)
+        run(crawl(urls[:10], 1))
+        for loop in args.loops:
+            try:
+                loop_factory = get_loop_factory(loop)
+            except ImportError as e:
+                print(f"{loop}: skipped ({e})")
+                continue
+
+            start_time = perf_counter()
+            received = run(crawl(urls, args.concurrency), loop_factory=loop_factory)
+            elapsed = perf_counter() - start_time
+            print(f"{loop:>8}: {received} responses in {elapsed:.2f}s, {received / elapsed:,.0f} requests/sec")
+    finally:
+        for server in servers:
+            server.terminate()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+"""Compares throughput of transports on a workload of many small requests to a single host.
+
+* aiohttp: `AiohttpTransport` (HTTP/1.1, a connection per concurrent request)
+* httpx: `HttpxTransport(http2=False)` (HTTP/1.1)
+* http2: `HttpxTransport` multiplexing requests over HTTP/2 connections (h2c with prior knowledge)
+
+A local server is started in a separate process: hypercorn serving both HTTP/1.1 and HTTP/2 when installed
+(`pip install hypercorn`), otherwise aiohttp (HTTP/1.1 only, so "http2" is skipped).
+
+On loopback, client CPU overhead per request dominates (httpx has more of it than aiohttp). Compare "httpx" and
+"http2" to see the effect of multiplexing; its gains grow with network round-trip and TLS handshake times.
+
+Usage:
+    python benchmarks/transport.py --requests 10000 --concurrency 100
+"""
+
+import argparse
+import asyncio
+import multiprocessing
+from time import perf_counter
+
+from aiohttp import web
+
+from arc_crawler import ParallelFetcher, ConnectionPool, AiohttpTransport, HttpxTransport, Transport
+from arc_crawler.scraping.runner import run
+from event_loop import get_free_port, wait_for_server
+
+BODY = b"x" * 512
+
+
+async def asgi_app(scope, receive, send):
+    if scope["type"] != "http":
+        return
+    await send({"type": "http.response.start", "status": 200, "headers": [(b"content-type", b"text/plain")]})
+    await send({"type": "http.response.body", "body": BODY})
+
+
+def serve_hypercorn(port: int):
+    from hypercorn.asyncio import serve
+    from hypercorn.config import Config
+
+    config = Config()
+    config.bind = [f"127.0.0.1:{port}"]
+    config.accesslog = None
+    config.errorlog = None
+    # Connections are closed after 1000 requests by default, failing HTTP/2 streams in flight
+    config.keep_alive_max_requests = 10**9
+    asyncio.run(serve(asgi_app, config))
+
+
+def serve_aiohttp(port: int):
+    async def handle(_):
+        return web.Response(body=BODY, content_type="text/plain")
+
+    app = web.Application()
+    app.router.add_get("/{path:.*}", handle)
+    web.run_app(app, host="127.0.0.1", port=port, print=None)
+
+
+def get_transport(name: str, concurrency: int) -> Transport:
+    if name == "aiohttp":
+        return AiohttpTransport()
+
+    import httpx
+
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    if name == "httpx":
+        return HttpxTransport(http2=False, limits=limits)
+    return HttpxTransport(http1=False, limits=limits)
+
+
+async def crawl(urls, concurrency: int, transport: Transport) -> int:
+    fetcher = ParallelFetcher(
+        max_concurrent_requests=concurrency, connection_pool=ConnectionPool(limit=concurrency), transport=transport
+    )
+    received = 0
+
+    def on_response(**_):
+        nonlocal received
+        received += 1
+
+    await fetcher.get(urls, on_response=on_response)
+    return received
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=10000)
+    parser.add_argument("--concurrency", type=int, default=100)
+    parser.add_argument("--transports", nargs="+", default=["aiohttp", "httpx", "http2"])
+    args = parser.parse_args()
+
+    try:
+        import hypercorn
+
+        server_target, supports_http2 = serve_hypercorn, True
+    except ImportError:
+        server_target, supports_http2 = serve_aiohttp, False
+
+    port = get_free_port()
+    server = multiprocessing.Process(target=server_target, args=(port,), daemon=True)
+    server.start()
+
+    base_url = f"http://127.0.0.1:{port}"
+    urls = [f"{base_url}/{i}" for i in range(args.requests)]
+    try:
+        wait_for_server(port)
+        for name in args.transports:
+            if name == "http2" and not supports_http2:
+                print(f"{name:>8}: skipped (hypercorn is not installed)")
+                continue
+            try:
+                transport = get_transport(name, args.concurrency)
+            except ImportError as e:
+                print(f"{name:>8}: skipped ({e})")
+                continue
+
+            run(crawl(urls[:10], 1, transport))
+            start_time = perf_counter()
+            received = run(crawl(urls, args.concurrency, transport))
+            elapsed = perf_counter() - start_time
+            print(f"{name:>8}: {received} responses in {elapsed:.2f}s, {received / elapsed:,.0f} requests/sec")
+    finally:
+        server.terminate()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,7 @@
 from typing import Unpack
 import random
 
-from arc_crawler import Crawler, ResponseHandlerKwargs
+from arc_crawler import Crawler, Frontier, FollowUpCache, ResponseHandlerKwargs
 
 
 # Scrapes JSON Placeholder entries, skipping non-existent ones
@@ -35,31 +35,21 @@ def fetch_skipping_not_found():
 
 # Scrapes JSON Placeholder posts, extending each with user info.
 def follow_up_fetching():
-    # Using sync mode to respect service rate limits
-    sync_crawler = Crawler(out_file_path="./output", mode="sync")
+    # Posts are fetched concurrently, while user requests sent by the processor are deduplicated:
+    # concurrent requests for the same user share a single response, later ones are served from memory
+    crawler = Crawler(out_file_path="./output", follow_up_cache=FollowUpCache(ttl=600))
     urls_to_fetch = [f"https://jsonplaceholder.typicode.com/posts/{index}" for index in range(1, 31)]
     random.shuffle(urls_to_fetch)
 
-    # Using a list as a cache for user data, accessible by user ID
-    user_cache = [None] * len(urls_to_fetch)
-
     async def append_user_data(**kwargs: Unpack[ResponseHandlerKwargs]):
         response, session = kwargs.get("response"), kwargs.get("session")
-        record = response.get("json")
 
-        # Getting user ID from the response and trying to find user data in the cache
-        user_id = record.get("userId")
-        cached_user = user_cache[user_id]
-
-        if not cached_user:
-            # If not found in cache fetching user data using session provided
-            user_response = await session.get(f"https://jsonplaceholder.typicode.com/users/{user_id}")
-            user_json = await user_response.json(encoding="utf-8")
-            user_cache[user_id] = user_json
-            cached_user = user_json
+        # Fetching user data of the post using session provided
+        user_id = response.get("json").get("userId")
+        user_response = await session.get(f"https://jsonplaceholder.typicode.com/users/{user_id}")
 
         # Appending user info into response's "json" field
-        response["json"]["user"] = cached_user
+        response["json"]["user"] = await user_response.json(encoding="utf-8")
         # Writing only the JSON entry to the file
         return response["json"]
 
@@ -67,7 +57,7 @@ def follow_up_fetching():
     def extend_index_record(obj):
         return {"user": {"id": obj["user"]["id"], "username": obj["user"]["username"], "email": obj["user"]["email"]}}
 
-    reader = sync_crawler.get(
+    reader = crawler.get(
         urls_to_fetch,
         out_file_name="user-posts",
         request_delay=0.05,
@@ -83,6 +73,31 @@ def follow_up_fetching():
     )
 
 
+# Scrapes JSON Placeholder users first, then their posts discovered while crawling
+def prioritized_follow_ups():
+    crawler = Crawler(out_file_path="./output", mode="async", max_concurrent_requests=4)
+    # Users are crawled first, posts of the users fill idle capacity once they are discovered
+    frontier = Frontier([f"https://jsonplaceholder.typicode.com/users/{index}" for index in range(1, 11)], 10)
+
+    def push_user_posts(**kwargs: Unpack[ResponseHandlerKwargs]):
+        response = kwargs.get("response")
+        record = response.get("json")
+
+        if "/users/" in response.get("request_url"):
+            # Instead of fetching follow-ups with the session, push them into the same crawl.
+            # They share output, rate limits, retries and resumption with the rest of the URLs
+            for index in range(1, 11):
+                post_index = (record["id"] - 1) * 10 + index
+                # Posts of the first users are more important
+                frontier.push(f"https://jsonplaceholder.typicode.com/posts/{post_index}", priority=-record["id"])
+        return record
+
+    reader = crawler.get(
+        frontier, out_file_name="users-and-posts", request_delay=0.05, response_processor=push_user_posts
+    )
+    print(f"I've gathered {len(reader)} entries, starting from 10 user URLs.")
+
+
 if __name__ == "__main__":
     # fetch_skipping_not_found()
     follow_up_fetching()
@@ -0,0 +1,104 @@
+import asyncio
+import os
+import pickle
+from typing import List
+
+from arc_crawler import ParallelFetcher, SequentialFetcher, ResponseCache, CachedResponse
+from helpers import NetworkRequest, MockNetwork
+
+
+class TestResponseCache:
+    def setup_method(self):
+        self.requests: List[NetworkRequest] = [
+            {"url": "https://text.io", "response": {"status": 200, "text": "Success"}},
+            {"url": "https://json.io", "response": {"status": 200, "json": {"foo": "bar"}}},
+            {"url": "https://not-found.io", "response": {"status": 404, "text": "Not found"}},
+            {
+                "url": "https://flaky.io",
+                "response": [{"status": 503, "text": "Unavailable"}, {"status": 200, "text": "Recovered"}],
+            },
+        ]
+
+    def test_responses_are_replayed(self, monkeypatch, tmp_path):
+        requests = MockNetwork(self.requests, monkeypatch)
+        cache = ResponseCache(tmp_path)
+
+        def run(fetcher):
+            responses = {}
+            asyncio.run(
+                fetcher.get(
+                    urls=requests.urls,
+                    on_response=lambda **kwargs: responses.update({str(kwargs["response"]["url"]): kwargs["response"]}),
+                )
+            )
+            return responses
+
+        first_run = run(SequentialFetcher(response_cache=cache))
+        second_run = run(ParallelFetcher(response_cache=cache))
+
+        # Cached responses never reach the network again, while the transient 503 is not cached
+        assert requests.request_counts == {
+            "https://text.io": 1,
+            "https://json.io": 1,
+            "https://not-found.io": 1,
+            "https://flaky.io": 2,
+        }
+        assert second_run["https://json.io"]["json"] == {"foo": "bar"}
+        assert second_run["https://text.io"]["text"] == first_run["https://text.io"]["text"] == "Success"
+        assert second_run["https://not-found.io"]["status"] == 404
+        assert second_run["https://flaky.io"]["text"] == "Recovered"
+        assert cache.stats == {"hits": 3, "misses": 5, "stores": 4, "evictions": 0}
+
+    def test_ttl_and_eviction(self, tmp_path):
+        cache = ResponseCache(tmp_path, ttl=60, max_size=2500, compression_level=0)
+
+        def entry(stored_at: float) -> CachedResponse:
+            return {
+                "status": 200,
+                "url": "https://example.com",
+                "headers": {},
+                "encoding": "utf-8",
+                "stored_at": stored_at,
+                "body": os.urandom(1000),
+            }
+
+        async def run():
+            keys = [cache.get_key("GET", f"https://example.com/{i}") for i in range(3)]
+            await cache.store(keys[0], entry(0))
+            assert await cache.load(keys[0]) is None
+
+            await cache.store(keys[0], entry(1e12))
+            await cache.store(keys[1], entry(1e12))
+            # Recently used entry survives eviction
+            os.utime(cache._get_blob_path(keys[0]), (0, 0))
+            os.utime(cache._get_blob_path(keys[1]), (1, 1))
+            assert await cache.load(keys[0]) is not None
+            await cache.store(keys[2], entry(1e12))
+
+            assert await cache.load(keys[1]) is None
+            assert await cache.load(keys[0]) is not None
+            assert cache.size <= cache.max_size
+
+        asyncio.run(run())
+        assert cache.stats["evictions"] == 1
+
+    def test_concurrent_stores(self, tmp_path):
+        cache = ResponseCache(tmp_path, max_size=5000, compression_level=0)
+        keys = [cache.get_key("GET", f"https://example.com/{i}") for i in range(10)]
+
+        def entry() -> CachedResponse:
+            return {"status": 200, "url": "https://example.com", "headers": {}, "encoding": "utf-8", "stored_at": 0}
+
+        async def run():
+            # The same URLs are stored by concurrent requests, while eviction removes other entries
+            await asyncio.gather(
+                *(cache.store(key, {**entry(), "body": os.urandom(1000)}) for _ in range(50) for key in keys)
+            )
+
+        asyncio.run(run())
+
+        blobs = list(cache._iter_blobs())
+        assert cache.size == sum(blob.stat().st_size for blob in blobs) <= cache.max_size
+        assert not list(tmp_path.glob("*/*.tmp"))
+        # Sent to worker processes along with other fetcher options
+        assert pickle.loads(pickle.dumps(cache)).size == cache.size
@@ -1,9 +1,13 @@
 from pathlib import Path
 from typing import List, Unpack
-from time import time
+from time import time, sleep
 import random
+import asyncio
+import threading
+import pytest
+from concurrent.futures import ThreadPoolExecutor
 
-from arc_crawler import Crawler, ResponseHandlerKwargs, SequentialFetcher
+from arc_crawler import Crawler, ResponseHandlerKwargs, SequentialFetcher, Frontier
 from arc_crawler.reader import IndexReader
 from tests.helpers import MockNetwork, NetworkRequest
 
@@ -82,6 +86,18 @@ class TestCrawler:
 
         assert utils.empty_file_path.exists()
 
+    # Options specific to some fetchers are rejected in modes that don't support them
+    def test_mode_specific_options(self, tmp_path):
+        with pytest.raises(ValueError, match="max_bytes_in_flight"):
+            Crawler(mode="sync", out_file_path=tmp_path, max_bytes_in_flight=10_000)
+        with pytest.raises(ValueError, match="max_concurrent_requests"):
+            Crawler(mode="sync", out_file_path=tmp_path, max_concurrent_requests=3)
+        with pytest.raises(ValueError, match="max_bytes_in_flight"):
+            Crawler(mode="ordered", out_file_path=tmp_path, max_bytes_in_flight=10_000)
+
+        crawler = Crawler(mode="ordered", out_file_path=tmp_path, max_concurrent_requests=3)
+        assert crawler._fetcher.max_concurrent_requests == 3
+
     # In sync mode total wait time would be near sum(requests_wait_time) + request_delay * request_count.
     def test_sync_mode_requests_in_order(self, tmp_path, monkeypatch):
         utils = TestingUtils(monkeypatch, tmp_path)
@@ -243,3 +259,297 @@ class TestCrawler:
         )
 
         assert sorted(follow_up_responses) == sorted(requests.urls)
+
+    # crawler sends conditional requests on refresh and doesn't rewrite unchanged pages
+    def test_revalidate(self, tmp_path, monkeypatch):
+        utils = TestingUtils(monkeypatch, tmp_path)
+        utils.mock_input("y")
+        last_modified = "Wed, 21 Oct 2015 07:28:00 GMT"
+        requests = MockNetwork(
+            [
+                {
+                    "url": "https://example.com/static",
+                    "response": [
+                        {"text": "static", "status": 200, "headers": {"ETag": '"v1"'}},
+                        {"text": "", "status": 304},
+                    ],
+                },
+                {
+                    "url": "https://example.com/changed",
+                    "response": [
+                        {"text": "old", "status": 200, "headers": {"Last-Modified": last_modified}},
+                        {"text": "new", "status": 200},
+                    ],
+                },
+                {
+                    "url": "https://example.com/old",
+                    "response": [
+                        {
+                            "text": "moved",
+                            "status": 200,
+                            "url": "https://example.com/moved",
+                            "headers": {"ETag": '"v2"'},
+                        },
+                        {"text": "", "status": 304, "url": "https://example.com/moved"},
+                    ],
+                },
+            ],
+            monkeypatch,
+        )
+
+        crawler = Crawler(out_file_path=tmp_path, log_level="debug")
+        reader = crawler.get(requests.urls, out_file_name=utils.filled_file_name, request_delay=0)
+        index_by_url = {index_rec["url"]: index_rec for index_rec in reader.index_data}
+        assert index_by_url["https://example.com/static"]["etag"] == '"v1"'
+
+        reader = crawler.get(requests.urls, out_file_name=utils.filled_file_name, request_delay=0, revalidate=True)
+
+        assert requests.request_kwargs["https://example.com/static"]["headers"] == {"If-None-Match": '"v1"'}
+        assert requests.request_kwargs["https://example.com/changed"]["headers"] == {"If-Modified-Since": last_modified}
+        # Validators of redirected pages are looked up by the requested URL
+        assert requests.request_kwargs["https://example.com/old"]["headers"] == {"If-None-Match": '"v2"'}
+        # Only the changed page is appended
+        assert len(reader) == 4
+        assert reader[-1]["text"] == "new"
+
+    # responses are yielded to the caller without writing the output
+    def test_astream(self, tmp_path, monkeypatch):
+        utils = TestingUtils(monkeypatch, tmp_path)
+        requests = MockNetwork(utils.requests_config, monkeypatch)
+        crawler = Crawler(out_file_path=tmp_path, log_level="debug")
+
+        async def consume():
+            return [response["text"] async for response in crawler.astream(requests.urls, request_delay=0)]
+
+        assert sorted(asyncio.run(consume()), key=int) == [str(i) for i in range(10)]
+        assert not any(Path(tmp_path).iterdir())
+
+    # generators and async iterables are consumed lazily and resumed by an explicit job id
+    def test_lazy_url_sources(self, tmp_path, monkeypatch):
+        utils = TestingUtils(monkeypatch, tmp_path)
+        utils.mock_input("y")
+        for request in utils.requests_config:
+            request["delay"] = 0
+        requests = MockNetwork(utils.requests_config, monkeypatch)
+        crawler = Crawler(out_file_path=tmp_path, log_level="debug")
+
+        with pytest.raises(ValueError):
+            crawler.get(url for url in requests.urls)
+
+        crawler.get((url for url in requests.urls[:5]), out_file_name="job", request_delay=0)
+
+        async def url_cursor():
+            for url in requests.urls:
+                await asyncio.sleep(0)
+                yield url
+
+        reader = crawler.get(url_cursor(), out_file_name="job", request_delay=0)
+
+        assert len(reader) == len(requests.urls)
+        assert all(count == 1 for count in requests.request_counts.values())
+
+    # URLs are sharded by host between worker processes and merged into a single dataset
+    def test_workers(self, tmp_path, monkeypatch):
+        utils = TestingUtils(monkeypatch, tmp_path)
+        utils.mock_input("y")
+        requests = MockNetwork(
+            [
+                {"url": f"https://host-{host}.io/{i}", "response": {"text": f"{host}-{i}", "status": 200}}
+                for host in range(4)
+                for i in range(3)
+            ],
+            monkeypatch,
+        )
+        crawler = Crawler(out_file_path=tmp_path, log_level="debug", workers=2)
+
+        reader = crawler.get(requests.urls[:6], out_file_name="job", request_delay=0)
+        assert len(reader) == 6
+
+        reader = crawler.get((url for url in requests.urls), out_file_name="job", request_delay=0)
+
+        # Already fetched URLs are skipped by workers of the resumed job
+        assert len(reader) == len(requests.urls)
+        assert len(reader.shards) == 2
+        assert sorted(record["text"] for record in reader) == sorted(
+            f"{host}-{i}" for host in range(4) for i in range(3)
+        )
+        assert reader.get(lambda rec: rec["url"] == "https://host-0.io/1")["text"] == "0-1"
+
+        shard_hosts = [{rec["url"].split("/")[2] for rec in shard.index_data} for shard in reader.shards]
+        assert not shard_hosts[0] & shard_hosts[1]
+
+    # Index of an existing shard, built before workers are started, holds the same fields as the one written by workers
+    def test_workers_index_existing_shard(self, tmp_path, monkeypatch):
+        utils = TestingUtils(monkeypatch, tmp_path)
+        utils.mock_input("y")
+        requests = MockNetwork(
+            [{"url": f"https://host-{host}.io/0", "response": {"text": str(host), "status": 200}} for host in range(4)],
+            monkeypatch,
+        )
+        (tmp_path / "job_shard_0_of_2.jsonl").write_text('{"url": "https://old.io/0", "text": "old"}\n')
+
+        crawler = Crawler(out_file_path=tmp_path, log_level="debug", workers=2)
+        reader = crawler.get(requests.urls, out_file_name="job", request_delay=0)
+
+        assert len(reader) == 5
+        assert reader.get(lambda rec: rec["url"] == "https://old.io/0")["text"] == "old"
+
+    # sync processors run in the executor, so requests keep going while responses are processed
+    def test_processor_executor(self, tmp_path, monkeypatch):
+        utils = TestingUtils(monkeypatch, tmp_path)
+        utils.mock_input("y")
+        for request in utils.requests_config:
+            request["delay"] = 0
+        requests = MockNetwork(utils.requests_config, monkeypatch)
+        processing_time = 0.1
+
+        def slow_processor(**kwargs: Unpack[ResponseHandlerKwargs]):
+            sleep(processing_time)
+            return {"text": kwargs["response"]["text"], "has_session": kwargs["session"] is not None}
+
+        crawler = Crawler(out_file_path=tmp_path, log_level="debug")
+        start_time = time()
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            reader = crawler.get(
+                requests.urls,
+                out_file_name=utils.filled_file_name,
+                response_processor=slow_processor,
+                request_delay=0,
+                processor_executor=executor,
+                max_pending_processing=5,
+            )
+        time_elapsed = time() - start_time
+
+        assert time_elapsed < len(requests.urls) * processing_time / 2
+        assert sorted((record["text"] for record in reader), key=int) == [str(i) for i in range(10)]
+        assert not any(record["has_session"] for record in reader)
+
+    # get() runs on the event loop created by the provided factory, with the configured default executor
+    @pytest.mark.parametrize("event_loop", ["uvloop", "factory"])
+    def test_event_loop(self, tmp_path, monkeypatch, event_loop):
+        if event_loop == "uvloop":
+            uvloop = pytest.importorskip("uvloop")
+            expected_loop_type = uvloop.Loop
+        else:
+            expected_loop_type = asyncio.SelectorEventLoop
+            event_loop = asyncio.SelectorEventLoop
+        utils = TestingUtils(monkeypatch, tmp_path)
+        utils.mock_input("y")
+        requests = MockNetwork(utils.mixed_requests[:2], monkeypatch)
+        loops = []
+
+        def request_processor(url: str):
+            loop = asyncio.get_running_loop()
+            loops.append((type(loop), loop.run_in_executor(None, threading.current_thread)))
+
+        crawler = Crawler(out_file_path=tmp_path, event_loop=event_loop, default_executor_workers=1)
+        crawler.get(requests.urls, request_processor=request_processor, request_delay=0)
+
+        assert {loop_type for loop_type, _ in loops} == {expected_loop_type}
+        # Both blocking calls ran in the single thread of the default executor
+        assert len({thread.result() for _, thread in loops}) == 1
+
+    # follow-up URLs pushed by the processor are crawled by priority within the same run
+    @pytest.mark.parametrize("mode", ["async", "sync", "ordered"])
+    def test_frontier(self, tmp_path, monkeypatch, mode):
+        utils = TestingUtils(monkeypatch, tmp_path)
+        utils.mock_input("y")
+        for request in utils.requests_config:
+            request["delay"] = 0
+        requests = MockNetwork(utils.requests_config, monkeypatch)
+        crawler = Crawler(out_file_path=tmp_path, mode=mode, log_level="debug")
+        frontier = Frontier(requests.urls[:1])
+
+        def push_next_items(**kw: Unpack[ResponseHandlerKwargs]):
+            item = int(kw["response"]["text"])
+            if item == 0:
+                for url in requests.urls[1:]:
+                    frontier.push(url, priority=int(url.rsplit("/", 1)[1]))
+            return kw["response"]
+
+        reader = crawler.get(frontier, out_file_name="frontier", response_processor=push_next_items, request_delay=0)
+
+        assert len(reader) == len(requests.urls)
+        assert all(count == 1 for count in requests.request_counts.values())
+        if mode != "async":
+            assert [record["text"] for record in reader] == ["0", *(str(i) for i in range(9, 0, -1))]
+
+    # links are followed within scope and depth, interrupted crawls resume from discovered URLs
+    def test_crawl(self, tmp_path, monkeypatch, caplog):
+        utils = TestingUtils(monkeypatch, tmp_path)
+        utils.mock_input("y")
+
+        def page(url: str, *links: str) -> NetworkRequest:
+            anchors = "".join(f'<a href="{link}">link</a>' for link in links)
+            return {"url": url, "response": {"status": 200, "text": f"<html><body>{anchors}</body></html>"}}
+
+        requests = MockNetwork(
+            [
+                page("https://example.com/", "/a", "b#top", "https://other.com/", "mailto:info@example.com"),
+                # Malformed links are skipped without interrupting the crawl
+                page("https://example.com/a", "/b", "/a/c?y=2&x=1", "http://a.com:abc/", "http://a.com:99999/"),
+                page("https://example.com/b", "/", "http://[bad/"),
+                page("https://example.com/a/c?x=1&y=2", "/deep"),
+                page("https://example.com/deep"),
+            ],
+            monkeypatch,
+        )
+        crawler = Crawler(out_file_path=tmp_path, mode="sync", log_level="debug")
+
+        def fail_once(**kw: Unpack[ResponseHandlerKwargs]):
+            url = kw["response"]["request_url"]
+            if url.endswith("/b") and requests.request_counts[url] == 1:
+                raise Exception("Interrupted")
+            return kw["response"]
+
+        with pytest.raises(Exception):
+            crawler.crawl(["https://EXAMPLE.com"], out_file_name="site", max_depth=2, response_processor=fail_once)
+        reader = crawler.crawl(
+            ["https://example.com"],
+            out_file_name="site",
+            max_depth=2,
+            response_processor=fail_once,
+            max_frontier_items=1,
+        )
+
+        # Already crawled URLs are marked as seen, but not queued again
+        assert "Loaded 4 URLs discovered by the previous run, 2 of them pending" in caplog.text
+
+        assert sorted(record["url"] for record in reader) == [
+            "https://example.com/",
+            "https://example.com/a",
+            "https://example.com/a/c?x=1&y=2",
+            "https://example.com/b",
+        ]
+        assert requests.request_counts == {
+            "https://example.com/": 1,
+            "https://example.com/a": 1,
+            "https://example.com/b": 2,
+            "https://example.com/a/c?x=1&y=2": 1,
+        }
+
+    # resume recognizes differently spelled URLs, rebuilds missing .done files and keeps input order
+    def test_resume_canonical_urls(self, tmp_path, monkeypatch):
+        utils = TestingUtils(monkeypatch, tmp_path)
+        utils.mock_input("y")
+        requests = MockNetwork(utils.requests_config, monkeypatch)
+        crawler = Crawler(out_file_path=tmp_path, mode="sync", log_level="debug")
+
+        crawler.get(requests.urls[:5], out_file_name="job", request_delay=0)
+        # Datasets written by older versions have no .done file
+        (tmp_path / "job.done").unlink()
+
+        requested_urls = []
+        respelled_urls = [
+            url.replace("https://example.com", "HTTPS://Example.com:443") + "#top" for url in requests.urls[:5]
+        ]
+        reader = crawler.get(
+            [*reversed(requests.urls), *respelled_urls],
+            out_file_name="job",
+            request_processor=requested_urls.append,
+            request_delay=0,
+        )
+
+        assert requested_urls == list(reversed(requests.urls[5:]))
+        assert len(reader) == len(requests.urls)
+        assert (tmp_path / "job.done").stat().st_size == len(requests.urls) * 16
@@ -0,0 +1,25 @@
+import json
+
+from examples import advanced
+from tests.helpers import MockNetwork, NetworkRequest
+
+API_URL = "https://jsonplaceholder.typicode.com"
+
+
+# Examples are run against a mocked network, so they keep working as the API evolves
+class TestExamples:
+    def test_prioritized_follow_ups(self, tmp_path, monkeypatch, capsys):
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr("builtins.input", lambda _: "y")
+        requests: list[NetworkRequest] = [
+            *({"url": f"{API_URL}/users/{i}", "response": {"status": 200, "json": {"id": i}}} for i in range(1, 11)),
+            *({"url": f"{API_URL}/posts/{i}", "response": {"status": 200, "json": {"id": i}}} for i in range(1, 101)),
+        ]
+        network = MockNetwork(requests, monkeypatch)
+
+        advanced.prioritized_follow_ups()
+
+        assert "I've gathered 110 entries" in capsys.readouterr().out
+        assert sorted(network.request_counts) == sorted(network.urls)
+        with open(tmp_path / "output" / "users-and-posts.jsonl") as file:
+            assert len([json.loads(line) for line in file]) == 110
@@ -0,0 +1,62 @@
+import asyncio
+import aiohttp
+
+from arc_crawler import ParallelFetcher, FollowUpCache, FollowUpSession
+from helpers import LocalServer
+
+
+def fetch_with_follow_ups(cache: FollowUpCache, urls_count: int = 10, delay: float = 0.1):
+    fetcher = ParallelFetcher(follow_up_cache=cache)
+    follow_ups = []
+    base_url = ""
+
+    async def on_response(**kwargs):
+        session = kwargs["session"]
+        assert isinstance(session, FollowUpSession)
+        # Both aiohttp styles: awaiting the request and using it as a context manager
+        async with session.get(f"{base_url}/user", params={"id": 1}) as response:
+            follow_ups.append(await response.text())
+        follow_ups.append((await (await session.get(f"{base_url}/user", params={"id": 1})).read()).decode())
+
+    async def run():
+        nonlocal base_url
+        async with LocalServer(delay=delay) as server:
+            base_url = server.base_url
+            await fetcher.get(urls=server.urls(urls_count), on_response=on_response)
+            return server.requests_received
+
+    return asyncio.run(run()), follow_ups
+
+
+class TestFollowUpCache:
+    def test_coalesced_and_memoized(self):
+        cache = FollowUpCache()
+        requests_received, follow_ups = fetch_with_follow_ups(cache)
+
+        assert follow_ups == ["/user"] * 20
+        # 10 pages and a single follow-up request: concurrent ones wait for it, later ones are served from memory
+        assert requests_received == 11
+        assert cache.stats == {"requests": 20, "fetched": 1, "coalesced": 9, "memo_hits": 10}
+        assert cache.hit_rate == 0.95
+
+    def test_ttl_and_eviction(self):
+        cache = FollowUpCache(ttl=0)
+        requests_received, _ = fetch_with_follow_ups(cache, urls_count=2, delay=0)
+
+        # Expired responses are fetched again
+        assert requests_received == 2 + cache.stats["fetched"]
+        assert cache.stats["memo_hits"] == 0
+
+        cache = FollowUpCache(max_entries=1)
+
+        async def run():
+            async with LocalServer() as server, aiohttp.ClientSession() as session:
+                for path in ["a", "b", "b", "a"]:
+                    await cache.fetch(session, f"{server.base_url}/{path}")
+                # Requests with arguments other than `params` and `headers` are sent as is
+                await cache.fetch(session, f"{server.base_url}/a", allow_redirects=False)
+                return server.requests_received
+
+        # "a" is evicted by "b", since only one response is kept
+        assert asyncio.run(run()) == 4
+        assert cache.stats == {"requests": 5, "fetched": 4, "coalesced": 0, "memo_hits": 1}
@@ -0,0 +1,85 @@
+import asyncio
+
+from arc_crawler import Frontier
+
+
+class TestFrontier:
+    def test_priority_order(self):
+        frontier = Frontier(["https://a.io/low", "https://a.io/default"])
+        frontier.push("https://a.io/high", priority=10)
+        frontier.push("https://a.io/low", priority=-1)
+        frontier.push("https://a.io/high", priority=1)
+
+        # Pushing a pending URL only raises its priority, URLs with equal priority keep insertion order
+        assert [frontier.pop() for _ in range(3)] == ["https://a.io/high", "https://a.io/low", "https://a.io/default"]
+        assert frontier.pop() is None
+
+        # Priorities of URLs in progress are kept until they are reported as done
+        assert frontier.get_priority("https://a.io/high") == 10
+        frontier.task_done("https://a.io/high")
+        assert frontier.get_priority("https://a.io/high") is None
+
+    def test_reprioritize_and_exclude(self):
+        frontier = Frontier([f"https://a.io/{i}" for i in range(4)])
+        assert frontier.reprioritize("https://a.io/0", -5)
+        assert not frontier.reprioritize("https://a.io/missing", 5)
+        frontier.exclude(["https://a.io/1"])
+        assert not frontier.push("https://a.io/1")
+
+        assert [frontier.pop() for _ in range(len(frontier))] == ["https://a.io/2", "https://a.io/3", "https://a.io/0"]
+
+    def test_spill_to_disk(self, tmp_path):
+        frontier = Frontier(max_memory_items=8, spill_dir=tmp_path)
+        for i in range(100):
+            frontier.push(f"https://a.io/{i}", priority=i % 10)
+        frontier.reprioritize("https://a.io/1", 100)
+
+        assert len(frontier._heap) <= 8
+        popped = [frontier.pop() for _ in range(100)]
+        assert popped[0] == "https://a.io/1"
+        assert len(set(popped)) == 100
+        priorities = [int(url.rsplit("/", 1)[1]) % 10 for url in popped[1:]]
+        assert priorities == sorted(priorities, reverse=True)
+
+        frontier.close()
+        assert not list(tmp_path.iterdir())
+
+    # Spilled entries are loaded back a heap at a time, not all at once
+    def test_spilled_entries_loaded_in_batches(self, tmp_path):
+        frontier = Frontier(max_memory_items=10, spill_dir=tmp_path)
+        urls = [f"https://a.io/{i}" for i in range(1000)]
+        frontier.push_many(urls, priority=1)
+        frontier.push("https://a.io/top", priority=2)
+
+        popped = []
+        while frontier._spilled_count:
+            spilled_count = frontier._spilled_count
+            popped.append(frontier.pop())
+            assert spilled_count - frontier._spilled_count <= 10
+            assert len(frontier._heap) <= 10
+        popped.extend(iter(frontier.pop, None))
+
+        assert popped == ["https://a.io/top", *urls]
+        assert frontier._spill_path.stat().st_size == 0
+        frontier.close()
+
+    # Iteration waits for URLs in progress, since they may lead to new ones
+    def test_async_iteration(self):
+        frontier = Frontier(["https://a.io/0"])
+
+        async def crawl():
+            crawled = []
+            async for url in frontier:
+                crawled.append(url)
+                depth = int(url.rsplit("/", 1)[1])
+
+                async def process():
+                    await asyncio.sleep(0.01)
+                    if depth < 3:
+                        frontier.push(f"https://a.io/{depth + 1}")
+                    frontier.task_done()
+
+                asyncio.create_task(process())
+            return crawled
+
+        assert asyncio.run(crawl()) == [f"https://a.io/{i}" for i in range(4)]
@@ -1,35 +1,67 @@
 import asyncio
+import json as json_module
+from types import SimpleNamespace
+
 import aiohttp
-from typing import TypedDict, Any, List
+from aiohttp import web
+from typing import TypedDict, Any, List, Dict, Callable
 from yarl import URL
 
 
 class ResponseMock:
-    def __init__(self, text: str | None, status: int, url: str, ok: bool = True, json: Any = None):
+    def __init__(
+        self,
+        text: str | None,
+        status: int,
+        url: str,
+        ok: bool = True,
+        json: Any = None,
+        headers: Dict[str, str] | None = None,
+    ):
+        body = (json_module.dumps(json) if json is not None else text or "").encode("utf-8")
+
         async def get_text():
             return text
 
         async def get_json(encoding, loads, content_type):
             return json
 
+        async def read():
+            return body
+
+        async def iter_chunked(size: int):
+            for start in range(0, len(body), size):
+                await asyncio.sleep(0)
+                yield body[start : start + size]
+
         self.text = get_text
         self.json = get_json
+        self.read = read
+        self.content = SimpleNamespace(iter_chunked=iter_chunked)
+        self.get_encoding = lambda: "utf-8"
         self.status = status
         self.url = URL(url)
         self.ok = ok
         self.close = lambda: {}
-        self.headers = {"Content-Type": "application/json" if json is not None else "text/plain"}
+        self.release = lambda: None
+        self.headers = {"Content-Type": "application/json" if json is not None else "text/plain", **(headers or {})}
 
 
 class NetworkResponse(TypedDict, total=False):
     status: int
     text: str | None
     json: Any | None
+    headers: Dict[str, str]
+    # Final URL, when the request is redirected
+    url: str
+    # Raised instead of returning a response
+    error: Exception
 
 
 class NetworkRequest(TypedDict, total=False):
     url: str
-    response: NetworkResponse
+    # When a list is provided, consecutive requests receive consecutive responses (the last one is repeated)
+    response: NetworkResponse | List[NetworkResponse]
     delay: float | int | None
 
 
@@ -43,23 +75,72 @@ class MockNetwork:
             for rec in requests
         }
         self.urls = [x["url"] for x in requests]
+        self.request_counts = {}
+        self.request_kwargs = {}
 
-        async def response_sender(_, url: str):
+        async def response_sender(_, url: str, **kwargs):
+            self.request_kwargs[url] = kwargs
             res_obj = self.__responses.get(url)
             if res_obj:
                 delay = res_obj.get("delay", 0)
                 if delay > 0:
                     await asyncio.sleep(delay)
 
+                self.request_counts[url] = self.request_counts.get(url, 0) + 1
                 response = res_obj["response"]
+                if isinstance(response, list):
+                    response = response[min(self.request_counts[url], len(response)) - 1]
+                if "error" in response:
+                    raise response["error"]
+
                 return ResponseMock(
                     text=response.get("text", None),
                     status=response.get("status", 404),
-                    url=url,
+                    url=response.get("url", url),
                     json=response.get("json", None),
                     ok=response.get("status", 404) in range(200, 300),
+                    headers=response.get("headers", None),
                 )
             else:
                 raise Exception(f'Requested url "{url}" is not present in requests parameter list')
 
         monkeypatch.setattr(aiohttp.ClientSession, "get", response_sender)
+
+
+class LocalServer:
+    """Serves `/{path}` on a random localhost port, responding with the requested path as text.
+
+    `delay` can be a function of the request number (starting from 1), to make specific requests slow.
+    """
+
+    def __init__(self, delay: float | Callable[[int], float] = 0):
+        self.delay = delay
+        self.requests_received = 0
+        self._runner: web.AppRunner | None = None
+        self.base_url = ""
+
+    async def __aenter__(self):
+        async def handle(request: web.Request):
+            self.requests_received += 1
+            delay = self.delay(self.requests_received) if callable(self.delay) else self.delay
+            if delay:
+                await asyncio.sleep(delay)
+            return web.Response(text=request.path)
+
+        app = web.Application()
+        app.router.add_route("*", "/{path:.*}", handle)
+
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+
+        port = site._server.sockets[0].getsockname()[1]
+        self.base_url = f"http://127.0.0.1:{port}"
+        return self
+
+    async def __aexit__(self, *_):
+        await self._runner.cleanup()
+
+    def urls(self, count: int) -> List[str]:
+        return [f"{self.base_url}/{i}" for i in range(count)]
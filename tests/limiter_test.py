@@ -0,0 +1,190 @@
+import asyncio
+from time import time
+from typing import List, Unpack
+
+from arc_crawler import ParallelFetcher, SequentialFetcher, RateLimiter, AdaptiveRateLimiter, ResponseHandlerKwargs
+from helpers import NetworkRequest, MockNetwork
+
+
+class Helpers:
+    def __init__(self):
+        self.hosts = ["https://first.io", "https://second.io", "https://third.io"]
+        self.requests: List[NetworkRequest] = [
+            {"url": f"{host}/{i}", "response": {"status": 200, "text": "Success"}, "delay": 0.05}
+            for i in range(3)
+            for host in self.hosts
+        ]
+        self.request_delay = 0.2
+
+        self.request_timestamps = {}
+
+        def append_request(url):
+            self.request_timestamps.setdefault(RateLimiter.get_host(url), []).append(time())
+
+        self.on_request = append_request
+        self.on_response = lambda **kwargs: None
+
+
+class TestRateLimiter:
+    def setup_method(self):
+        self.utils = Helpers()
+
+    def test_hosts_are_limited_independently(self, monkeypatch):
+        requests = MockNetwork(self.utils.requests, monkeypatch)
+        fetcher = ParallelFetcher()
+        limiter = RateLimiter(rate=1 / self.utils.request_delay)
+
+        start_time = time()
+        asyncio.run(
+            fetcher.get(
+                urls=requests.urls,
+                on_request=self.utils.on_request,
+                on_response=self.utils.on_response,
+                rate_limiter=limiter,
+            )
+        )
+        time_elapsed = time() - start_time
+
+        # Each host waits for its own budget only; a global delay would take len(urls) * request_delay
+        assert time_elapsed < (len(requests.urls) - 1) * self.utils.request_delay / 2
+        for timestamps in self.utils.request_timestamps.values():
+            assert len(timestamps) == 3
+            for i in range(len(timestamps) - 1):
+                assert timestamps[i + 1] - timestamps[i] >= self.utils.request_delay * 0.95
+
+    def test_host_concurrency_limit(self, monkeypatch):
+        requests = MockNetwork(self.utils.requests, monkeypatch)
+        fetcher = ParallelFetcher()
+        limiter = RateLimiter(max_concurrent_requests=1, host_limits={"second.io": {"max_concurrent_requests": 3}})
+
+        in_flight = {}
+        max_in_flight = {}
+
+        def on_request(url):
+            host = RateLimiter.get_host(url)
+            in_flight[host] = in_flight.get(host, 0) + 1
+            max_in_flight[host] = max(max_in_flight.get(host, 0), in_flight[host])
+
+        def on_response(**kwargs: Unpack[ResponseHandlerKwargs]):
+            in_flight[RateLimiter.get_host(kwargs["response"]["url"])] -= 1
+
+        asyncio.run(
+            fetcher.get(urls=requests.urls, on_request=on_request, on_response=on_response, rate_limiter=limiter)
+        )
+
+        assert max_in_flight == {"first.io": 1, "second.io": 3, "third.io": 1}
+
+    def test_sequential_skips_delay_between_hosts(self, monkeypatch):
+        requests = MockNetwork(self.utils.requests, monkeypatch)
+        fetcher = SequentialFetcher()
+        limiter = RateLimiter(rate=1 / self.utils.request_delay)
+
+        start_time = time()
+        asyncio.run(
+            fetcher.get(
+                urls=requests.urls,
+                on_request=self.utils.on_request,
+                on_response=self.utils.on_response,
+                min_request_delay=self.utils.request_delay,
+                rate_limiter=limiter,
+            )
+        )
+        time_elapsed = time() - start_time
+
+        assert time_elapsed < (len(requests.urls) - 1) * self.utils.request_delay
+
+
+class TestAdaptiveRateLimiter:
+    def test_retries_throttled_requests(self, monkeypatch):
+        retry_after = 0.3
+        requests = MockNetwork(
+            [
+                {
+                    "url": "https://throttled.io",
+                    "response": [
+                        {"status": 429, "text": "Too many requests", "headers": {"Retry-After": str(retry_after)}},
+                        {"status": 200, "text": "Success"},
+                    ],
+                }
+            ],
+            monkeypatch,
+        )
+        fetcher = ParallelFetcher()
+        responses = []
+
+        start_time = time()
+        asyncio.run(
+            fetcher.get(
+                urls=requests.urls,
+                on_response=lambda **kwargs: responses.append(kwargs["response"]["status"]),
+                rate_limiter=AdaptiveRateLimiter(rate=100),
+            )
+        )
+
+        # 429 doesn't terminate the run: request is sent again after Retry-After delay instead
+        assert responses == [200]
+        assert time() - start_time >= retry_after
+        assert requests.request_counts["https://throttled.io"] == 2
+
+    def test_adjusts_limits(self):
+        url = "https://example.com"
+        limiter = AdaptiveRateLimiter(rate=8, max_concurrent_requests=8, max_rate=10)
+
+        async def run_feedback():
+            bucket = limiter._get_bucket(url)
+
+            limiter.feedback(url, status=429, latency=0.1)
+            assert bucket.rate == 4
+            assert bucket.max_concurrent_requests == 4
+
+            for _ in range(100):
+                limiter.feedback(url, status=200, latency=0.1)
+            assert bucket.rate == 10
+            assert bucket.max_concurrent_requests > 4
+
+            # Latency rise is treated as overload as well
+            slow_url = "https://slow.io"
+            slow_bucket = limiter._get_bucket(slow_url)
+            limiter.feedback(slow_url, status=200, latency=0.1)
+            initial_rate = slow_bucket.rate
+            for _ in range(5):
+                limiter.feedback(slow_url, status=200, latency=1)
+            assert slow_bucket.rate < initial_rate
+
+        asyncio.run(run_feedback())
+
+    def test_raised_concurrency_wakes_waiters(self):
+        url = "https://example.com"
+        limiter = AdaptiveRateLimiter(rate=1000, max_concurrent_requests=1, latency_factor=None)
+        release_first = asyncio.Event()
+        acquired = []
+
+        async def request(name: str, event: asyncio.Event | None = None):
+            async with limiter.acquire(url):
+                acquired.append(name)
+                if event is not None:
+                    await event.wait()
+
+        async def run():
+            first = asyncio.create_task(request("first", release_first))
+            second = asyncio.create_task(request("second"))
+            await asyncio.sleep(0.01)
+            assert acquired == ["first"]
+
+            # Concurrency grows from 1 to 2 while the first request is still in flight
+            limiter.feedback(url, status=200, latency=0.01)
+            await asyncio.sleep(0.01)
+            assert acquired == ["first", "second"]
+
+            release_first.set()
+            await asyncio.gather(first, second)
+            return dict(limiter._host_stats)
+
+        assert asyncio.run(run())["example.com"]["concurrency"] == 2
+
+        async def next_run():
+            # AIMD state of the previous event loop is dropped along with its buckets
+            bucket = limiter._get_bucket(url)
+            return bucket.max_concurrent_requests, dict(limiter._host_stats)
+
+        assert asyncio.run(next_run()) == (1, {})
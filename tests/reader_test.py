@@ -1,8 +1,21 @@
 import pytest
 from pathlib import Path
+from array import array
 
-from arc_crawler.reader import IndexReader
-from arc_crawler.utils import write_line
+from arc_crawler.reader import IndexReader, DoneSet
+from arc_crawler.utils import write_line, set_codec, current_codec, get_codec
+from arc_crawler.utils.codec import CODECS
+
+
+def available_codecs():
+    codecs = []
+    for name in CODECS:
+        try:
+            get_codec(name)
+            codecs.append(name)
+        except ImportError:
+            pass
+    return codecs
 
 
 class Consts:
@@ -120,3 +133,67 @@ class TestIndexReaderFeatures:
     def test_can_slice(self, monkeypatch, tmp_path):
         reader, dummy_records = Consts.init_reader(monkeypatch, tmp_path)
         assert reader[0 : len(dummy_records) : 2] == dummy_records[0 : len(dummy_records) : 2]
+
+
+class TestJsonCodec:
+    @pytest.mark.parametrize("codec_name", available_codecs())
+    def test_reindexes_records_written_by_another_codec(self, monkeypatch, tmp_path, codec_name):
+        records = [{"id": 1, "value": "ünïcödé 字"}, {"id": 2, "value": {"nested": [1, 2.5, None]}}, {"id": 3}]
+        default_codec = current_codec()
+        try:
+            set_codec(codec_name)
+            consts = Consts(tmp_path)
+            monkeypatch.setattr("builtins.input", lambda _: "y")
+            reader = IndexReader(consts.source_path)
+            for record in records:
+                reader.write(record)
+            assert list(reader) == records
+
+            # Offsets are rebuilt from raw lines, regardless of how records were serialized
+            set_codec("json")
+            consts.index_path.unlink()
+            assert list(IndexReader(consts.source_path)) == records
+            assert IndexReader(consts.source_path, source_record_loader=lambda line: line)[1].strip().endswith("}")
+        finally:
+            set_codec(default_codec)
+
+
+class TestDoneSet:
+    def test_persistence(self, tmp_path):
+        path = tmp_path / "job.done"
+        done = DoneSet(path)
+        done.add("https://example.com/a", "https://example.com/b/")
+        done.add("https://example.com/%7Ec")
+
+        assert "HTTPS://example.com:443/a#top" in done
+        assert "https://example.com/b/" in done
+        assert "https://example.com/b" not in done
+
+        # An entry cut by an interrupted run is ignored
+        with open(path, "ab") as file:
+            file.write(b"\x00" * 5)
+        done = DoneSet(path)
+        assert len(done) == 2
+        assert "https://example.com/~c" in done
+
+        done = DoneSet.rebuild(path, [("https://example.com/d", "https://example.com/d")])
+        assert len(done) == 1
+        assert "https://example.com/a" not in done
+
+    def test_keys_sorted_and_merged_in_chunks(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(DoneSet, "sort_chunk_size", 3)
+        keys = array("Q", [5, 1, 5, 9, 3, 1, 7])
+        assert DoneSet.sort_keys(keys) == array("Q", [1, 3, 5, 7, 9])
+
+        path = tmp_path / "job.done"
+        urls = [f"https://example.com/{i}" for i in range(20)]
+        done = DoneSet(path)
+        for url in urls:
+            done.add(url)
+            # Added keys are merged into the sorted array instead of growing without limit
+            assert len(done._added) < 3
+
+        assert all(url in done for url in urls)
+        assert sorted({*done._keys, *done._added}) == sorted(DoneSet.get_key(url) for url in urls)
+        assert list(done._keys) == sorted(set(done._keys))
+        assert "https://example.com/20" not in done
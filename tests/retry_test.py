@@ -0,0 +1,79 @@
+import pytest
+import asyncio
+from typing import List
+
+import aiohttp
+
+from arc_crawler import ParallelFetcher, SequentialFetcher, RetryPolicy
+from helpers import NetworkRequest, MockNetwork
+
+
+class Helpers:
+    def __init__(self):
+        self.flaky_requests: List[NetworkRequest] = [
+            {
+                "url": "https://flaky.io",
+                "response": [
+                    {"error": aiohttp.ClientConnectionError("Connection reset by peer")},
+                    {"status": 503, "text": "Service unavailable"},
+                    {"status": 200, "text": "Success"},
+                ],
+            },
+            {"url": "https://stable.io", "response": {"status": 200, "text": "Success"}, "delay": 0.05},
+        ]
+        self.retry_policy = RetryPolicy(max_attempts=3, backoff_factor=0.1, jitter=False)
+
+        self.responses = []
+
+        def append_response(**kwargs):
+            response = kwargs["response"]
+            self.responses.append((str(response["url"]), response["status"]))
+
+        self.on_response = append_response
+
+
+class TestRetryPolicy:
+    def setup_method(self):
+        self.utils = Helpers()
+
+    @pytest.mark.parametrize("fetcher_class", [ParallelFetcher, SequentialFetcher])
+    def test_retries_failed_requests(self, monkeypatch, fetcher_class):
+        requests = MockNetwork(self.utils.flaky_requests, monkeypatch)
+        fetcher = fetcher_class(retry_policy=self.utils.retry_policy)
+
+        asyncio.run(fetcher.get(urls=requests.urls, on_response=self.utils.on_response))
+
+        assert sorted(self.utils.responses) == [("https://flaky.io", 200), ("https://stable.io", 200)]
+        assert requests.request_counts["https://flaky.io"] == 3
+
+    def test_retry_does_not_occupy_slot(self, monkeypatch):
+        requests = MockNetwork(self.utils.flaky_requests, monkeypatch)
+        fetcher = ParallelFetcher(max_concurrent_requests=1, retry_policy=self.utils.retry_policy)
+
+        asyncio.run(fetcher.get(urls=requests.urls, on_response=self.utils.on_response))
+
+        # Retried URL is re-queued, so the next URL is fetched while the retry waits for its backoff
+        assert [url for url, _ in self.utils.responses] == ["https://stable.io", "https://flaky.io"]
+
+    def test_raises_when_attempts_exhausted(self, monkeypatch):
+        requests = MockNetwork(self.utils.flaky_requests, monkeypatch)
+        fetcher = ParallelFetcher(retry_policy=RetryPolicy(max_attempts=1))
+
+        with pytest.raises(aiohttp.ClientConnectionError):
+            asyncio.run(fetcher.get(urls=requests.urls, on_response=self.utils.on_response))
+
+    def test_host_budget(self, monkeypatch):
+        requests = MockNetwork(
+            [{"url": f"https://broken.io/{i}", "response": {"status": 502, "text": ""}} for i in range(3)],
+            monkeypatch,
+        )
+        fetcher = ParallelFetcher(
+            retry_policy=RetryPolicy(max_attempts=5, backoff_factor=0.01, host_budget=2),
+            termination_criteria=[429],
+        )
+
+        asyncio.run(fetcher.get(urls=requests.urls, on_response=self.utils.on_response))
+
+        # Failed responses are passed through once the host runs out of retries
+        assert len(self.utils.responses) == 3
+        assert sum(requests.request_counts.values()) == 3 + 2
@@ -0,0 +1,84 @@
+import pytest
+import asyncio
+
+from arc_crawler import ParallelFetcher, SequentialFetcher, ProxyPool, Transport, AiohttpTransport
+from helpers import LocalServer
+
+
+class CountingTransport(Transport):
+    def __init__(self):
+        self.default = AiohttpTransport()
+        self.requests = 0
+        self.closed = 0
+
+    async def get(self, session, url, options):
+        self.requests += 1
+        return await self.default.get(session, url, options)
+
+    async def aclose(self):
+        self.closed += 1
+
+
+def test_custom_transport():
+    transport = CountingTransport()
+    fetcher = ParallelFetcher(transport=transport, max_body_size=1024, chunk_size=2)
+    responses = []
+
+    async def run():
+        async with LocalServer() as server:
+            await fetcher.get(
+                urls=server.urls(5), on_response=lambda **kwargs: responses.append(kwargs["response"]["text"])
+            )
+
+    asyncio.run(run())
+
+    assert sorted(responses) == [f"/{i}" for i in range(5)]
+    assert transport.requests == 5
+    assert transport.closed == 1
+
+
+class TestHttpxTransport:
+    @pytest.fixture(autouse=True)
+    def httpx_transport(self):
+        pytest.importorskip("httpx")
+        pytest.importorskip("h2")
+        from arc_crawler import HttpxTransport
+
+        return HttpxTransport
+
+    def test_responses(self, httpx_transport):
+        transport = httpx_transport()
+        responses = []
+
+        async def run():
+            async with LocalServer() as server:
+                # Bodies are read at once, or in chunks when `max_body_size` is set ("/10" and "/11" exceed it)
+                for fetcher in (
+                    ParallelFetcher(transport=transport),
+                    ParallelFetcher(transport=transport, chunk_size=1, max_body_size=2),
+                ):
+                    await fetcher.get(
+                        urls=server.urls(12),
+                        on_response=lambda **kwargs: responses.append(kwargs["response"]["text"]),
+                    )
+
+        asyncio.run(run())
+
+        assert sorted(responses) == sorted([f"/{i}" for i in range(12)] + [f"/{i}" for i in range(10)])
+        # Client is closed at the end of each run
+        assert transport._client is None
+
+    def test_errors_translated(self, httpx_transport):
+        async def run():
+            async with LocalServer(delay=2) as server:
+                with pytest.raises(asyncio.TimeoutError):
+                    await SequentialFetcher(transport=httpx_transport(), request_timeout=0.1).get(
+                        urls=server.urls(1), on_response=lambda **kwargs: None
+                    )
+
+            with pytest.raises(ValueError):
+                await SequentialFetcher(transport=httpx_transport(), proxy_pool=ProxyPool([server.base_url])).get(
+                    urls=server.urls(1), on_response=lambda **kwargs: None
+                )
+
+        asyncio.run(run())
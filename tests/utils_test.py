@@ -0,0 +1,35 @@
+import pytest
+
+from arc_crawler.utils import BloomFilter, canonicalize_url
+
+
+class TestCanonicalizeUrl:
+    @pytest.mark.parametrize(
+        "url, expected",
+        [
+            ("HTTP://Example.COM", "http://example.com/"),
+            ("https://example.com:443/a/./b/../c#top", "https://example.com/a/c"),
+            ("http://example.com:8080/?b=2&a=1&", "http://example.com:8080/?a=1&b=2"),
+            ("https://example.com/%7euser/a%2fb%c3%a9 c", "https://example.com/~user/a%2Fb%C3%A9%20c"),
+            ("https://example.com/páge", "https://example.com/p%C3%A1ge"),
+        ],
+    )
+    def test_equivalent_urls(self, url, expected):
+        assert canonicalize_url(url) == expected
+        assert canonicalize_url(expected) == expected
+
+
+class TestBloomFilter:
+    def test_membership(self):
+        seen = BloomFilter(capacity=10_000, error_rate=0.01)
+        urls = [f"https://example.com/{i}" for i in range(10_000)]
+
+        assert all(seen.add(url) for url in urls[:100])
+        assert not seen.add(urls[0])
+        for url in urls[100:]:
+            seen.add(url)
+
+        assert all(url in seen for url in urls)
+        false_positives = sum(f"https://example.org/{i}" in seen for i in range(10_000))
+        assert false_positives < 10_000 * 0.02
+        assert seen.size < 10_000 * 2